@@ -63,6 +63,16 @@ class Settings(BaseSettings):
         default=100,
         description="Max Kontext generations per hour"
     )
+
+    REPLICATE_MAX_INFLIGHT: int = Field(
+        default=16,
+        description="Max concurrent in-flight Replicate image requests"
+    )
+
+    REPLICATE_VIDEO_MAX_INFLIGHT: int = Field(
+        default=16,
+        description="Max concurrent in-flight Replicate video requests"
+    )
     
     # Timeouts
     KONTEXT_TIMEOUT_SECONDS: int = Field(
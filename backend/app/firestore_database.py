@@ -4,12 +4,17 @@ This module provides a persistent database layer using Google Cloud Firestore
 with an in-memory cache for performance. Firestore is REQUIRED - the app will
 fail fast on startup if not properly configured.
 """
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from cachetools import TTLCache
 from app.models.storyboard_models import Storyboard, StoryboardScene
-from datetime import datetime
+from app.models.video_models import JobStatus, VideoClip, VideoJobStatus
+from datetime import datetime, timedelta, timezone
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials, firestore, firestore_async
+from google.api_core.exceptions import NotFound
+from google.cloud.firestore_v1.field_path import FieldPath
 from pathlib import Path
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +29,35 @@ class FirestoreDatabase:
     - Cache: In-memory dict for fast lookups
     - Persistence: Firestore for durability across restarts
     """
-    
+
+    # Firestore allows at most 500 writes per WriteBatch
+    BATCH_WRITE_LIMIT = 500
+
+    # A "generating" claim on a scene that hasn't been written for this long
+    # is presumed abandoned (the worker died or was redeployed mid-run) and
+    # can be claimed again. Well past the slowest blocking Replicate run, so
+    # a live generation is never taken over.
+    GENERATION_CLAIM_STALE_SECONDS = 15 * 60
+
+    # How long a scene lookup that found nothing is remembered. Short enough
+    # to be imperceptible, long enough to absorb a burst of 404 polls.
+    MISSING_SCENE_TTL_SECONDS = 0.5
+
+    # Fields that are never queried or sorted on. Their single-field indexes
+    # are exempted in firestore.indexes.json (keep the two in sync) so long
+    # text, URLs and nested maps don't add index fan-out to every write.
+    UNINDEXED_FIELDS = {
+        'scenes': ('text', 'style_prompt', 'image_url', 'seed_image_urls', 'video_url', 'error_message'),
+        'storyboards': ('creative_brief', 'selected_mood', 'scene_order'),
+        'video_jobs': ('clips_map', 'error', 'final_video_url'),
+    }
+
+    # Video job fields rewritten on every partial job update
+    VIDEO_JOB_SUMMARY_FIELDS = (
+        'status', 'completed_scenes', 'failed_scenes', 'progress_percent',
+        'final_video_url', 'error', 'updated_at',
+    )
+
     def __init__(self):
         """Initialize Firestore and in-memory cache.
         
@@ -35,7 +68,15 @@ class FirestoreDatabase:
         # In-memory cache for fast reads
         self._cache_storyboards: Dict[str, Storyboard] = {}
         self._cache_scenes: Dict[str, StoryboardScene] = {}
+        # Firestore update_time of the document each cached scene was parsed from
+        self._scene_update_times: Dict[str, Any] = {}
         self._cache_assets: Dict[str, Dict] = {}  # asset_id -> asset_metadata
+        self._missing_scenes: TTLCache = TTLCache(
+            maxsize=50_000, ttl=self.MISSING_SCENE_TTL_SECONDS
+        )
+        # Cache misses already being read from Firestore, so concurrent
+        # callers share one document fetch instead of each issuing their own
+        self._inflight_scene_reads: Dict[str, asyncio.Future] = {}
 
         # Initialize Firestore (REQUIRED - will raise if fails)
         self._init_firestore()
@@ -64,6 +105,15 @@ class FirestoreDatabase:
                 logger.info("Firebase Admin SDK initialized")
             
             self._db = firestore.client()
+            # Async client for request handlers, so Firestore RTTs don't block the event loop
+            self._async_db = firestore_async.client()
+            # Collection references are built once rather than re-validating
+            # the collection path on every read and write
+            self._storyboards = self._db.collection('storyboards')
+            self._scenes = self._db.collection('scenes')
+            self._async_storyboards = self._async_db.collection('storyboards')
+            self._async_scenes = self._async_db.collection('scenes')
+            self._async_video_jobs = self._async_db.collection('video_jobs')
             logger.info("✓ Firestore database initialized successfully")
             
         except Exception as e:
@@ -73,34 +123,29 @@ class FirestoreDatabase:
         """Convert Storyboard to Firestore-compatible dict.
         
         Firestore requirements:
-        - datetime objects must be converted to ISO strings or Firestore Timestamp
+        - datetime objects are stored natively as Firestore Timestamps, so
+          reads hand Pydantic a datetime instead of a string to re-parse
         - None values are acceptable (stored as null)
         """
-        data = storyboard.model_dump()
-        
-        # Convert datetime to ISO string
-        if isinstance(data.get('created_at'), datetime):
-            data['created_at'] = data['created_at'].isoformat()
-        if isinstance(data.get('updated_at'), datetime):
-            data['updated_at'] = data['updated_at'].isoformat()
-        
-        return data
+        return storyboard.model_dump()
     
     def _scene_to_dict(self, scene: StoryboardScene) -> dict:
         """Convert Scene to Firestore-compatible dict.
         
         Firestore requirements:
-        - datetime objects must be converted to ISO strings
+        - datetime objects are stored natively as Firestore Timestamps
         - None values are acceptable (stored as null)
         """
-        data = scene.model_dump()
-        
-        # Convert datetime to ISO string
-        if isinstance(data.get('created_at'), datetime):
-            data['created_at'] = data['created_at'].isoformat()
-        if isinstance(data.get('updated_at'), datetime):
-            data['updated_at'] = data['updated_at'].isoformat()
-        
+        return scene.model_dump()
+    
+    def _storyboard_fields_dict(self, storyboard: Storyboard, fields: Iterable[str]) -> dict:
+        """Build a partial storyboard update from the given fields plus updated_at.
+
+        Built straight from the attributes: the fields written here are
+        plain lists, numbers and datetimes, so a model dump is pure overhead.
+        """
+        data = {field: getattr(storyboard, field) for field in fields}
+        data['updated_at'] = storyboard.updated_at
         return data
     
     # ============================================================================
@@ -113,7 +158,7 @@ class FirestoreDatabase:
         Write-through cache: Firestore first, then cache.
         """
         # Write to Firestore (persistence)
-        doc_ref = self._db.collection('storyboards').document(storyboard.storyboard_id)
+        doc_ref = self._storyboards.document(storyboard.storyboard_id)
         doc_ref.set(self._storyboard_to_dict(storyboard))
         logger.debug(f"Saved storyboard to Firestore: {storyboard.storyboard_id}")
         
@@ -131,7 +176,7 @@ class FirestoreDatabase:
             return self._cache_storyboards[storyboard_id]
         
         # Load from Firestore (persistent)
-        doc = self._db.collection('storyboards').document(storyboard_id).get()
+        doc = self._storyboards.document(storyboard_id).get()
         if doc.exists:
             data = doc.to_dict()
             storyboard = Storyboard(**data)
@@ -142,22 +187,50 @@ class FirestoreDatabase:
         
         return None
     
-    def update_storyboard(self, storyboard_id: str, storyboard: Storyboard) -> Optional[Storyboard]:
+    async def get_storyboard_async(self, storyboard_id: str) -> Optional[Storyboard]:
+        """Async twin of get_storyboard using the async Firestore client."""
+        # Check cache first (fast)
+        if storyboard_id in self._cache_storyboards:
+            return self._cache_storyboards[storyboard_id]
+        
+        # Load from Firestore (persistent)
+        doc = await self._async_storyboards.document(storyboard_id).get()
+        if doc.exists:
+            storyboard = Storyboard(**doc.to_dict())
+            # Cache for next time
+            self._cache_storyboards[storyboard_id] = storyboard
+            logger.debug(f"Loaded storyboard from Firestore: {storyboard_id}")
+            return storyboard
+        
+        return None
+    
+    def update_storyboard(
+        self,
+        storyboard_id: str,
+        storyboard: Storyboard,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[Storyboard]:
         """Update storyboard in Firestore and cache.
         
-        Returns None if storyboard doesn't exist.
-        """
-        # Check if storyboard exists (cache or Firestore)
-        if storyboard_id not in self._cache_storyboards:
-            existing = self.get_storyboard(storyboard_id)
-            if not existing:
-                return None
+        If ``fields`` is given, only those fields (plus ``updated_at``) are
+        sent, instead of re-serializing the brief and mood on every edit.
         
+        Returns None if storyboard doesn't exist. Existence is enforced by the
+        update itself (it fails on a missing document), not a prior read.
+        """
         storyboard.updated_at = datetime.utcnow()
         
         # Update Firestore
-        doc_ref = self._db.collection('storyboards').document(storyboard_id)
-        doc_ref.set(self._storyboard_to_dict(storyboard), merge=True)
+        doc_ref = self._storyboards.document(storyboard_id)
+        if fields is None:
+            data = self._storyboard_to_dict(storyboard)
+        else:
+            data = self._storyboard_fields_dict(storyboard, fields)
+        try:
+            doc_ref.update(data)
+        except NotFound:
+            self._cache_storyboards.pop(storyboard_id, None)
+            return None
         
         # Update cache
         self._cache_storyboards[storyboard_id] = storyboard
@@ -172,13 +245,12 @@ class FirestoreDatabase:
         if storyboard_id not in self._cache_storyboards and not self.get_storyboard(storyboard_id):
             return False
         
-        # Delete all scenes first
+        # Delete all scenes first (single batch)
         scenes = self.get_scenes_by_storyboard(storyboard_id)
-        for scene in scenes:
-            self.delete_scene(scene.id)
+        self.delete_scenes_bulk([scene.id for scene in scenes])
         
         # Delete storyboard from Firestore
-        self._db.collection('storyboards').document(storyboard_id).delete()
+        self._storyboards.document(storyboard_id).delete()
         
         # Delete from cache
         if storyboard_id in self._cache_storyboards:
@@ -193,11 +265,12 @@ class FirestoreDatabase:
     def create_scene(self, scene: StoryboardScene) -> StoryboardScene:
         """Create scene in Firestore and cache."""
         # Write to Firestore
-        doc_ref = self._db.collection('scenes').document(scene.id)
+        doc_ref = self._scenes.document(scene.id)
         doc_ref.set(self._scene_to_dict(scene))
         
         # Write to cache
         self._cache_scenes[scene.id] = scene
+        self._missing_scenes.pop(scene.id, None)
         return scene
     
     def get_scene(self, scene_id: str) -> Optional[StoryboardScene]:
@@ -210,7 +283,7 @@ class FirestoreDatabase:
             return self._cache_scenes[scene_id]
         
         # Load from Firestore
-        doc = self._db.collection('scenes').document(scene_id).get()
+        doc = self._scenes.document(scene_id).get()
         if doc.exists:
             data = doc.to_dict()
             scene = StoryboardScene(**data)
@@ -220,6 +293,54 @@ class FirestoreDatabase:
         
         return None
     
+    async def get_scene_async(self, scene_id: str) -> Optional[StoryboardScene]:
+        """Async twin of get_scene using the async Firestore client.
+
+        Concurrent misses for the same scene share one Firestore read, and a
+        scene that does not exist is remembered for MISSING_SCENE_TTL_SECONDS.
+        """
+        # Check cache first
+        if scene_id in self._cache_scenes:
+            return self._cache_scenes[scene_id]
+        if scene_id in self._missing_scenes:
+            return None
+
+        inflight = self._inflight_scene_reads.get(scene_id)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Re-raise only if this task was cancelled. If the task doing
+                # the shared read was cancelled instead, read for ourselves.
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self.get_scene_async(scene_id)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_scene_reads[scene_id] = future
+        try:
+            # Load from Firestore
+            doc = await self._async_scenes.document(scene_id).get()
+            scene = StoryboardScene(**doc.to_dict()) if doc.exists else None
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a miss with no waiters doesn't warn
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._inflight_scene_reads.pop(scene_id, None)
+
+        if scene is not None:
+            # Cache for next time (unless a write landed while we were reading)
+            scene = self._cache_scenes.setdefault(scene_id, scene)
+        else:
+            self._missing_scenes[scene_id] = True
+        future.set_result(scene)
+        return scene
+    
     def get_scenes_by_storyboard(self, storyboard_id: str) -> List[StoryboardScene]:
         """Get all scenes for a storyboard.
         
@@ -227,22 +348,52 @@ class FirestoreDatabase:
         """
         # Always load from Firestore to ensure we have all scenes
         # (scenes might have been added in another process/server)
-        query = self._db.collection('scenes').where('storyboard_id', '==', storyboard_id)
+        query = self._scenes.where('storyboard_id', '==', storyboard_id)
         docs = query.stream()
         
         scenes = []
         for doc in docs:
-            # Check cache first to avoid re-parsing
-            if doc.id in self._cache_scenes:
-                scenes.append(self._cache_scenes[doc.id])
+            # Reuse the cached scene only while the document is unchanged since
+            # it was parsed; update_time acts as its ETag. Any write since then
+            # (from this or another process) moves update_time and re-parses.
+            cached = self._cache_scenes.get(doc.id)
+            if cached is not None and self._scene_update_times.get(doc.id) == doc.update_time:
+                scenes.append(cached)
             else:
-                data = doc.to_dict()
-                scene = StoryboardScene(**data)
+                scene = StoryboardScene(**doc.to_dict())
                 self._cache_scenes[scene.id] = scene
+                self._scene_update_times[scene.id] = doc.update_time
                 scenes.append(scene)
         
         return scenes
     
+    def watch_scenes_by_storyboard(
+        self,
+        storyboard_id: str,
+        callback: Callable[[List[StoryboardScene], List[str]], None]
+    ):
+        """Listen for scene changes in a storyboard via a Firestore snapshot listener.
+        
+        The callback runs on Firestore's listener thread with the scenes added or
+        modified since the previous snapshot (the first snapshot contains every
+        scene) and the IDs of scenes removed since then. Returns the Watch
+        handle; call ``unsubscribe()`` to stop listening.
+        """
+        query = self._scenes.where('storyboard_id', '==', storyboard_id)
+        
+        def _on_snapshot(docs, changes, read_time):
+            scenes = []
+            removed_ids = []
+            for change in changes:
+                if change.type.name == 'REMOVED':
+                    removed_ids.append(change.document.id)
+                else:
+                    scenes.append(StoryboardScene(**change.document.to_dict()))
+            if scenes or removed_ids:
+                callback(scenes, removed_ids)
+        
+        return query.on_snapshot(_on_snapshot)
+    
     def get_scene_by_image_prediction_id(self, prediction_id: str) -> Optional[StoryboardScene]:
         """Get scene by Replicate image prediction ID.
         
@@ -254,7 +405,7 @@ class FirestoreDatabase:
                 return scene
         
         # Query Firestore if not in cache
-        query = self._db.collection('scenes').where('replicate_image_prediction_id', '==', prediction_id).limit(1)
+        query = self._scenes.where('replicate_image_prediction_id', '==', prediction_id).limit(1)
         docs = list(query.stream())
         
         if docs:
@@ -277,7 +428,7 @@ class FirestoreDatabase:
                 return scene
         
         # Query Firestore if not in cache
-        query = self._db.collection('scenes').where('replicate_video_prediction_id', '==', prediction_id).limit(1)
+        query = self._scenes.where('replicate_video_prediction_id', '==', prediction_id).limit(1)
         docs = list(query.stream())
         
         if docs:
@@ -292,39 +443,294 @@ class FirestoreDatabase:
     def update_scene(self, scene_id: str, scene: StoryboardScene) -> Optional[StoryboardScene]:
         """Update scene in Firestore and cache.
         
-        Returns None if scene doesn't exist.
+        Returns None if scene doesn't exist. Existence is enforced by the
+        update itself (it fails on a missing document), not a prior read.
         """
-        # Check if scene exists (cache or Firestore)
-        if scene_id not in self._cache_scenes:
-            existing = self.get_scene(scene_id)
-            if not existing:
-                return None
-        
         scene.updated_at = datetime.utcnow()
         
         # Update Firestore
-        doc_ref = self._db.collection('scenes').document(scene_id)
-        doc_ref.set(self._scene_to_dict(scene), merge=True)
+        doc_ref = self._scenes.document(scene_id)
+        try:
+            doc_ref.update(self._scene_to_dict(scene))
+        except NotFound:
+            self._cache_scenes.pop(scene_id, None)
+            return None
         
         # Update cache
         self._cache_scenes[scene_id] = scene
         return scene
-    
-    def delete_scene(self, scene_id: str) -> bool:
-        """Delete scene from Firestore and cache."""
-        # Check if exists
-        if scene_id not in self._cache_scenes and not self.get_scene(scene_id):
-            return False
+
+    async def update_scene_async(self, scene_id: str, scene: StoryboardScene) -> Optional[StoryboardScene]:
+        """Async twin of update_scene using the async Firestore client."""
+        scene.updated_at = datetime.utcnow()
         
-        # Delete from Firestore
-        self._db.collection('scenes').document(scene_id).delete()
+        # Update Firestore
+        doc_ref = self._async_scenes.document(scene_id)
+        try:
+            await doc_ref.update(self._scene_to_dict(scene))
+        except NotFound:
+            self._cache_scenes.pop(scene_id, None)
+            return None
         
+        # Update cache
+        self._cache_scenes[scene_id] = scene
+        return scene
+
+    async def try_start_generation_async(self, scene_id: str, field: str) -> bool:
+        """Atomically mark a scene's image/video generation as started.
+
+        Runs in a Firestore transaction that only transitions
+        pending|complete|error -> generating, so duplicate clicks or retried
+        background tasks cannot start two Replicate predictions for one scene.
+        A stale "generating" claim (see GENERATION_CLAIM_STALE_SECONDS) is
+        taken over, so a scene whose worker died mid-run is not stuck.
+        Uses the async client, so the check-and-set holds no worker thread
+        while it waits on Firestore and is retried on contention.
+
+        Args:
+            scene_id: Scene to update
+            field: Generation status field ("image" or "video")
+
+        Returns:
+            True if this caller started generation, False if the scene is
+            missing or a generation is already in progress.
+        """
+        doc_ref = self._async_scenes.document(scene_id)
+        now = datetime.utcnow()
+
+        @firestore.async_transactional
+        async def _start(transaction) -> bool:
+            snapshot = await doc_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                return False
+
+            data = snapshot.to_dict()
+            status = data.get('generation_status') or {}
+            if status.get(field) == "generating" and not self._claim_is_stale(data, now):
+                return False
+
+            transaction.update(doc_ref, {
+                f'generation_status.{field}': "generating",
+                'updated_at': now,
+            })
+            return True
+
+        started = await _start(self._async_db.transaction())
+
+        # Keep cache consistent with the committed transition
+        if started and scene_id in self._cache_scenes:
+            scene = self._cache_scenes[scene_id]
+            setattr(scene.generation_status, field, "generating")
+            scene.updated_at = now
+
+        return started
+
+    def _claim_is_stale(self, data: dict, now: datetime) -> bool:
+        """Whether a stored scene's "generating" claim is old enough to be presumed abandoned."""
+        updated_at = data.get('updated_at')
+        if updated_at is None:
+            return True
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at)
+        if updated_at.tzinfo is not None:
+            # Firestore returns Timestamps as aware UTC datetimes
+            updated_at = updated_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return now - updated_at > timedelta(seconds=self.GENERATION_CLAIM_STALE_SECONDS)
+
+    async def reset_and_claim_generation_async(
+        self, scene_id: str, field: str, reset: Dict[str, Any]
+    ) -> Optional[StoryboardScene]:
+        """Atomically reset a scene for regeneration and mark it generating.
+
+        The check and the reset run in one Firestore transaction. The claim
+        succeeds if the scene is not generating, or if it is generating with
+        a stored prediction (which the regeneration supersedes). A scene that
+        is generating without a prediction ID has a claim in progress, so a
+        second regenerate is rejected instead of starting another prediction,
+        unless that claim is stale (see GENERATION_CLAIM_STALE_SECONDS).
+
+        Args:
+            scene_id: Scene to reset
+            field: Generation status field to claim ("image" or "video")
+            reset: Field values to write with the claim. Keys are field paths,
+                e.g. ``'image_url'`` or ``'generation_status.video'``
+
+        Returns:
+            The scene as it was before the reset (so the caller can cancel its
+            predictions), or None if the scene is missing or already claimed.
+        """
+        doc_ref = self._async_scenes.document(scene_id)
+        now = datetime.utcnow()
+        prediction_field = f'replicate_{field}_prediction_id'
+
+        @firestore.async_transactional
+        async def _reset(transaction) -> Optional[dict]:
+            snapshot = await doc_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                return None
+
+            data = snapshot.to_dict()
+            status = data.get('generation_status') or {}
+            if (status.get(field) == "generating" and not data.get(prediction_field)
+                    and not self._claim_is_stale(data, now)):
+                return None
+
+            transaction.update(doc_ref, {
+                **reset,
+                f'generation_status.{field}': "generating",
+                'updated_at': now,
+            })
+            return data
+
+        data = await _reset(self._async_db.transaction())
+        if data is None:
+            return None
+
+        previous = StoryboardScene(**data)
+
+        # Cache the committed state: the snapshot with the reset applied
+        updated = dict(data)
+        for path, value in {**reset, f'generation_status.{field}': "generating"}.items():
+            parent, _, child = path.partition('.')
+            if child:
+                updated[parent] = {**(updated.get(parent) or {}), child: value}
+            else:
+                updated[parent] = value
+        updated['updated_at'] = now
+        self._cache_scenes[scene_id] = StoryboardScene(**updated)
+        self._missing_scenes.pop(scene_id, None)
+
+        return previous
+
+    def delete_scene(self, scene_id: str) -> bool:
+        """Delete scene from Firestore and cache.
+
+        The delete carries an exists precondition, so a missing scene is
+        detected by the delete itself instead of a separate read.
+        """
         # Delete from cache
-        if scene_id in self._cache_scenes:
-            del self._cache_scenes[scene_id]
-        
+        self._cache_scenes.pop(scene_id, None)
+        self._scene_update_times.pop(scene_id, None)
+
+        # Delete from Firestore
+        try:
+            self._scenes.document(scene_id).delete(
+                option=self._db.write_option(exists=True)
+            )
+        except NotFound:
+            return False
+
         return True
 
+    def _batch_storyboard_update(
+        self,
+        batch,
+        storyboard: Storyboard,
+        fields: Optional[Iterable[str]] = None,
+        scene_order_transform: Any = None
+    ) -> None:
+        """Add a storyboard write to a batch (see update_storyboard for ``fields``).
+
+        ``scene_order_transform`` (an ArrayUnion/ArrayRemove) is written in
+        place of the full scene_order list when it is one of ``fields``.
+        """
+        storyboard.updated_at = datetime.utcnow()
+        doc_ref = self._storyboards.document(storyboard.storyboard_id)
+        if fields is None:
+            batch.set(doc_ref, self._storyboard_to_dict(storyboard), merge=True)
+        else:
+            data = self._storyboard_fields_dict(storyboard, fields)
+            if scene_order_transform is not None and 'scene_order' in data:
+                data['scene_order'] = scene_order_transform
+            batch.update(doc_ref, data)
+
+    def create_scenes_bulk(
+        self,
+        scenes: List[StoryboardScene],
+        storyboard: Optional[Storyboard] = None,
+        storyboard_fields: Optional[Iterable[str]] = None
+    ) -> List[StoryboardScene]:
+        """Create many scenes in one Firestore WriteBatch, then cache them.
+
+        If a storyboard is given, its update (e.g. new scene_order) is written
+        in the same batch so scenes and storyboard change atomically.
+        """
+        batch = self._db.batch()
+        writes = 0
+
+        for scene in scenes:
+            batch.set(self._scenes.document(scene.id), self._scene_to_dict(scene))
+            writes += 1
+            if writes == self.BATCH_WRITE_LIMIT:
+                batch.commit()
+                batch = self._db.batch()
+                writes = 0
+
+        if storyboard is not None:
+            # Scenes appended to the end of scene_order only need their own IDs
+            # sent; Firestore appends them server-side
+            new_ids = [scene.id for scene in scenes]
+            transform = None
+            if new_ids and storyboard.scene_order[-len(new_ids):] == new_ids:
+                transform = firestore.ArrayUnion(new_ids)
+            self._batch_storyboard_update(batch, storyboard, storyboard_fields, transform)
+            writes += 1
+
+        if writes:
+            batch.commit()
+
+        # Write to cache
+        for scene in scenes:
+            self._cache_scenes[scene.id] = scene
+            self._missing_scenes.pop(scene.id, None)
+        if storyboard is not None:
+            self._cache_storyboards[storyboard.storyboard_id] = storyboard
+
+        return scenes
+
+    def delete_scenes_bulk(
+        self,
+        scene_ids: List[str],
+        storyboard: Optional[Storyboard] = None,
+        storyboard_fields: Optional[Iterable[str]] = None
+    ) -> int:
+        """Delete many scenes in one Firestore WriteBatch, then evict them from cache.
+
+        Missing documents are ignored by Firestore, so no existence reads are needed.
+        If a storyboard is given, its update is written in the same batch.
+
+        Returns:
+            Number of scene deletes issued
+        """
+        batch = self._db.batch()
+        writes = 0
+
+        for scene_id in scene_ids:
+            batch.delete(self._scenes.document(scene_id))
+            writes += 1
+            if writes == self.BATCH_WRITE_LIMIT:
+                batch.commit()
+                batch = self._db.batch()
+                writes = 0
+
+        if storyboard is not None:
+            # Remove the IDs server-side instead of rewriting the whole order
+            transform = firestore.ArrayRemove(scene_ids) if scene_ids else None
+            self._batch_storyboard_update(batch, storyboard, storyboard_fields, transform)
+            writes += 1
+
+        if writes:
+            batch.commit()
+
+        # Delete from cache
+        for scene_id in scene_ids:
+            self._cache_scenes.pop(scene_id, None)
+            self._scene_update_times.pop(scene_id, None)
+        if storyboard is not None:
+            self._cache_storyboards[storyboard.storyboard_id] = storyboard
+
+        return len(scene_ids)
+
     # ============================================================================
     # Asset Operations (Firestore + Cache)
     # ============================================================================
@@ -472,6 +878,133 @@ class FirestoreDatabase:
         return True
 
 
+    # ============================================================================
+    # Video Job Operations (Firestore only)
+    # ============================================================================
+    # Not cached here: the video router holds the live state of the jobs its
+    # own process is running, and any other job may be advancing on another
+    # worker, so reads must see Firestore.
+
+    def _video_job_to_dict(self, job: VideoJobStatus) -> dict:
+        """Convert a video job to its Firestore shape.
+
+        Clips are stored as a map keyed by scene number rather than a list, so
+        a single clip can be rewritten with a dotted field path.
+        """
+        data = job.model_dump(mode='json')
+        data['clips_map'] = {str(clip['scene_number']): clip for clip in data.pop('clips')}
+        return data
+
+    def _video_job_from_dict(self, data: dict) -> VideoJobStatus:
+        """Project a stored video job back to the API shape (clips as a list).
+
+        Documents are only ever written from validated models, so they are
+        rebuilt with model_construct instead of re-validating every clip. The
+        enum fields are converted by hand since construct skips coercion.
+        """
+        clips_map = data.pop('clips_map', {})
+        data['clips'] = [
+            VideoClip.model_construct(**{**clips_map[key], 'status': JobStatus(clips_map[key]['status'])})
+            for key in sorted(clips_map, key=int)
+        ]
+        data['status'] = JobStatus(data['status'])
+        return VideoJobStatus.model_construct(**data)
+
+    async def save_video_job_async(self, job: VideoJobStatus) -> VideoJobStatus:
+        """Persist a video job to Firestore (full overwrite)."""
+        doc_ref = self._async_video_jobs.document(job.job_id)
+        await doc_ref.set(self._video_job_to_dict(job))
+        return job
+
+    def _video_job_update_dict(
+        self, job: VideoJobStatus, clips: Iterable[VideoClip]
+    ) -> Dict[str, Any]:
+        """Build a partial update with a job's summary fields plus the given clips."""
+        data = {field: getattr(job, field) for field in self.VIDEO_JOB_SUMMARY_FIELDS}
+        data['status'] = JobStatus(job.status).value
+        for clip in clips:
+            path = FieldPath('clips_map', str(clip.scene_number)).to_api_repr()
+            data[path] = clip.model_dump(mode='json')
+        return data
+
+    async def update_video_job_async(
+        self, job: VideoJobStatus, clips: Iterable[VideoClip] = ()
+    ) -> VideoJobStatus:
+        """Write a video job's summary fields plus only the given changed clips.
+
+        Each changed clip is written under its ``clips_map.<scene>`` field
+        path, so the payload is O(changed clips) instead of O(job). Callers
+        pass the clip objects themselves (looked up by scene number on their
+        side), so building the update never scans the job's full clip list.
+        """
+        doc_ref = self._async_video_jobs.document(job.job_id)
+        await doc_ref.update(self._video_job_update_dict(job, clips))
+        return job
+
+    async def update_video_jobs_async(
+        self, updates: Iterable[Tuple[VideoJobStatus, Iterable[VideoClip]]]
+    ) -> int:
+        """Write several partial video job updates with batched commits.
+
+        Args:
+            updates: ``(job, changed clips)`` pairs, as for
+                ``update_video_job_async``
+
+        Returns:
+            Number of jobs written
+        """
+        batch = self._async_db.batch()
+        writes = 0
+        total = 0
+        for job, clips in updates:
+            doc_ref = self._async_video_jobs.document(job.job_id)
+            batch.update(doc_ref, self._video_job_update_dict(job, clips))
+            writes += 1
+            total += 1
+            if writes == self.BATCH_WRITE_LIMIT:
+                await batch.commit()
+                batch = self._async_db.batch()
+                writes = 0
+
+        if writes:
+            await batch.commit()
+        return total
+
+    async def get_video_job_async(self, job_id: str) -> Optional[VideoJobStatus]:
+        """Get a video job from Firestore."""
+        doc = await self._async_video_jobs.document(job_id).get()
+        if doc.exists:
+            return self._video_job_from_dict(doc.to_dict())
+        return None
+
+    async def list_video_job_summaries_async(
+        self,
+        fields: Iterable[str],
+        limit: int = 100,
+        start_after: Optional[Tuple[str, str]] = None
+    ) -> List[Dict]:
+        """List the most recently created video jobs, newest first.
+
+        Only ``fields`` are fetched (a Firestore projection), so the clips map
+        never crosses the wire. ``created_at`` and ``job_id`` are always
+        included so the last row can serve as the next page's cursor.
+
+        Args:
+            fields: Job fields to fetch
+            limit: Maximum number of jobs to return
+            start_after: ``(created_at, job_id)`` of the last job on the
+                previous page
+        """
+        query = (self._async_video_jobs
+                 .select(list({*fields, 'created_at', 'job_id'}))
+                 .order_by('created_at', direction=firestore.Query.DESCENDING)
+                 .order_by(FieldPath.document_id(), direction=firestore.Query.DESCENDING)
+                 .limit(limit))
+        if start_after is not None:
+            query = query.start_after(list(start_after))
+        return [doc.to_dict() async for doc in query.stream()]
+
+
 # Global database instance
 db = FirestoreDatabase()
 
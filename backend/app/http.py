@@ -0,0 +1,117 @@
+"""Shared HTTP connection pools for outbound traffic.
+
+Every ``replicate.Client(...)`` used to build its own httpx client, so each
+service (and each ad-hoc client in the routers) paid for its own TCP/TLS
+handshakes. This module owns one tuned connection pool that all Replicate
+clients share, one that all OpenAI clients share, plus an async client for
+direct downloads.
+
+The Replicate SDK reuses a single ``transport`` kwarg for both its sync and
+async httpx clients. Our services drive the SDK through ``asyncio.to_thread``
+(sync API), so the shared Replicate pool is a thread-safe sync transport.
+"""
+from typing import Optional
+import logging
+
+import httpx
+import replicate
+from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing: concurrent scene generations fan out to many
+# Replicate calls at once, so lift httpx's default cap of 100 connections.
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+# Long read timeout (blocking model runs can take minutes), fast connect timeout.
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# Singleton instances (created lazily, closed in the FastAPI lifespan)
+http_client: Optional[httpx.AsyncClient] = None
+_replicate_transport: Optional[httpx.HTTPTransport] = None
+_openai_http_client: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared async HTTP client."""
+    global http_client
+    if http_client is None or http_client.is_closed:
+        http_client = httpx.AsyncClient(
+            limits=HTTP_LIMITS,
+            http2=True,
+            timeout=HTTP_TIMEOUT,
+        )
+    return http_client
+
+
+def get_replicate_transport() -> httpx.HTTPTransport:
+    """Get or create the pooled transport shared by all Replicate clients."""
+    global _replicate_transport
+    if _replicate_transport is None:
+        _replicate_transport = httpx.HTTPTransport(limits=HTTP_LIMITS, http2=True)
+    return _replicate_transport
+
+
+def create_replicate_client(api_token: str) -> replicate.Client:
+    """
+    Create a Replicate client backed by the shared connection pool.
+
+    Args:
+        api_token: Replicate API token
+
+    Returns:
+        Replicate client that reuses pooled keep-alive (HTTP/2) connections
+    """
+    return replicate.Client(
+        api_token=api_token,
+        timeout=HTTP_TIMEOUT,
+        transport=get_replicate_transport(),
+    )
+
+
+def get_openai_http_client() -> httpx.Client:
+    """Get or create the pooled sync HTTP client shared by all OpenAI clients."""
+    global _openai_http_client
+    if _openai_http_client is None or _openai_http_client.is_closed:
+        _openai_http_client = httpx.Client(
+            limits=HTTP_LIMITS,
+            http2=True,
+            timeout=HTTP_TIMEOUT,
+        )
+    return _openai_http_client
+
+
+def create_openai_client(api_key: str) -> OpenAI:
+    """
+    Create an OpenAI client backed by the shared connection pool.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        OpenAI client that reuses pooled keep-alive (HTTP/2) connections
+    """
+    return OpenAI(api_key=api_key, http_client=get_openai_http_client())
+
+
+def startup_http_clients() -> None:
+    """Open shared HTTP clients (called from the FastAPI lifespan)."""
+    get_http_client()
+    get_replicate_transport()
+    get_openai_http_client()
+    logger.info("Shared HTTP connection pools initialized")
+
+
+async def shutdown_http_clients() -> None:
+    """Close shared HTTP clients gracefully (called from the FastAPI lifespan)."""
+    global http_client, _replicate_transport, _openai_http_client
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+    if _replicate_transport is not None:
+        _replicate_transport.close()
+        _replicate_transport = None
+    if _openai_http_client is not None:
+        _openai_http_client.close()
+        _openai_http_client = None
+    logger.info("Shared HTTP connection pools closed")
@@ -1,21 +1,54 @@
 """FastAPI application entry point."""
+import atexit
 import logging
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
+from app.http import startup_http_clients, shutdown_http_clients
+from app.services.brand_service import get_brand_service
+from app.services.character_service import get_character_service
+from app.services.firebase_storage_service import get_firebase_storage_service
 from app.routers import moods, scenes, video, audio, composition, storyboards, product, admin, brand, character, backgrounds, whisper, webhooks
 
 # Configure logging
+# Records are handed to a queue and written to stderr by a listener thread,
+# so request handlers never block the event loop on console I/O.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(_log_queue, _log_handler)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on interpreter exit
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[QueueHandler(_log_queue)]
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources on startup and release them on shutdown."""
+    startup_http_clients()
+    # Build service singletons once here instead of lazily on first request
+    video.startup_video_service()
+    get_firebase_storage_service()
+    get_brand_service()
+    get_character_service()
+    yield
+    await video.shutdown_video_jobs()
+    await shutdown_http_clients()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Video Generation Pipeline API",
     description="Backend API for AI-powered video generation pipeline",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS Configuration
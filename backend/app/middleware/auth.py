@@ -4,15 +4,25 @@ Firebase Authentication Middleware
 Provides token verification for protecting backend routes.
 Uses Firebase Admin SDK to verify ID tokens from client.
 """
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from cachetools import TTLCache
 import firebase_admin
 from firebase_admin import auth as firebase_auth
+import asyncio
+import hashlib
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Verified tokens are reused for up to this long (never past the token's own exp)
+TOKEN_CACHE_TTL_SECONDS = 300
+
+# blake2b(token) -> (uid, exp); bursts of requests reuse one verification
+_verified_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
 # HTTP Bearer token security scheme
 security = HTTPBearer()
 
@@ -57,6 +67,32 @@ def _ensure_firebase_admin():
             return False
 
 
+async def _verify_token(token: str) -> str:
+    """
+    Verify a Firebase ID token, reusing recent successful verifications.
+
+    Entries are keyed by a hash of the token (the raw token is never kept)
+    and expire after TOKEN_CACHE_TTL_SECONDS or at the token's ``exp``,
+    whichever comes first. Verification errors are never cached.
+    """
+    token_hash = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    cached: Optional[Tuple[str, float]] = _verified_tokens.get(token_hash)
+    if cached is not None:
+        user_id, expires_at = cached
+        if time.time() < expires_at:
+            return user_id
+        _verified_tokens.pop(token_hash, None)
+
+    # verify_id_token does crypto and may fetch signing certs; keep it off the event loop
+    decoded_token = await asyncio.to_thread(firebase_auth.verify_id_token, token)
+    user_id = decoded_token['uid']
+    _verified_tokens[token_hash] = (
+        user_id,
+        min(time.time() + TOKEN_CACHE_TTL_SECONDS, decoded_token.get('exp', 0)),
+    )
+    return user_id
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> str:
@@ -90,9 +126,8 @@ async def get_current_user(
     token = credentials.credentials
     
     try:
-        # Verify the ID token
-        decoded_token = firebase_auth.verify_id_token(token)
-        user_id = decoded_token['uid']
+        # Verify the ID token (cached per token)
+        user_id = await _verify_token(token)
         
         logger.debug(f"Successfully authenticated user: {user_id}")
         return user_id
@@ -27,7 +27,7 @@ class SceneGenerationStatus(BaseModel):
 class StoryboardScene(BaseModel):
     """Scene model for the unified storyboard interface."""
     # Identity
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique scene ID (UUID)")
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex, description="Unique scene ID (UUID hex)")
     storyboard_id: str = Field(..., description="Foreign key to parent storyboard")
 
     # Current state
@@ -64,7 +64,7 @@ class StoryboardScene(BaseModel):
 
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=lambda data: data["created_at"])  # same clock read as created_at
 
     class Config:
         json_schema_extra = {
@@ -86,7 +86,7 @@ class StoryboardScene(BaseModel):
 class Storyboard(BaseModel):
     """Storyboard model containing metadata and scene ordering."""
     # Identity
-    storyboard_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique storyboard ID (UUID)")
+    storyboard_id: str = Field(default_factory=lambda: uuid.uuid4().hex, description="Unique storyboard ID (UUID hex)")
     project_id: Optional[str] = Field(default=None, description="Project ID this storyboard belongs to (for asset access)")
 
     # Content
@@ -97,7 +97,7 @@ class Storyboard(BaseModel):
     # Metadata
     total_duration: float = Field(default=30.0, description="Total video duration target in seconds")
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=lambda data: data["created_at"])  # same clock read as created_at
 
     class Config:
         json_schema_extra = {
@@ -173,6 +173,13 @@ class SceneUpdateResponse(BaseModel):
     message: Optional[str] = Field(None, description="Status message")
 
 
+class SceneGenerationAcceptedResponse(BaseModel):
+    """Response for accepted (queued) image/video generation requests."""
+    success: bool = Field(..., description="Whether the generation request was accepted")
+    scene_id: str = Field(..., description="Scene ID the generation was queued for")
+    message: Optional[str] = Field(None, description="Status message")
+
+
 # ============================================================================
 # Server-Sent Events (SSE) Models
 # ============================================================================
@@ -185,7 +192,7 @@ class SSESceneUpdate(BaseModel):
     video_status: GenerationStatus = Field(..., description="Video generation status")
     image_url: Optional[str] = Field(None, description="Image URL if generation complete")
     video_url: Optional[str] = Field(None, description="Video URL if generation complete")
-    error: Optional[str] = Field(None, description="Error message if generation failed")
+    error: Optional[str] = Field(None, description="Error message if generation failed (omitted when unset)")
 
 
 # ============================================================================
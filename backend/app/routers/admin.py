@@ -59,8 +59,9 @@ async def get_daily_generations(days: int = 7) -> Dict:
         metrics = get_composite_metrics()
         generations: List[Dict] = []
         
+        today = datetime.now().date()
         for i in range(days):
-            date = (datetime.now() - timedelta(days=i)).date().isoformat()
+            date = (today - timedelta(days=i)).isoformat()
             count = metrics.get_daily_count(date)
             generations.append({
                 "date": date,
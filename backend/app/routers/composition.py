@@ -51,7 +51,7 @@ def _create_composition_job(request: CompositionRequest) -> str:
     Returns:
         job_id: Unique identifier for the job
     """
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
     now = datetime.utcnow().isoformat()
 
     # Create job status
@@ -467,12 +467,13 @@ async def render_video(request: RenderVideoRequest) -> RenderVideoResponse:
 
         # Create a temporary job ID for file access
         # In production, you might want to upload to cloud storage
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         video_url = f"/api/composition/download/{job_id}"
 
         # Store file path temporarily (will be cleaned up later)
         # For now, we'll use a simple in-memory mapping
         # In production, use proper temporary storage
+        now = datetime.utcnow().isoformat()
         _jobs[job_id] = CompositionJobStatus(
             job_id=job_id,
             status=CompositionStatus.COMPLETED,
@@ -484,8 +485,8 @@ async def render_video(request: RenderVideoRequest) -> RenderVideoResponse:
             file_size_mb=file_size_mb,
             duration_seconds=duration_seconds,
             error=None,
-            created_at=datetime.utcnow().isoformat(),
-            updated_at=datetime.utcnow().isoformat()
+            created_at=now,
+            updated_at=now
         )
 
         return RenderVideoResponse(
@@ -1,4 +1,6 @@
 """FastAPI router for mood generation endpoints."""
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 
 from app.models.mood_models import (
@@ -108,32 +110,35 @@ async def generate_moods(
         print(f"Completed generation: {sum(1 for r in image_results if r['success'])}/{len(image_results)} successful")
         
         # Step 4: Persist images to Firebase Storage and organize by mood
+        # Persistence is I/O-bound, so all images are persisted concurrently
         print(f"Persisting {len(image_results)} images to Firebase Storage...")
+        
+        async def persist(result: dict) -> str:
+            image_url = result["image_url"] or ""
+            if result["success"] and image_url:
+                return await replicate_svc.persist_replicate_image(image_url, folder="moods")
+            return image_url
+        
+        image_urls = await asyncio.gather(*(persist(result) for result in image_results))
+        
         moods_with_images = []
         for mood_idx, mood in enumerate(mood_directions):
             # Each mood gets images_per_mood images, so calculate the range
             start_idx = mood_idx * images_per_mood
             end_idx = start_idx + images_per_mood
             
-            # Get the image results for this mood
-            mood_image_results = image_results[start_idx:end_idx]
-            
             # Build MoodImage objects with persisted URLs
-            mood_images = []
-            for idx, result in enumerate(mood_image_results):
-                image_url = result["image_url"] or ""
-                
-                # Persist successful images to Firebase Storage
-                if result["success"] and image_url:
-                    print(f"[Mood {mood_idx + 1}/{len(mood_directions)}] Persisting image {idx + 1}/{len(mood_image_results)}...")
-                    image_url = replicate_svc.persist_replicate_image(image_url, folder="moods")
-                
-                mood_images.append(MoodImage(
+            mood_images = [
+                MoodImage(
                     url=image_url,
                     prompt=result["prompt"],
                     success=result["success"],
                     error=result.get("error")
-                ))
+                )
+                for result, image_url in zip(
+                    image_results[start_idx:end_idx], image_urls[start_idx:end_idx]
+                )
+            ]
             
             moods_with_images.append(Mood(
                 id=mood["id"],
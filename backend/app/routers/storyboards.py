@@ -1,9 +1,11 @@
 """API router for storyboard operations."""
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
-from fastapi.responses import StreamingResponse
-from typing import AsyncGenerator, List, Optional
+from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Depends, Request
+from fastapi.responses import StreamingResponse, ORJSONResponse, Response
+from typing import AsyncGenerator, Dict, List, Optional, Set
 from pydantic import BaseModel, Field
 from app.models.storyboard_models import (
+    StoryboardScene,
+    SceneGenerationStatus,
     StoryboardInitializeRequest,
     StoryboardInitializeResponse,
     StoryboardGetResponse,
@@ -12,28 +14,38 @@ from app.models.storyboard_models import (
     SceneDurationUpdateRequest,
     SceneTrimUpdateRequest,
     SceneUpdateResponse,
-    SSESceneUpdate,
+    SceneGenerationAcceptedResponse,
     ErrorResponse,
 )
 from app.services.storyboard_service import storyboard_service
 from app.services.product_service import get_product_service
 from app.services.replicate_service import get_replicate_service
+from app.services.rate_limiter import get_replicate_semaphore
 from app.services.metrics_service import get_composite_metrics
 from app.services.brand_service import get_brand_service
 from app.services.character_service import get_character_service
+from app.services.background_service import get_background_service
+from app.services.firebase_storage_service import get_firebase_storage_service
 from app.database import db
 from app.config import settings
+from app.http import create_replicate_client
 import json
+import orjson
+from cachetools import TTLCache
 import asyncio
-from datetime import datetime
-import replicate
+import base64
+import hashlib
 import logging
+import traceback
+import zlib
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/storyboards",
     tags=["storyboards"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {"model": ErrorResponse},
         500: {"model": ErrorResponse},
@@ -41,6 +53,24 @@ router = APIRouter(
 )
 
 
+async def get_scene_dep(storyboard_id: str, scene_id: str) -> StoryboardScene:
+    """
+    Resolve the path's scene and check that it belongs to the path's storyboard.
+
+    FastAPI caches a dependency's result for the rest of the request, so
+    every dependency and handler in the same request shares a single
+    Firestore read.
+    """
+    scene = await db.get_scene_async(scene_id)
+    if not scene or scene.storyboard_id != storyboard_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scene {scene_id} not found"
+        )
+
+    return scene
+
+
 # ============================================================================
 # Storyboard Endpoints
 # ============================================================================
@@ -67,7 +97,6 @@ async def initialize_storyboard(request: StoryboardInitializeRequest):
         )
 
     except Exception as e:
-        import traceback
         error_trace = traceback.format_exc()
         print(f"Error initializing storyboard: {str(e)}")
         print(f"Traceback: {error_trace}")
@@ -115,17 +144,13 @@ async def regenerate_all_scenes(storyboard_id: str):
     """
     try:
         # Get existing storyboard
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = await db.get_storyboard_async(storyboard_id)
         if not storyboard:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Storyboard {storyboard_id} not found"
             )
 
-        # Delete existing scenes
-        for scene_id in storyboard.scene_order:
-            db.delete_scene(scene_id)
-
         # Generate new scenes
         # Note: storyboard.creative_brief is stored as a string, so we pass it directly
         # The service will handle both string and dict formats
@@ -135,11 +160,9 @@ async def regenerate_all_scenes(storyboard_id: str):
             num_scenes=6
         )
 
-        # Create new scenes
-        scenes = []
-        for scene_data in scene_texts:
-            from app.models.storyboard_models import StoryboardScene, SceneGenerationStatus
-            scene = StoryboardScene(
+        # Build new scenes
+        scenes = [
+            StoryboardScene(
                 storyboard_id=storyboard.storyboard_id,
                 state="text",
                 text=scene_data["text"],
@@ -150,13 +173,17 @@ async def regenerate_all_scenes(storyboard_id: str):
                     video="pending"
                 )
             )
-            scenes.append(scene)
-            db.create_scene(scene)
+            for scene_data in scene_texts
+        ]
 
-        # Update storyboard with new scene order
+        # Delete existing scenes (one batch) while creating new scenes and
+        # updating the storyboard's scene order together (one batch)
+        old_scene_ids = list(storyboard.scene_order)
         storyboard.scene_order = [scene.id for scene in scenes]
-        storyboard.updated_at = datetime.utcnow()
-        db.update_storyboard(storyboard_id, storyboard)
+        await asyncio.gather(
+            asyncio.to_thread(db.delete_scenes_bulk, old_scene_ids),
+            asyncio.to_thread(db.create_scenes_bulk, scenes, storyboard=storyboard),
+        )
 
         return StoryboardInitializeResponse(
             success=True,
@@ -372,26 +399,44 @@ async def reorder_scenes(storyboard_id: str, request: ReorderScenesRequest):
 # Scene Status Endpoint (for polling fallback)
 # ============================================================================
 
+def _scene_etag(scene: StoryboardScene) -> str:
+    """
+    Weak ETag for a scene's polled status.
+
+    Covers the generation fields clients poll for plus ``updated_at``, which
+    every write bumps, so edits to text or trims also invalidate it.
+    """
+    fingerprint = (
+        f"{scene.state}|{scene.generation_status.image}|{scene.generation_status.video}"
+        f"|{scene.image_url}|{scene.video_url}|{scene.error_message}|{scene.updated_at}"
+    )
+    return f'W/"{hashlib.blake2b(fingerprint.encode(), digest_size=12).hexdigest()}"'
+
+
 @router.get("/{storyboard_id}/scenes/{scene_id}/status", response_model=SceneUpdateResponse)
-async def get_scene_status(storyboard_id: str, scene_id: str):
+async def get_scene_status(
+    storyboard_id: str,
+    scene_id: str,
+    request: Request,
+    scene: StoryboardScene = Depends(get_scene_dep)
+):
     """
     Get current scene status.
 
-    Used for polling fallback when SSE is not available.
+    Used for polling fallback when SSE is not available. Honours
+    ``If-None-Match`` so unchanged polls get an empty 304.
     """
     try:
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
+        etag = _scene_etag(scene)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-        return SceneUpdateResponse(
+        payload = SceneUpdateResponse(
             success=True,
             scene=scene,
             message="Scene status retrieved successfully"
         )
+        return ORJSONResponse(payload.model_dump(mode="json"), headers={"ETag": etag})
 
     except HTTPException:
         raise
@@ -431,24 +476,35 @@ async def enable_product_composite(
         )
     
     try:
-        # Validate product exists
+        # Fetch product and scene concurrently (independent lookups)
         product_service = get_product_service()
-        product = product_service.get_product_image(request.product_id)
+        product, scene = await asyncio.gather(
+            asyncio.to_thread(product_service.get_product_image, request.product_id),
+            db.get_scene_async(scene_id)
+        )
         
+        # Validate product exists
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Product {request.product_id} not found"
             )
         
-        # Get scene
-        scene = db.get_scene(scene_id)
+        # Validate scene exists
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Scene {scene_id} not found"
             )
         
+        # Already compositing this product: any existing image was generated with it
+        if scene.use_product_composite and scene.product_id == request.product_id:
+            return {
+                "success": True,
+                "scene": scene,
+                "message": "Product compositing already enabled"
+            }
+        
         # Update scene
         scene.use_product_composite = True
         scene.product_id = request.product_id
@@ -459,7 +515,7 @@ async def enable_product_composite(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        await db.update_scene_async(scene_id, scene)
         
         return {
             "success": True,
@@ -479,7 +535,8 @@ async def enable_product_composite(
 @router.delete("/{storyboard_id}/scenes/{scene_id}/product-composite")
 async def disable_product_composite(
     storyboard_id: str,
-    scene_id: str
+    scene_id: str,
+    scene: StoryboardScene = Depends(get_scene_dep)
 ):
     """
     Disable product compositing for a scene.
@@ -488,13 +545,13 @@ async def disable_product_composite(
     it will need to be regenerated.
     """
     try:
-        # Get scene
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
+        # Nothing to remove: skip the write and keep the existing image
+        if not scene.use_product_composite and scene.product_id is None:
+            return {
+                "success": True,
+                "scene": scene,
+                "message": "Product compositing already disabled"
+            }
         
         # Update scene
         scene.use_product_composite = False
@@ -506,7 +563,7 @@ async def disable_product_composite(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        await db.update_scene_async(scene_id, scene)
         
         return {
             "success": True,
@@ -557,7 +614,7 @@ async def enable_brand_asset(
     try:
         # Validate brand asset exists
         brand_service = get_brand_service()
-        brand_asset = brand_service.get_brand_asset(request.brand_asset_id)
+        brand_asset = brand_service.get_asset(request.brand_asset_id)
         
         if not brand_asset:
             raise HTTPException(
@@ -566,7 +623,7 @@ async def enable_brand_asset(
             )
         
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -582,7 +639,7 @@ async def enable_brand_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        await db.update_scene_async(scene_id, scene)
         
         return {
             "success": True,
@@ -602,7 +659,8 @@ async def enable_brand_asset(
 @router.delete("/{storyboard_id}/scenes/{scene_id}/brand-asset")
 async def disable_brand_asset(
     storyboard_id: str,
-    scene_id: str
+    scene_id: str,
+    scene: StoryboardScene = Depends(get_scene_dep)
 ):
     """
     Disable brand asset for a scene.
@@ -611,14 +669,6 @@ async def disable_brand_asset(
     it will need to be regenerated.
     """
     try:
-        # Get scene
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
-        
         # Update scene
         scene.brand_asset_id = None
         
@@ -628,7 +678,7 @@ async def disable_brand_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        await db.update_scene_async(scene_id, scene)
         
         return {
             "success": True,
@@ -660,7 +710,7 @@ async def enable_character_asset(
     try:
         # Validate character asset exists
         character_service = get_character_service()
-        character_asset = character_service.get_character_asset(request.character_asset_id)
+        character_asset = character_service.get_asset(request.character_asset_id)
         
         if not character_asset:
             raise HTTPException(
@@ -669,7 +719,7 @@ async def enable_character_asset(
             )
         
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -685,7 +735,7 @@ async def enable_character_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        await db.update_scene_async(scene_id, scene)
         
         return {
             "success": True,
@@ -716,7 +766,6 @@ async def enable_background_asset(
     """
     try:
         # Validate background asset exists
-        from ..services.background_service import get_background_service
         background_service = get_background_service()
         background_asset = background_service.get_asset(request.background_asset_id)
         
@@ -727,7 +776,7 @@ async def enable_background_asset(
             )
         
         # Get scene
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -743,7 +792,7 @@ async def enable_background_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        await db.update_scene_async(scene_id, scene)
         
         return {
             "success": True,
@@ -763,7 +812,8 @@ async def enable_background_asset(
 @router.delete("/{storyboard_id}/scenes/{scene_id}/background-asset")
 async def disable_background_asset(
     storyboard_id: str,
-    scene_id: str
+    scene_id: str,
+    scene: StoryboardScene = Depends(get_scene_dep)
 ):
     """
     Disable background asset for a scene.
@@ -772,14 +822,6 @@ async def disable_background_asset(
     it will need to be regenerated.
     """
     try:
-        # Get scene
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
-        
         # Update scene
         scene.background_asset_id = None
         
@@ -789,7 +831,7 @@ async def disable_background_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        await db.update_scene_async(scene_id, scene)
         
         return {
             "success": True,
@@ -809,7 +851,8 @@ async def disable_background_asset(
 @router.delete("/{storyboard_id}/scenes/{scene_id}/character-asset")
 async def disable_character_asset(
     storyboard_id: str,
-    scene_id: str
+    scene_id: str,
+    scene: StoryboardScene = Depends(get_scene_dep)
 ):
     """
     Disable character asset for a scene.
@@ -818,14 +861,6 @@ async def disable_character_asset(
     it will need to be regenerated.
     """
     try:
-        # Get scene
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
-        
         # Update scene
         scene.character_asset_id = None
         
@@ -835,7 +870,7 @@ async def disable_character_asset(
             scene.image_url = None
         
         # Save scene
-        db.update_scene(scene_id, scene)
+        await db.update_scene_async(scene_id, scene)
         
         return {
             "success": True,
@@ -856,53 +891,156 @@ async def disable_character_asset(
 # Image Generation Endpoints
 # ============================================================================
 
+# Placeholder media used when no Replicate token is configured (local dev)
+PLACEHOLDER_VIDEO_URL = "https://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4"
+
+
+async def _placeholder_image_response(scene: StoryboardScene) -> ORJSONResponse:
+    """Complete a scene's image with a placeholder and return it (no Replicate token)."""
+    logger.info("[Image Generation] No Replicate token, using placeholder for scene %s", scene.id)
+    scene.image_url = f"https://via.placeholder.com/1920x1080/000000/FFFFFF?text=Scene+{scene.id[:8]}"
+    scene.generation_status.image = "complete"
+    scene.state = "image"
+    scene.error_message = None
+    await db.update_scene_async(scene.id, scene)
+
+    return ORJSONResponse(SceneUpdateResponse(
+        success=True,
+        scene=scene,
+        message="Placeholder image set (Replicate not configured)"
+    ).model_dump(mode="json"))
+
+
+async def _placeholder_video_response(scene: StoryboardScene) -> ORJSONResponse:
+    """Complete a scene's video with a placeholder and return it (no Replicate token)."""
+    logger.warning("[Video Generation] No Replicate token found, using placeholder for scene %s", scene.id)
+    scene.video_url = PLACEHOLDER_VIDEO_URL
+    scene.generation_status.video = "complete"
+    scene.state = "video"
+    scene.error_message = None
+    await db.update_scene_async(scene.id, scene)
+
+    return ORJSONResponse(SceneUpdateResponse(
+        success=True,
+        scene=scene,
+        message="Placeholder video set (Replicate not configured)"
+    ).model_dump(mode="json"))
+
+
+# Decorator arguments shared by the four generate/regenerate endpoints
+_GENERATION_ENDPOINT_OPTIONS = dict(
+    response_model=SceneGenerationAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={200: {"model": SceneUpdateResponse, "description": "Placeholder set (Replicate not configured)"}}
+)
+
+
+async def _start_generation(
+    scene: StoryboardScene,
+    background_tasks: BackgroundTasks,
+    kind: str,
+    regenerate: bool
+):
+    """
+    Queue image/video (re)generation for a scene.
+
+    Returns 202 Accepted as soon as the background task is queued; the task
+    owns all scene state changes (status updates arrive via SSE). Without a
+    Replicate token the placeholder is known up front and written directly.
+
+    Args:
+        scene: Scene resolved by get_scene_dep
+        background_tasks: Request's background task queue
+        kind: "image" or "video"
+        regenerate: Cancel and replace existing output instead of generating fresh
+    """
+    action = "regeneration" if regenerate else "generation"
+    try:
+        if kind == "video" and not scene.image_url:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot generate video without an image"
+            )
+
+        if not settings.get_replicate_token():
+            if kind == "video":
+                return await _placeholder_video_response(scene)
+            if regenerate:
+                # Nothing to cancel; the new image invalidates the video
+                scene.video_url = None
+                scene.generation_status.video = "pending"
+                scene.trim_start_time = None
+                scene.trim_end_time = None
+            return await _placeholder_image_response(scene)
+
+        task = {
+            ("image", False): generate_image_task,
+            ("image", True): regenerate_image_task,
+            ("video", False): generate_video_task,
+            ("video", True): regenerate_video_task,
+        }[(kind, regenerate)]
+        logger.info("Queueing %s %s for scene %s", kind, action, scene.id)
+        background_tasks.add_task(task, scene.id)
+
+        return SceneGenerationAcceptedResponse(
+            success=True,
+            scene_id=scene.id,
+            message=f"{kind.capitalize()} {action} started"
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start {kind} {action}: {str(e)}"
+        )
+
+
 async def generate_image_task(scene_id: str):
-    """Background task to generate image using Replicate with webhooks."""
-    print(f"\n{'='*80}")
-    print(f"[Image Generation] 🎨 STARTING IMAGE GENERATION (WEBHOOK MODE)")
-    print(f"{'='*80}")
-    print(f"[Image Generation] Scene ID: {scene_id}")
+    """Background task to claim a scene and generate its image."""
+    # Atomically claim the scene; a duplicate request must not start a
+    # second Replicate prediction while one is already generating
+    try:
+        started = await db.try_start_generation_async(scene_id, "image")
+    except Exception as e:
+        logger.exception("[Image Generation] Failed to claim scene %s: %s", scene_id, e)
+        return
+    if not started:
+        logger.info("[Image Generation] Scene %s missing or already generating, skipping", scene_id)
+        return
+
+    await _run_image_generation(scene_id)
+
+
+async def _run_image_generation(scene_id: str):
+    """Generate the image for a scene already claimed as generating, using Replicate with webhooks."""
+    logger.info("[Image Generation] 🎨 STARTING IMAGE GENERATION (WEBHOOK MODE)")
+    logger.info("[Image Generation] Scene ID: %s", scene_id)
     
     try:
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene:
-            print(f"[Image Generation] ❌ ERROR: Scene {scene_id} not found")
+            logger.error("[Image Generation] ❌ Scene %s not found", scene_id)
             return
 
-        print(f"[Image Generation] Scene found:")
-        print(f"  - Storyboard ID: {scene.storyboard_id}")
-        print(f"  - Brand Asset ID: {scene.brand_asset_id or '(none)'}")
-        print(f"  - Character Asset ID: {scene.character_asset_id or '(none)'}")
-        print(f"  - Background Asset ID: {scene.background_asset_id or '(none)'}")
-        print(f"  - Product Composite: {scene.use_product_composite}")
-
-        # Update status to generating
-        scene.generation_status.image = "generating"
-        db.update_scene(scene_id, scene)
-        print(f"[Image Generation] Status updated to 'generating'")
+        logger.debug("[Image Generation] Scene found:")
+        logger.debug("  - Storyboard ID: %s", scene.storyboard_id)
+        logger.debug("  - Brand Asset ID: %s", scene.brand_asset_id or '(none)')
+        logger.debug("  - Character Asset ID: %s", scene.character_asset_id or '(none)')
+        logger.debug("  - Background Asset ID: %s", scene.background_asset_id or '(none)')
+        logger.debug("  - Product Composite: %s", scene.use_product_composite)
         
         # Get webhook URL for Replicate callbacks
         webhook_url = settings.get_webhook_url()
-        print(f"[Image Generation] Webhook URL: {webhook_url}")
-
-        # Get Replicate token
-        replicate_token = settings.get_replicate_token()
-        if not replicate_token:
-            # No API key - use placeholder
-            print(f"[Image Generation] No Replicate token, using placeholder for scene {scene_id}")
-            scene.generation_status.image = "complete"
-            scene.image_url = f"https://via.placeholder.com/1920x1080/000000/FFFFFF?text=Scene+{scene_id[:8]}"
-            scene.state = "image"
-            db.update_scene(scene_id, scene)
-            print(f"[Image Generation] Placeholder image set for scene {scene_id}")
-            return
+        logger.info("[Image Generation] Webhook URL: %s", webhook_url)
 
         # Determine which generation path to use
-        print(f"\n[Image Generation] 🔀 DETERMINING GENERATION PATH:")
+        logger.info("[Image Generation] 🔀 DETERMINING GENERATION PATH:")
         if scene.use_product_composite and scene.product_id:
-            print(f"  → Using PRODUCT COMPOSITE path")
+            logger.debug("  → Using PRODUCT COMPOSITE path")
             # Product compositing path
-            print(f"[Image Generation] Product compositing enabled for scene {scene_id}")
+            logger.info("[Image Generation] Product compositing enabled for scene %s", scene_id)
             
             # Get product service
             product_service = get_product_service()
@@ -924,7 +1062,7 @@ async def generate_image_task(scene_id: str):
             use_kontext = settings.USE_KONTEXT_COMPOSITE and settings.COMPOSITE_METHOD == "kontext"
             
             if use_kontext:
-                print(f"[Image Generation] Using Kontext composite method (webhook)")
+                logger.info("[Image Generation] Using Kontext composite method (webhook)")
                 # For now, Kontext composite with webhooks requires breaking down into steps
                 # TODO: Implement webhook-based Kontext composite
                 # For now, fall back to synchronous call
@@ -936,9 +1074,9 @@ async def generate_image_task(scene_id: str):
                     width=1920,
                     height=1080
                 )
-                print(f"[Image Generation] Kontext composite completed")
+                logger.info("[Image Generation] Kontext composite completed")
             else:
-                print(f"[Image Generation] Using PIL composite method (webhook)")
+                logger.info("[Image Generation] Using PIL composite method (webhook)")
                 # For PIL composite, also use blocking for now as it requires multiple steps
                 # TODO: Implement webhook-based PIL composite
                 logger.warning("PIL composite not yet implemented with webhooks, using blocking call")
@@ -949,7 +1087,7 @@ async def generate_image_task(scene_id: str):
                     width=1920,
                     height=1080
                 )
-                print(f"[Image Generation] PIL composite completed")
+                logger.info("[Image Generation] PIL composite completed")
         elif scene.brand_asset_id or scene.character_asset_id or scene.background_asset_id:
             logger.info(f"  → Using ASSET-BASED path (nano-banana-pro, {'webhook' if settings.use_webhooks() else 'blocking'})")
             # Asset-based generation using nano-banana-pro
@@ -967,7 +1105,6 @@ async def generate_image_task(scene_id: str):
             replicate_service = get_replicate_service()
             brand_service = get_brand_service()
             character_service = get_character_service()
-            from ..services.background_service import get_background_service
             background_service = get_background_service()
             
             # Get asset image URLs and metadata
@@ -978,26 +1115,38 @@ async def generate_image_task(scene_id: str):
             background_asset_image_url = None
             background_asset_filename = None
             
+            # The three asset lookups are independent blocking reads; run
+            # them concurrently off the event loop
+            async def lookup_asset(service, asset_id):
+                if not asset_id:
+                    return None
+                return await asyncio.to_thread(service.get_asset, asset_id)
+            
+            brand_asset, character_asset, background_asset = await asyncio.gather(
+                lookup_asset(brand_service, scene.brand_asset_id),
+                lookup_asset(character_service, scene.character_asset_id),
+                lookup_asset(background_service, scene.background_asset_id),
+            )
+            
             if scene.brand_asset_id:
                 logger.info("🏷️  BRAND ASSET:")
                 logger.info(f"  Asset ID: {scene.brand_asset_id}")
-                brand_asset = brand_service.get_brand_asset(scene.brand_asset_id)
                 if brand_asset:
                     # Try to get public URL, upload to Firebase Storage if missing
                     brand_asset_image_url = brand_asset.public_url
                     if not brand_asset_image_url:
                         logger.warning(f"  ⚠️  Brand asset missing public_url, attempting Firebase Storage upload...")
                         try:
-                            from ..services.firebase_storage_service import get_firebase_storage_service
                             storage_service = get_firebase_storage_service()
                             if storage_service:
                                 asset_path = brand_service.get_asset_path(scene.brand_asset_id, thumbnail=False)
                                 if asset_path and asset_path.exists():
-                                    brand_asset_image_url = storage_service.upload_image(asset_path, folder="assets/brands")
+                                    brand_asset_image_url = await asyncio.to_thread(
+                                        storage_service.upload_image, asset_path, folder="assets/brands"
+                                    )
                                     if brand_asset_image_url:
                                         logger.info(f"  ✓ Successfully uploaded brand asset to Firebase Storage: {brand_asset_image_url}")
                                         # Update metadata with new public_url
-                                        import json
                                         metadata_path = brand_service.upload_dir / scene.brand_asset_id / "metadata.json"
                                         if metadata_path.exists():
                                             with open(metadata_path, 'r') as f:
@@ -1027,7 +1176,6 @@ async def generate_image_task(scene_id: str):
             if scene.character_asset_id:
                 logger.info("👤 CHARACTER ASSET:")
                 logger.info(f"  Asset ID: {scene.character_asset_id}")
-                character_asset = character_service.get_character_asset(scene.character_asset_id)
                 if character_asset:
                     # Use public URL if available (for external APIs), otherwise fall back to full URL
                     character_asset_image_url = character_asset.public_url or settings.to_full_url(character_asset.url)
@@ -1041,7 +1189,6 @@ async def generate_image_task(scene_id: str):
             if scene.background_asset_id:
                 logger.info("🖼️  BACKGROUND ASSET:")
                 logger.info(f"  Asset ID: {scene.background_asset_id}")
-                background_asset = background_service.get_asset(scene.background_asset_id)
                 if background_asset:
                     # Use public URL if available (for external APIs), otherwise fall back to full URL
                     background_asset_image_url = background_asset.public_url or settings.to_full_url(background_asset.url)
@@ -1102,7 +1249,7 @@ async def generate_image_task(scene_id: str):
                 
                 # Store prediction ID in scene
                 scene.replicate_image_prediction_id = prediction_id
-                db.update_scene(scene_id, scene)
+                await db.update_scene_async(scene_id, scene)
                 
                 logger.info(f"✅ Prediction created with ID: {prediction_id}")
                 logger.info("   Webhook will be called when generation completes")
@@ -1166,7 +1313,7 @@ async def generate_image_task(scene_id: str):
                 
                 # Store prediction ID in scene
                 scene.replicate_image_prediction_id = prediction_id
-                db.update_scene(scene_id, scene)
+                await db.update_scene_async(scene_id, scene)
                 
                 logger.info(f"✅ Prediction created with ID: {prediction_id}")
                 logger.info("   Webhook will be called when generation completes")
@@ -1200,9 +1347,9 @@ async def generate_image_task(scene_id: str):
         # Blocking mode: falls through to here with image_url set
         if 'image_url' in locals() and image_url:
             # Persist image to Firebase Storage (common for both paths)
-            print(f"[Image Generation] Persisting scene image to Firebase Storage...")
+            logger.info("[Image Generation] Persisting scene image to Firebase Storage...")
             logger.info("Persisting scene image to Firebase Storage...")
-            image_url = replicate_service.persist_replicate_image(image_url, folder="scenes")
+            image_url = await replicate_service.persist_replicate_image(image_url, folder="scenes")
             
             # Update scene with result (common for both paths)
             # Update scene with image URL (now permanent Firebase URL)
@@ -1211,140 +1358,96 @@ async def generate_image_task(scene_id: str):
             scene.state = "image"
             scene.error_message = None
 
-            db.update_scene(scene_id, scene)
-            print(f"[Image Generation] Successfully updated scene {scene_id} with image")
-            print(f"[Image Generation] Scene state after update: {scene.state}")
-            print(f"[Image Generation] Scene image_url after update: {scene.image_url}")
-            print(f"[Image Generation] Scene generation_status.image after update: {scene.generation_status.image}")
+            await db.update_scene_async(scene_id, scene)
+            logger.info("[Image Generation] Successfully updated scene %s with image", scene_id)
+            logger.info("[Image Generation] Scene state after update: %s", scene.state)
+            logger.info("[Image Generation] Scene image_url after update: %s", scene.image_url)
+            logger.info("[Image Generation] Scene generation_status.image after update: %s", scene.generation_status.image)
             
             # Verify the scene was saved correctly
-            verified_scene = db.get_scene(scene_id)
+            verified_scene = await db.get_scene_async(scene_id)
             if verified_scene:
-                print(f"[Image Generation] Verified saved scene: state={verified_scene.state}, image_url={verified_scene.image_url}, status={verified_scene.generation_status.image}")
+                logger.info("[Image Generation] Verified saved scene: state=%s, image_url=%s, status=%s", verified_scene.state, verified_scene.image_url, verified_scene.generation_status.image)
             else:
-                print(f"[Image Generation] ERROR: Scene {scene_id} not found after update!")
+                logger.error("[Image Generation] Scene %s not found after update!", scene_id)
 
     except Exception as e:
         # Update scene with error
-        print(f"[Image Generation] Error generating image for scene {scene_id}: {str(e)}")
-        import traceback
-        print(f"[Image Generation] Traceback: {traceback.format_exc()}")
-        scene = db.get_scene(scene_id)
+        logger.exception("[Image Generation] Error generating image for scene %s: %s", scene_id, e)
+        scene = await db.get_scene_async(scene_id)
         if scene:
             scene.generation_status.image = "error"
             scene.error_message = f"Image generation failed: {str(e)}"
-            db.update_scene(scene_id, scene)
-            print(f"[Image Generation] Updated scene {scene_id} with error status")
+            await db.update_scene_async(scene_id, scene)
+            logger.info("[Image Generation] Updated scene %s with error status", scene_id)
 
 
-@router.post("/{storyboard_id}/scenes/{scene_id}/image/generate", response_model=SceneUpdateResponse)
-async def generate_scene_image(
-    storyboard_id: str,
-    scene_id: str,
-    background_tasks: BackgroundTasks
-):
-    """
-    Approve text and generate image for a scene.
-
-    This starts async image generation using Replicate.
-    """
+async def regenerate_image_task(scene_id: str):
+    """Background task to cancel in-flight predictions, reset the scene and regenerate its image."""
     try:
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
+        # Reset the scene and claim it as generating in one transaction, so
+        # concurrent regenerate calls cannot each start a prediction.
+        # Clearing the prediction IDs means late webhooks for the old predictions are ignored.
+        previous = await db.reset_and_claim_generation_async(scene_id, "image", {
+            'image_url': None,
+            'replicate_image_prediction_id': None,
+            # Video depends on image, so it must be cleared when regenerating image
+            'replicate_video_prediction_id': None,
+            'video_url': None,
+            'generation_status.video': "pending",
+            'state': "image",
+            'trim_start_time': None,
+            'trim_end_time': None,
+        })
+        if previous is None:
+            logger.info("[Image Regeneration] Scene %s missing or generation already starting, skipping", scene_id)
+            return
+
+        # Cancel the superseded predictions
+        prediction_ids = [
+            prediction_id
+            for prediction_id in (previous.replicate_image_prediction_id, previous.replicate_video_prediction_id)
+            if prediction_id
+        ]
+        if prediction_ids:
+            logger.info("[Image Regeneration] Canceling existing predictions: %s", prediction_ids)
+            replicate_service = get_replicate_service()
+            await asyncio.gather(
+                *(replicate_service.cancel_prediction(prediction_id) for prediction_id in prediction_ids)
             )
 
-        # Start image generation in background
-        print(f"[Image Generation] Adding background task for scene {scene_id}")
-        background_tasks.add_task(generate_image_task, scene_id)
-        print(f"[Image Generation] Background task added for scene {scene_id}")
+    except Exception as e:
+        logger.error("[Image Regeneration] Error resetting scene %s: %s", scene_id, e)
+        scene = await db.get_scene_async(scene_id)
+        if scene:
+            scene.generation_status.image = "error"
+            scene.error_message = f"Image regeneration failed: {str(e)}"
+            await db.update_scene_async(scene_id, scene)
+        return
 
-        # Return immediately with generating status
-        scene.generation_status.image = "generating"
-        db.update_scene(scene_id, scene)
-        print(f"[Image Generation] Endpoint returning with 'generating' status for scene {scene_id}")
+    await _run_image_generation(scene_id)
 
-        return SceneUpdateResponse(
-            success=True,
-            scene=scene,
-            message="Image generation started"
-        )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start image generation: {str(e)}"
-        )
+@router.post("/{storyboard_id}/scenes/{scene_id}/image/generate", **_GENERATION_ENDPOINT_OPTIONS)
+async def generate_scene_image(
+    storyboard_id: str,
+    scene_id: str,
+    background_tasks: BackgroundTasks,
+    scene: StoryboardScene = Depends(get_scene_dep)
+):
+    """Approve text and generate image for a scene."""
+    return await _start_generation(scene, background_tasks, "image", regenerate=False)
 
 
-@router.post("/{storyboard_id}/scenes/{scene_id}/image/regenerate", response_model=SceneUpdateResponse)
+@router.post("/{storyboard_id}/scenes/{scene_id}/image/regenerate", **_GENERATION_ENDPOINT_OPTIONS)
 async def regenerate_scene_image(
     storyboard_id: str,
     scene_id: str,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    scene: StoryboardScene = Depends(get_scene_dep)
 ):
-    """
-    Regenerate image for a scene.
-
-    This cancels any existing generation, clears the image, and starts new generation.
-    """
-    try:
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
-
-        # Cancel existing image prediction if any
-        if scene.replicate_image_prediction_id:
-            print(f"[Image Regeneration] Canceling existing image prediction: {scene.replicate_image_prediction_id}")
-            from app.services.replicate_service import get_replicate_service
-            replicate_service = get_replicate_service()
-            await replicate_service.cancel_prediction(scene.replicate_image_prediction_id)
-            scene.replicate_image_prediction_id = None
-
-        # Cancel existing video prediction if any (video depends on image, so it must be cleared)
-        if scene.replicate_video_prediction_id:
-            print(f"[Image Regeneration] Canceling existing video prediction: {scene.replicate_video_prediction_id}")
-            from app.services.replicate_service import get_replicate_service
-            replicate_service = get_replicate_service()
-            await replicate_service.cancel_prediction(scene.replicate_video_prediction_id)
-            scene.replicate_video_prediction_id = None
-
-        # Reset image state
-        scene.image_url = None
-        scene.generation_status.image = "generating"
-        
-        # Reset video state (video depends on image, so it must be cleared when regenerating image)
-        scene.video_url = None
-        scene.generation_status.video = "pending"
-        scene.state = "image"  # Reset state back to image since video is cleared
-        scene.trim_start_time = None
-        scene.trim_end_time = None
-        
-        db.update_scene(scene_id, scene)
-
-        # Start image generation in background
-        background_tasks.add_task(generate_image_task, scene_id)
-
-        return SceneUpdateResponse(
-            success=True,
-            scene=scene,
-            message="Image regeneration started"
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start image regeneration: {str(e)}"
-        )
+    """Cancel any in-flight generation and regenerate the image for a scene."""
+    return await _start_generation(scene, background_tasks, "image", regenerate=True)
 
 
 # ============================================================================
@@ -1352,83 +1455,80 @@ async def regenerate_scene_image(
 # ============================================================================
 
 async def generate_video_task(scene_id: str):
-    """Background task to generate video using Replicate."""
-    print(f"\n{'='*80}")
-    print(f"[Video Generation] Starting video generation for scene {scene_id} ({'WEBHOOK' if settings.use_webhooks() else 'BLOCKING'} MODE)")
-    print(f"{'='*80}")
+    """Background task to claim a scene and generate its video."""
+    # Atomically claim the scene; a duplicate request must not start a
+    # second Replicate prediction while one is already generating
+    try:
+        started = await db.try_start_generation_async(scene_id, "video")
+    except Exception as e:
+        logger.exception("[Video Generation] Failed to claim scene %s: %s", scene_id, e)
+        return
+    if not started:
+        logger.info("[Video Generation] Scene %s missing or already generating, skipping", scene_id)
+        return
+
+    await _run_video_generation(scene_id)
+
+
+async def _run_video_generation(scene_id: str):
+    """Generate the video for a scene already claimed as generating, using Replicate."""
+    logger.info("[Video Generation] Starting video generation for scene %s (%s MODE)", scene_id, 'WEBHOOK' if settings.use_webhooks() else 'BLOCKING')
     
     try:
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene:
-            print(f"[Video Generation] ERROR: Scene {scene_id} not found")
+            logger.error("[Video Generation] Scene %s not found", scene_id)
             return
 
-        print(f"[Video Generation] Scene details:")
-        print(f"  - Storyboard ID: {scene.storyboard_id}")
-        print(f"  - Scene text: {scene.text[:100]}...")
-        print(f"  - Video duration: {scene.video_duration}s")
-        print(f"  - Image URL: {scene.image_url}")
-
-        # Update status to generating
-        scene.generation_status.video = "generating"
-        db.update_scene(scene_id, scene)
-        print(f"[Video Generation] Status updated to 'generating'")
+        logger.debug("[Video Generation] Scene details:")
+        logger.debug("  - Storyboard ID: %s", scene.storyboard_id)
+        logger.debug("  - Scene text: %s...", scene.text[:100])
+        logger.debug("  - Video duration: %ss", scene.video_duration)
+        logger.debug("  - Image URL: %s", scene.image_url)
 
-        # Get Replicate token
+        # Get Replicate token (endpoints short-circuit to placeholders when missing)
         replicate_token = settings.get_replicate_token()
-        if not replicate_token:
-            print(f"[Video Generation] WARNING: No Replicate token found, using placeholder")
-            scene.generation_status.video = "complete"
-            scene.video_url = "https://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4"
-            scene.state = "video"
-            db.update_scene(scene_id, scene)
-            print(f"[Video Generation] Placeholder video set")
-            return
 
         if not scene.image_url:
-            print(f"[Video Generation] ERROR: No image URL found for scene {scene_id}")
+            logger.error("[Video Generation] No image URL found for scene %s", scene_id)
             scene.generation_status.video = "error"
             scene.error_message = "Cannot generate video without an image"
-            db.update_scene(scene_id, scene)
+            await db.update_scene_async(scene_id, scene)
             return
 
         # Generate video using Replicate with webhook (image-to-video model)
         # Using ByteDance SeeDance-1 Pro Fast - supports longer videos
-        print(f"[Video Generation] Initializing Replicate service")
-        from app.services.replicate_service import get_replicate_service
+        logger.info("[Video Generation] Initializing Replicate service")
         replicate_service = get_replicate_service()
         
         # Convert relative image URL to full URL for Replicate API
         full_image_url = settings.to_full_url(scene.image_url)
-        print(f"[Video Generation] Image URL: {full_image_url[:100]}...")
+        logger.info("[Video Generation] Image URL: %s...", full_image_url[:100])
         
         # For localhost URLs, Replicate can't access them, so we need to convert to base64
         # This is necessary for local development
         if "localhost" in full_image_url or "127.0.0.1" in full_image_url:
-            print(f"[Video Generation] Detected localhost URL, converting to base64")
+            logger.info("[Video Generation] Detected localhost URL, converting to base64")
             # Extract the local file path from the URL
             # e.g., http://localhost:8000/uploads/composites/file.png -> uploads/composites/file.png
-            from pathlib import Path
-            import base64
-            
             local_path = full_image_url.split("/uploads/", 1)[-1]
             local_file_path = f"uploads/{local_path}"
-            print(f"[Video Generation] Local file path: {local_file_path}")
+            logger.info("[Video Generation] Local file path: %s", local_file_path)
             
             # Check if file exists locally
             if Path(local_file_path).exists():
                 try:
                     # Convert to base64 data URI
-                    print(f"[Video Generation] Converting image to base64...")
+                    logger.info("[Video Generation] Converting image to base64...")
                     with open(local_file_path, 'rb') as f:
                         image_data = f.read()
                     base64_data = base64.b64encode(image_data).decode('utf-8')
                     full_image_url = f"data:image/png;base64,{base64_data}"
-                    print(f"[Video Generation] ✓ Converted to base64 data URI (size: {len(base64_data)} chars)")
+                    logger.info("[Video Generation] ✓ Converted to base64 data URI (size: %s chars)", len(base64_data))
                 except Exception as e:
-                    print(f"[Video Generation] WARNING: Failed to convert to base64: {e}, will try URL anyway")
+                    logger.warning("[Video Generation] Failed to convert to base64: %s, will try URL anyway", e)
             else:
-                print(f"[Video Generation] WARNING: Local file not found at {local_file_path}")
+                logger.warning("[Video Generation] Local file not found at %s", local_file_path)
         
         # Prepare input parameters for Seedance
         # Clamp duration to valid range (3-8 seconds)
@@ -1451,59 +1551,59 @@ async def generate_video_task(scene_id: str):
         if settings.use_webhooks():
             # WEBHOOK MODE: Create prediction and return immediately
             webhook_url = settings.get_webhook_url()
-            print(f"[Video Generation] Webhook URL: {webhook_url}")
+            logger.info("[Video Generation] Webhook URL: %s", webhook_url)
             
-            print(f"[Video Generation] Creating webhook-based prediction:")
-            print(f"  - Model: bytedance/seedance-1-pro-fast")
-            print(f"  - Prompt: {scene.text[:100]}...")
-            print(f"  - Duration: {clamped_duration}s (clamped from {scene.video_duration}s)")
-            print(f"  - Resolution: {resolution}")
-            print(f"  - Aspect Ratio: 16:9")
-            print(f"  - Image: {'base64 data URI' if full_image_url.startswith('data:') else full_image_url[:80]}...")
-            print(f"[Video Generation] Creating prediction with webhook...")
+            logger.info("[Video Generation] Creating webhook-based prediction:")
+            logger.debug("  - Model: bytedance/seedance-1-pro-fast")
+            logger.debug("  - Prompt: %s...", scene.text[:100])
+            logger.debug("  - Duration: %ss (clamped from %ss)", clamped_duration, scene.video_duration)
+            logger.debug("  - Resolution: %s", resolution)
+            logger.debug("  - Aspect Ratio: 16:9")
+            logger.debug("  - Image: %s...", 'base64 data URI' if full_image_url.startswith('data:') else full_image_url[:80])
+            logger.info("[Video Generation] Creating prediction with webhook...")
             
             # Create prediction with webhook
             prediction_id = await replicate_service.create_prediction_with_webhook(
                 model="bytedance/seedance-1-pro-fast",
                 input_params=input_params,
-                webhook_url=webhook_url
+                webhook_url=webhook_url,
+                kind="video"
             )
             
             # Store prediction ID in scene
             scene.replicate_video_prediction_id = prediction_id
-            db.update_scene(scene_id, scene)
+            await db.update_scene_async(scene_id, scene)
             
-            print(f"[Video Generation] ✓ Prediction created with ID: {prediction_id}")
-            print(f"[Video Generation]    Webhook will be called when generation completes")
-            print(f"[Video Generation] ✓ Video generation started successfully for scene {scene_id}")
-            print(f"{'='*80}\n")
+            logger.info("[Video Generation] ✓ Prediction created with ID: %s", prediction_id)
+            logger.info("[Video Generation]    Webhook will be called when generation completes")
+            logger.info("[Video Generation] ✓ Video generation started successfully for scene %s", scene_id)
         
         else:
             # BLOCKING MODE: Generate and wait for result (local dev)
-            print(f"[Video Generation] Generating video (blocking mode for local dev):")
-            print(f"  - Model: bytedance/seedance-1-pro-fast")
-            print(f"  - Prompt: {scene.text[:100]}...")
-            print(f"  - Duration: {clamped_duration}s (clamped from {scene.video_duration}s)")
-            print(f"  - Resolution: {resolution}")
-            print(f"  - Aspect Ratio: 16:9")
-            print(f"  - Image: {'base64 data URI' if full_image_url.startswith('data:') else full_image_url[:80]}...")
-            print(f"[Video Generation] Calling Replicate API (blocking)...")
+            logger.info("[Video Generation] Generating video (blocking mode for local dev):")
+            logger.debug("  - Model: bytedance/seedance-1-pro-fast")
+            logger.debug("  - Prompt: %s...", scene.text[:100])
+            logger.debug("  - Duration: %ss (clamped from %ss)", clamped_duration, scene.video_duration)
+            logger.debug("  - Resolution: %s", resolution)
+            logger.debug("  - Aspect Ratio: 16:9")
+            logger.debug("  - Image: %s...", 'base64 data URI' if full_image_url.startswith('data:') else full_image_url[:80])
+            logger.info("[Video Generation] Calling Replicate API (blocking)...")
             
-            # Use blocking client.run call
-            import replicate
-            client = replicate.Client(api_token=replicate_token)
+            # Use blocking client.run call (shared connection pool)
+            client = create_replicate_client(replicate_token)
             
             start_time = asyncio.get_event_loop().time()
-            output = await asyncio.to_thread(
-                client.run,
-                "bytedance/seedance-1-pro-fast",
-                input=input_params
-            )
+            async with get_replicate_semaphore("video"):
+                output = await asyncio.to_thread(
+                    client.run,
+                    "bytedance/seedance-1-pro-fast",
+                    input=input_params
+                )
             elapsed_time = asyncio.get_event_loop().time() - start_time
             
-            print(f"[Video Generation] ✓ Replicate API call completed in {elapsed_time:.2f}s")
-            print(f"[Video Generation] Output type: {type(output)}")
-            print(f"[Video Generation] Output: {output}")
+            logger.info("[Video Generation] ✓ Replicate API call completed in %.2fs", elapsed_time)
+            logger.debug("[Video Generation] Output type: %s", type(output))
+            logger.debug("[Video Generation] Output: %s", output)
             
             # Extract video URL from output
             if output:
@@ -1512,149 +1612,94 @@ async def generate_video_task(scene_id: str):
                 else:
                     video_url = str(output) if hasattr(output, '__str__') else output
                 
-                print(f"[Video Generation] ✓ Video URL extracted: {video_url[:100]}...")
+                logger.info("[Video Generation] ✓ Video URL extracted: %s...", video_url[:100])
                 
                 # Update scene with video URL
                 scene.video_url = video_url
                 scene.generation_status.video = "complete"
                 scene.state = "video"
                 scene.error_message = None
-                db.update_scene(scene_id, scene)
+                await db.update_scene_async(scene_id, scene)
                 
-                print(f"[Video Generation] ✓ Scene updated successfully")
-                print(f"[Video Generation] Status: {scene.generation_status.video}")
-                print(f"[Video Generation] State: {scene.state}")
+                logger.info("[Video Generation] ✓ Scene updated successfully")
+                logger.info("[Video Generation] Status: %s", scene.generation_status.video)
+                logger.info("[Video Generation] State: %s", scene.state)
             else:
                 raise Exception("No video generated")
             
-            print(f"[Video Generation] ✓ Video generation completed successfully for scene {scene_id}")
-            print(f"{'='*80}\n")
+            logger.info("[Video Generation] ✓ Video generation completed successfully for scene %s", scene_id)
 
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[Video Generation] ✗ ERROR: Video generation failed for scene {scene_id}")
-        print(f"[Video Generation] Error: {str(e)}")
-        print(f"[Video Generation] Traceback:\n{error_trace}")
+        logger.exception("[Video Generation] ✗ Video generation failed for scene %s: %s", scene_id, e)
         
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if scene:
             scene.generation_status.video = "error"
             scene.error_message = f"Video generation failed: {str(e)}"
-            db.update_scene(scene_id, scene)
-            print(f"[Video Generation] Scene error status updated")
+            await db.update_scene_async(scene_id, scene)
+            logger.info("[Video Generation] Scene error status updated")
         
-        print(f"{'='*80}\n")
-
 
-@router.post("/{storyboard_id}/scenes/{scene_id}/video/generate", response_model=SceneUpdateResponse)
-async def generate_scene_video(
-    storyboard_id: str,
-    scene_id: str,
-    background_tasks: BackgroundTasks
-):
-    """
-    Approve image and generate video for a scene.
 
-    This starts async video generation using Replicate.
-    """
+async def regenerate_video_task(scene_id: str):
+    """Background task to cancel the in-flight prediction, reset the scene and regenerate its video."""
     try:
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
+        # Reset the scene and claim it as generating in one transaction, so
+        # concurrent regenerate calls cannot each start a prediction
+        previous = await db.reset_and_claim_generation_async(scene_id, "video", {
+            'video_url': None,
+            'replicate_video_prediction_id': None,
+        })
+        if previous is None:
+            logger.info("[Video Regeneration] Scene %s missing or generation already starting, skipping", scene_id)
+            return
 
-        if not scene.image_url:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot generate video without an image"
-            )
+        # Cancel the superseded prediction if any
+        prediction_id = previous.replicate_video_prediction_id
+        if prediction_id:
+            logger.info("[Video Regeneration] Canceling existing prediction: %s", prediction_id)
+            await get_replicate_service().cancel_prediction(prediction_id)
 
-        # Start video generation in background
-        background_tasks.add_task(generate_video_task, scene_id)
+    except Exception as e:
+        logger.error("[Video Regeneration] Error resetting scene %s: %s", scene_id, e)
+        scene = await db.get_scene_async(scene_id)
+        if scene:
+            scene.generation_status.video = "error"
+            scene.error_message = f"Video regeneration failed: {str(e)}"
+            await db.update_scene_async(scene_id, scene)
+        return
 
-        # Return immediately with generating status
-        scene.generation_status.video = "generating"
-        db.update_scene(scene_id, scene)
+    await _run_video_generation(scene_id)
 
-        return SceneUpdateResponse(
-            success=True,
-            scene=scene,
-            message="Video generation started"
-        )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start video generation: {str(e)}"
-        )
+@router.post("/{storyboard_id}/scenes/{scene_id}/video/generate", **_GENERATION_ENDPOINT_OPTIONS)
+async def generate_scene_video(
+    storyboard_id: str,
+    scene_id: str,
+    background_tasks: BackgroundTasks,
+    scene: StoryboardScene = Depends(get_scene_dep)
+):
+    """Approve image and generate video for a scene."""
+    return await _start_generation(scene, background_tasks, "video", regenerate=False)
 
 
-@router.post("/{storyboard_id}/scenes/{scene_id}/video/regenerate", response_model=SceneUpdateResponse)
+@router.post("/{storyboard_id}/scenes/{scene_id}/video/regenerate", **_GENERATION_ENDPOINT_OPTIONS)
 async def regenerate_scene_video(
     storyboard_id: str,
     scene_id: str,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    scene: StoryboardScene = Depends(get_scene_dep)
 ):
-    """
-    Regenerate video for a scene.
-
-    This cancels any existing generation, clears the video, and starts new generation.
-    """
-    try:
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
-
-        if not scene.image_url:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot generate video without an image"
-            )
-
-        # Cancel existing prediction if any
-        if scene.replicate_video_prediction_id:
-            print(f"[Video Regeneration] Canceling existing prediction: {scene.replicate_video_prediction_id}")
-            from app.services.replicate_service import get_replicate_service
-            replicate_service = get_replicate_service()
-            await replicate_service.cancel_prediction(scene.replicate_video_prediction_id)
-            scene.replicate_video_prediction_id = None
-
-        # Reset video state
-        scene.video_url = None
-        scene.generation_status.video = "generating"
-        db.update_scene(scene_id, scene)
-
-        # Start video generation in background
-        background_tasks.add_task(generate_video_task, scene_id)
-
-        return SceneUpdateResponse(
-            success=True,
-            scene=scene,
-            message="Video regeneration started"
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start video regeneration: {str(e)}"
-        )
+    """Cancel any in-flight generation and regenerate the video for a scene."""
+    return await _start_generation(scene, background_tasks, "video", regenerate=True)
 
 
 @router.post("/{storyboard_id}/scenes/{scene_id}/video/trim", response_model=SceneUpdateResponse)
 async def update_scene_trim(
     storyboard_id: str,
     scene_id: str,
-    request: SceneTrimUpdateRequest
+    request: SceneTrimUpdateRequest,
+    scene: StoryboardScene = Depends(get_scene_dep)
 ):
     """
     Update trim start/end times for a scene video.
@@ -1665,13 +1710,6 @@ async def update_scene_trim(
     - trim_end_time > trim_start_time
     """
     try:
-        scene = db.get_scene(scene_id)
-        if not scene:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Scene {scene_id} not found"
-            )
-
         # Validate scene has video
         if not scene.video_url:
             raise HTTPException(
@@ -1732,7 +1770,7 @@ async def update_scene_trim(
             scene.trim_end_time = clamped_trim_end_time
 
         # Save updated scene
-        updated_scene = db.update_scene(scene_id, scene)
+        updated_scene = await db.update_scene_async(scene_id, scene)
 
         return SceneUpdateResponse(
             success=True,
@@ -1753,73 +1791,235 @@ async def update_scene_trim(
 # Server-Sent Events (SSE) Endpoint
 # ============================================================================
 
-async def scene_update_generator(storyboard_id: str) -> AsyncGenerator[str, None]:
+# SSE tuning
+# Idle time before a keep-alive comment is sent. The timer restarts after every
+# frame, so busy streams send none; 25s stays just under the 30s idle timeout
+# of common load balancers (e.g. GCP).
+SSE_HEARTBEAT_SECONDS = 25
+SSE_QUEUE_MAXSIZE = 64  # Per-connection frame buffer; oldest frames are dropped when full
+SSE_MAX_DROPPED_FRAMES = 100  # Consecutive drops after which a slow client is disconnected (it reconnects primed)
+SSE_DEBOUNCE_SECONDS = 0.25  # Window over which rapid changes to one scene are coalesced
+SSE_GZIP_LEVEL = 6  # zlib level for gzipped SSE streams (frames are small; higher levels buy little)
+SSE_STORYBOARD_EXISTS_TTL_SECONDS = 30  # How long a positive existence check is reused on reconnect
+
+# Pre-encoded SSE frame pieces (StreamingResponse sends bytes as-is)
+SSE_SCENE_UPDATE_PREFIX = b"event: scene_update\ndata: "
+SSE_CONNECTED_PREFIX = b"event: connected\ndata: "
+SSE_FRAME_END = b"\n\n"
+SSE_KEEPALIVE = b": ping\n\n"
+
+# Storyboards recently confirmed to exist (EventSource reconnects aggressively)
+_storyboard_exists_cache: TTLCache = TTLCache(maxsize=10_000, ttl=SSE_STORYBOARD_EXISTS_TTL_SECONDS)
+
+
+async def _storyboard_exists(storyboard_id: str) -> bool:
+    """Check that a storyboard exists, reusing recent positive results."""
+    if storyboard_id in _storyboard_exists_cache:
+        return True
+
+    storyboard = await db.get_storyboard_async(storyboard_id)
+    if storyboard is None:
+        return False
+
+    _storyboard_exists_cache[storyboard_id] = True
+    return True
+
+
+def _enqueue_sse_frame(queue: asyncio.Queue, frame: Optional[bytes]) -> bool:
+    """Put a frame on a per-connection queue, dropping the oldest frame if full.
+
+    Returns True if a frame had to be dropped.
+    """
+    try:
+        queue.put_nowait(frame)
+        return False
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(frame)
+        return True
+
+
+class _SceneUpdateBroker:
+    """
+    Fans scene updates for one storyboard out to every SSE subscriber.
+
+    A single Firestore listener feeds the broker; each change is diffed and
+    serialized once and the same frame bytes are pushed to all subscriber
+    queues. Changes to a scene are coalesced over SSE_DEBOUNCE_SECONDS so a
+    flapping status produces at most one frame per window. The latest frame
+    per scene is kept so late subscribers start from the current state; it is
+    dropped when the scene is deleted.
+    """
+
+    def __init__(self, storyboard_id: str, loop: asyncio.AbstractEventLoop):
+        self.storyboard_id = storyboard_id
+        self.subscribers: set = set()
+        self._dropped: Dict[asyncio.Queue, int] = {}  # subscriber queue -> consecutive frames dropped
+        self._loop = loop
+        self._last_states: Dict[str, int] = {}  # scene_id -> hash of client-visible state
+        self._last_frames: dict = {}
+        self._pending: Dict[str, StoryboardScene] = {}  # scene_id -> latest unflushed snapshot
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._watch = db.watch_scenes_by_storyboard(storyboard_id, self._on_scenes)
+
+    def _on_scenes(self, scenes: List[StoryboardScene], removed_ids: List[str]) -> None:
+        # Runs on the Firestore listener thread; hand off to the event loop
+        try:
+            self._loop.call_soon_threadsafe(self.publish, scenes, removed_ids)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    def publish(self, scenes: List[StoryboardScene], removed_ids: List[str] = ()) -> None:
+        """Record scene snapshots and schedule a debounced flush for each scene.
+
+        Deleted scenes are forgotten, so new subscribers are not primed with them.
+        """
+        for scene_id in removed_ids:
+            self._last_states.pop(scene_id, None)
+            self._last_frames.pop(scene_id, None)
+            self._pending.pop(scene_id, None)
+            timer = self._timers.pop(scene_id, None)
+            if timer is not None:
+                timer.cancel()
+        for scene in scenes:
+            self._pending[scene.id] = scene
+            if scene.id not in self._timers:
+                self._timers[scene.id] = self._loop.call_later(
+                    SSE_DEBOUNCE_SECONDS, self._flush, scene.id
+                )
+
+    def _flush(self, scene_id: str) -> None:
+        """Push an SSE frame for the scene's latest snapshot if its client-visible state changed."""
+        self._timers.pop(scene_id, None)
+        scene = self._pending.pop(scene_id, None)
+        if scene is None:
+            return
+
+        state_hash = hash((
+            scene.state,
+            scene.generation_status.image,
+            scene.generation_status.video,
+            scene.image_url,
+            scene.video_url,
+            scene.error_message
+        ))
+
+        # Snapshots also fire for fields clients don't see (e.g. updated_at)
+        if self._last_states.get(scene.id) == state_hash:
+            return
+
+        # State changed, send update with BOTH statuses, formatted once.
+        # Same shape and key order as SSESceneUpdate, built directly for orjson.
+        # URLs stay explicit (null clears them client-side); error is omitted when unset.
+        payload = {
+            "scene_id": scene.id,
+            "state": scene.state,
+            "image_status": scene.generation_status.image,
+            "video_status": scene.generation_status.video,
+            "image_url": scene.image_url,
+            "video_url": scene.video_url,
+        }
+        if scene.error_message is not None:
+            payload["error"] = scene.error_message
+        frame = SSE_SCENE_UPDATE_PREFIX + orjson.dumps(payload) + SSE_FRAME_END
+        for queue in list(self.subscribers):
+            if _enqueue_sse_frame(queue, frame):
+                self._record_drop(queue)
+            else:
+                # Only consecutive drops count; a client that caught up starts over
+                self._dropped.pop(queue, None)
+
+        # Update last known state
+        self._last_states[scene.id] = state_hash
+        self._last_frames[scene.id] = frame
+
+    def _record_drop(self, queue: asyncio.Queue) -> None:
+        """Count a dropped frame; disconnect subscribers that drop too many in a row."""
+        dropped = self._dropped.get(queue, 0) + 1
+        self._dropped[queue] = dropped
+        if dropped <= SSE_MAX_DROPPED_FRAMES:
+            return
+
+        # Stop feeding the stuck client and tell its generator to close the stream
+        logger.warning("SSE subscriber for storyboard %s dropped %d frames, disconnecting", self.storyboard_id, dropped)
+        self.subscribers.discard(queue)
+        self._dropped.pop(queue, None)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber queue, primed with the current scene states."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_MAXSIZE)
+        for frame in self._last_frames.values():
+            _enqueue_sse_frame(queue, frame)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber; the last one out stops the Firestore listener."""
+        self.subscribers.discard(queue)
+        self._dropped.pop(queue, None)
+        if not self.subscribers:
+            # Watch.unsubscribe() joins the listener thread; keep it off the event loop
+            task = self._loop.create_task(asyncio.to_thread(self._watch.unsubscribe))
+            _watch_stop_tasks.add(task)
+            task.add_done_callback(_watch_stop_tasks.discard)
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+            self._pending.clear()
+            if _brokers.get(self.storyboard_id) is self:
+                del _brokers[self.storyboard_id]
+
+
+# One broker per storyboard with at least one connected SSE client
+_brokers: Dict[str, _SceneUpdateBroker] = {}
+
+# Listener shutdowns running in worker threads (referenced until they finish)
+_watch_stop_tasks: Set[asyncio.Task] = set()
+
+
+def _get_or_create_broker(storyboard_id: str) -> _SceneUpdateBroker:
+    """Get the storyboard's broker, starting its Firestore listener if needed."""
+    broker = _brokers.get(storyboard_id)
+    if broker is None:
+        broker = _SceneUpdateBroker(storyboard_id, asyncio.get_running_loop())
+        _brokers[storyboard_id] = broker
+    return broker
+
+
+async def scene_update_generator(storyboard_id: str) -> AsyncGenerator[bytes, None]:
     """
     Generate SSE events for scene updates.
 
-    This watches for changes to scenes in the storyboard and sends updates.
+    Frames come from the storyboard's shared broker through a bounded
+    per-connection queue, so idle storyboards cost no reads and a slow client
+    costs at most SSE_QUEUE_MAXSIZE frames of memory. When no frame arrives
+    within SSE_HEARTBEAT_SECONDS a keep-alive comment is sent so
+    intermediaries detect dead connections promptly.
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    # Track last known state for each scene
-    last_states = {}
-    
+    broker = _get_or_create_broker(storyboard_id)
+    queue = broker.subscribe()
+
     try:
         # Send initial connection success message
-        yield f"event: connected\ndata: {{'storyboard_id': '{storyboard_id}'}}\n\n"
+        yield SSE_CONNECTED_PREFIX + orjson.dumps({"storyboard_id": storyboard_id}) + SSE_FRAME_END
         logger.info(f"SSE connection established for storyboard {storyboard_id}")
-        
+
         while True:
             try:
-                # Get all scenes for this storyboard
-                scenes = db.get_scenes_by_storyboard(storyboard_id)
-
-                # Check for changes
-                for scene in scenes:
-                    current_state = {
-                        "state": scene.state,
-                        "image_status": scene.generation_status.image,
-                        "video_status": scene.generation_status.video,
-                        "image_url": scene.image_url,
-                        "video_url": scene.video_url,
-                        "error": scene.error_message
-                    }
-
-                    # Compare with last known state
-                    last_state = last_states.get(scene.id)
-                    
-                    if last_state != current_state:
-                        # State changed, send update with BOTH statuses
-                        update = SSESceneUpdate(
-                            scene_id=scene.id,
-                            state=scene.state,
-                            image_status=scene.generation_status.image,
-                            video_status=scene.generation_status.video,
-                            image_url=scene.image_url,
-                            video_url=scene.video_url,
-                            error=scene.error_message
-                        )
-
-                        # Format as SSE event
-                        data = f"event: scene_update\ndata: {update.model_dump_json()}\n\n"
-                        yield data
-
-                        # Update last known state
-                        last_states[scene.id] = current_state
-
-                # Send keepalive ping every poll cycle to prevent timeout
-                yield f": keepalive\n\n"
-                
-                # Wait before next poll
-                await asyncio.sleep(2)  # Poll every 2 seconds
-                
-            except Exception as e:
-                logger.error(f"Error in SSE update loop: {e}", exc_info=True)
-                # Send error to client
-                error_data = f"event: error\ndata: {{'error': 'Internal server error'}}\n\n"
-                yield error_data
-                await asyncio.sleep(5)  # Wait before retrying
+                frame = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # Keep-alive comment to prevent idle timeouts
+                yield SSE_KEEPALIVE
+                continue
+
+            if frame is None:
+                # Evicted by the broker for falling too far behind
+                return
+
+            yield frame
 
     except asyncio.CancelledError:
         logger.info(f"SSE connection cancelled for storyboard {storyboard_id}")
@@ -1827,6 +2027,8 @@ async def scene_update_generator(storyboard_id: str) -> AsyncGenerator[str, None
     except Exception as e:
         logger.error(f"Fatal error in SSE generator: {e}", exc_info=True)
         raise
+    finally:
+        broker.unsubscribe(queue)
 
 
 @router.get("/test-sse")
@@ -1836,8 +2038,6 @@ async def test_sse():
     Returns a simple heartbeat every second for 10 seconds.
     """
     async def heartbeat_generator():
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("SSE test endpoint called")
         
         try:
@@ -1859,22 +2059,64 @@ async def test_sse():
     )
 
 
+async def _gzip_sse_stream(frames: AsyncGenerator[bytes, None]) -> AsyncGenerator[bytes, None]:
+    """
+    Gzip an SSE stream frame by frame.
+
+    One compressor spans the connection so repeated JSON keys compress
+    against earlier frames; a sync flush after every frame makes each event
+    decodable by the browser immediately. When the stream ends (e.g. a slow
+    client is evicted) the gzip member is finished so the body is complete.
+    """
+    compressor = zlib.compressobj(SSE_GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    try:
+        async for frame in frames:
+            yield compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        # Final deflate block plus the gzip trailer (CRC32 and length)
+        yield compressor.flush(zlib.Z_FINISH)
+    finally:
+        await frames.aclose()
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows gzip.
+
+    Honors q-values: ``gzip;q=0`` (or ``*;q=0`` with gzip unlisted) refuses it.
+    """
+    wildcard_q = None
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard_q = q
+    return wildcard_q is not None and wildcard_q > 0
+
+
 @router.get("/{storyboard_id}/events")
-async def scene_updates_sse(storyboard_id: str):
+async def scene_updates_sse(storyboard_id: str, request: Request):
     """
     Server-Sent Events endpoint for real-time scene updates.
 
     Clients connect to this endpoint to receive real-time updates
     about scene generation progress (image/video generation status).
+    The stream is gzipped when the client accepts it (GZipMiddleware-style
+    buffering would hold frames back, so compression is done per frame here).
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     logger.info(f"SSE connection requested for storyboard {storyboard_id}")
     
     # Verify storyboard exists
-    storyboard = db.get_storyboard(storyboard_id)
-    if not storyboard:
+    if not await _storyboard_exists(storyboard_id):
         logger.warning(f"SSE connection rejected: Storyboard {storyboard_id} not found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1882,17 +2124,24 @@ async def scene_updates_sse(storyboard_id: str):
         )
 
     logger.info(f"Starting SSE stream for storyboard {storyboard_id}")
-    
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",  # Disable nginx buffering
+        "Vary": "Accept-Encoding",
+        # CORS headers for SSE
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "GET",
+        "Access-Control-Allow-Headers": "*",
+    }
+    stream = scene_update_generator(storyboard_id)
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        stream = _gzip_sse_stream(stream)
+
     return StreamingResponse(
-        scene_update_generator(storyboard_id),
+        stream,
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            # CORS headers for SSE
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET",
-            "Access-Control-Allow-Headers": "*",
-        }
+        headers=headers
     )
@@ -1,8 +1,15 @@
 """FastAPI router for video generation endpoints."""
+import asyncio
+import base64
+import logging
 import uuid
-from datetime import datetime
-from typing import Dict
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import time
+from datetime import datetime, timezone
+from typing import AsyncGenerator, Dict, Iterable, List, Optional, Set
+
+import orjson
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
 
 from app.models.video_models import (
     VideoGenerationRequest,
@@ -13,15 +20,137 @@ from app.models.video_models import (
     JobStatus
 )
 from app.services.replicate_service import ReplicateVideoService
+from app.database import db
+from app.config import settings
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/video", tags=["video"])
 
-# In-memory job tracking
-# In production, this should be replaced with Redis or a database
+# Live state of the jobs this process is running. Every job is also persisted
+# to Firestore (write-behind, see _flush_job), which is the source of truth
+# once a job has finished or when it is running on another worker.
+#
+# _jobs and the job bookkeeping below are only touched on the event loop
+# thread (progress callbacks are awaited there, never run via to_thread), so
+# they need no locks even on free-threaded builds. Code running in a worker
+# thread must hop back with loop.call_soon_threadsafe before mutating them.
 _jobs: Dict[str, VideoJobStatus] = {}
 
-# Initialize video service
-video_service = None  # Will be initialized on first request
+# Live status streams: job_id -> queues of (serialized snapshot, is_terminal)
+_job_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+# Seconds of silence before a keep-alive comment is sent on a status stream
+JOB_STREAM_HEARTBEAT_SECONDS = 15
+
+# Snapshots buffered per subscriber; only the latest matters, so the oldest
+# is dropped when a slow client falls behind
+JOB_STREAM_QUEUE_MAXSIZE = 16
+
+# Progress ticks for a job within this window are coalesced into one snapshot,
+# so an N-scene job serializes and persists O(duration / window) snapshots,
+# not O(events)
+JOB_STREAM_DEBOUNCE_SECONDS = 0.25
+
+# Jobs changed since their last flush (job_id -> scene numbers of changed
+# clips), and the flush task draining each one
+_dirty_jobs: Dict[str, Set[int]] = {}
+_flush_tasks: Dict[str, asyncio.Task] = {}
+
+_TERMINAL_STATUSES = {JobStatus.COMPLETED, JobStatus.FAILED}
+
+# Admission control: scenes queued or generating in this process may not
+# exceed this multiple of the Replicate video in-flight cap. Past that, new
+# jobs only add queueing delay, so they are rejected with 503 instead.
+VIDEO_ADMISSION_QUEUE_FACTOR = 4
+VIDEO_ADMISSION_RETRY_AFTER_SECONDS = 30
+
+
+class _JobTally:
+    """Running per-status clip counts and progress sum for an in-process job.
+
+    Kept alongside ``_jobs`` so clip updates adjust the job aggregates by
+    delta instead of rescanning every clip.
+    """
+
+    __slots__ = ("clips_by_scene", "status_counts", "progress_sum")
+
+    def __init__(self, clips: List[VideoClip]):
+        self.clips_by_scene: Dict[int, VideoClip] = {}
+        self.status_counts: Dict[JobStatus, int] = {status: 0 for status in JobStatus}
+        self.progress_sum = 0
+        for clip in clips:
+            self.clips_by_scene.setdefault(clip.scene_number, clip)
+            self.status_counts[clip.status] += 1
+            self.progress_sum += clip.progress_percent
+
+
+_tallies: Dict[str, _JobTally] = {}
+
+# Last formatted timestamp, keyed by the epoch second it was built for
+_clock_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string with second precision.
+
+    The string only changes once a second, so it is formatted once per second
+    and reused for every progress tick in between.
+    """
+    global _clock_cache
+    second = int(time.time())
+    cached_second, cached = _clock_cache
+    if second != cached_second:
+        cached = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _clock_cache = (second, cached)
+    return cached
+
+# Video service, created in the app lifespan (startup_video_service)
+video_service = None
+
+
+def startup_video_service() -> None:
+    """Create the video service up front (called from the FastAPI lifespan).
+
+    A missing Replicate token is logged rather than raised so the rest of the
+    API still starts; get_video_service() reports it per request.
+    """
+    global video_service
+    try:
+        video_service = ReplicateVideoService()
+    except ValueError as e:
+        logger.warning("Replicate video service not available: %s", e)
+
+
+async def shutdown_video_jobs() -> None:
+    """Record unfinished jobs as failed on shutdown (called from the FastAPI lifespan).
+
+    Jobs run as in-process background tasks, so they die with the process.
+    Without this, a job interrupted by a deploy or restart would stay
+    "processing" in Firestore forever and its clients would wait on it.
+    """
+    for task in list(_flush_tasks.values()):
+        task.cancel()
+
+    interrupted = [job for job in _jobs.values() if job.status not in _TERMINAL_STATUSES]
+    for job in interrupted:
+        job.status = JobStatus.FAILED
+        job.error = "Video generation was interrupted by a server restart"
+        job.updated_at = _now_iso()
+
+    if interrupted:
+        # One batched commit instead of a round trip per job, since shutdown
+        # is time-boxed by the process manager
+        try:
+            await db.update_video_jobs_async(
+                (job, _changed_clips(job.job_id, _dirty_jobs.get(job.job_id, ())))
+                for job in interrupted
+            )
+        except Exception as e:
+            logger.error("Failed to mark %d interrupted video job(s): %s", len(interrupted), e)
+            return
+        logger.warning("Marked %d interrupted video job(s) as failed", len(interrupted))
 
 
 def get_video_service() -> ReplicateVideoService:
@@ -38,36 +167,26 @@ def get_video_service() -> ReplicateVideoService:
     return video_service
 
 
-def _create_job(request: VideoGenerationRequest) -> str:
+async def _create_job(request: VideoGenerationRequest, clips: List[VideoClip]) -> str:
     """
     Create a new video generation job.
 
     Args:
         request: Video generation request with scenes
+        clips: Pending clips for the request's scenes, built by the caller
+            while validating them
 
     Returns:
         job_id: Unique identifier for the job
     """
-    job_id = str(uuid.uuid4())
-    now = datetime.utcnow().isoformat()
-
-    # Initialize clips for each scene
-    clips = [
-        VideoClip(
-            scene_number=scene.scene_number,
-            video_url=None,
-            duration=scene.duration,
-            status=JobStatus.PENDING,
-            progress_percent=0
-        )
-        for scene in request.scenes
-    ]
+    job_id = uuid.uuid4().hex
+    now = _now_iso()
 
     # Create job status
     job_status = VideoJobStatus(
         job_id=job_id,
         status=JobStatus.PENDING,
-        total_scenes=len(request.scenes),
+        total_scenes=len(clips),
         completed_scenes=0,
         failed_scenes=0,
         progress_percent=0,
@@ -78,36 +197,137 @@ def _create_job(request: VideoGenerationRequest) -> str:
         updated_at=now
     )
 
-    # Store in memory
+    # Track in memory first so admission control sees it immediately
     _jobs[job_id] = job_status
+    _tallies[job_id] = _JobTally(clips)
+    try:
+        await db.save_video_job_async(job_status)
+    except Exception:
+        del _jobs[job_id]
+        del _tallies[job_id]
+        raise
 
     return job_id
 
 
-def _update_job_progress(job_id: str):
+def _outstanding_scenes() -> int:
+    """Count scenes of in-process jobs that have not finished yet."""
+    return sum(
+        job.total_scenes - job.completed_scenes - job.failed_scenes
+        for job in _jobs.values()
+    )
+
+
+def _mark_dirty(job_id: str, scene_number: Optional[int] = None):
     """
-    Update overall job progress based on clip statuses.
+    Mark a job changed so its snapshot is published and persisted at the end
+    of the current debounce window.
 
     Args:
         job_id: Job identifier
+        scene_number: Scene whose clip changed, if any
     """
-    if job_id not in _jobs:
+    dirty_clips = _dirty_jobs.setdefault(job_id, set())
+    if scene_number is not None:
+        dirty_clips.add(scene_number)
+    if job_id not in _flush_tasks:
+        _flush_tasks[job_id] = asyncio.create_task(_flush_job(job_id))
+
+
+def _changed_clips(job_id: str, scene_numbers: Iterable[int]) -> List[VideoClip]:
+    """Look up a job's changed clips by scene number via its tally (no clip scan)."""
+    tally = _tallies.get(job_id)
+    if tally is None:
+        return []
+    clips_by_scene = tally.clips_by_scene
+    return [clips_by_scene[n] for n in scene_numbers if n in clips_by_scene]
+
+
+async def _flush_job(job_id: str):
+    """
+    Publish and persist a dirty job once per debounce window until it is clean.
+
+    Each write carries the job's summary fields plus only the clips changed
+    in the window. Writes for a job are serialized here, so Firestore never
+    sees an older update land after a newer one. A finished job is dropped from memory
+    after its final write.
+
+    Args:
+        job_id: Job identifier
+    """
+    try:
+        while job_id in _dirty_jobs:
+            await asyncio.sleep(JOB_STREAM_DEBOUNCE_SECONDS)
+            dirty_clips = _dirty_jobs.pop(job_id)
+            job = _jobs.get(job_id)
+            if job is None:
+                return
+
+            _publish_job(job_id)
+            try:
+                await db.update_video_job_async(job, _changed_clips(job_id, dirty_clips))
+            except Exception:
+                logger.exception("Failed to persist video job %s", job_id)
+
+        job = _jobs.get(job_id)
+        if job is not None and job.status in _TERMINAL_STATUSES:
+            del _jobs[job_id]
+            del _tallies[job_id]
+    finally:
+        del _flush_tasks[job_id]
+
+
+def _publish_job(job_id: str):
+    """
+    Push the job's current snapshot to every status stream subscriber.
+
+    Args:
+        job_id: Job identifier
+    """
+    subscribers = _job_subscribers.get(job_id)
+    if not subscribers or job_id not in _jobs:
         return
 
     job = _jobs[job_id]
+    snapshot = (orjson.dumps(job.model_dump(mode="json")), job.status in _TERMINAL_STATUSES)
+    for queue in subscribers:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(snapshot)
+
+
+def _job_summary(job: VideoJobStatus) -> tuple:
+    """The job fields _apply_job_progress derives, for change detection."""
+    return (job.completed_scenes, job.failed_scenes, job.progress_percent, job.status, job.error)
 
-    # Count completed and failed clips
-    completed = sum(1 for clip in job.clips if clip.status == JobStatus.COMPLETED)
-    failed = sum(1 for clip in job.clips if clip.status == JobStatus.FAILED)
-    processing = sum(1 for clip in job.clips if clip.status == JobStatus.PROCESSING)
+
+def _apply_job_progress(job: VideoJobStatus, tally: _JobTally) -> bool:
+    """
+    Recompute a job's aggregate progress and status from its clip tally.
+
+    Pure in-memory update on a job the caller already holds; the caller is
+    responsible for bumping updated_at and marking the job dirty.
+
+    Args:
+        job: Job to update
+        tally: The job's running clip tally
+
+    Returns:
+        True if any aggregate field changed
+    """
+    before = _job_summary(job)
+
+    # Read clip counts from the running tally
+    completed = tally.status_counts[JobStatus.COMPLETED]
+    failed = tally.status_counts[JobStatus.FAILED]
+    processing = tally.status_counts[JobStatus.PROCESSING]
 
     job.completed_scenes = completed
     job.failed_scenes = failed
 
     # Calculate overall progress (average of all clip progress)
     if job.clips:
-        total_progress = sum(clip.progress_percent for clip in job.clips)
-        job.progress_percent = total_progress // len(job.clips)
+        job.progress_percent = tally.progress_sum // len(job.clips)
 
     # Update overall job status
     if completed + failed == job.total_scenes:
@@ -123,7 +343,23 @@ def _update_job_progress(job_id: str):
     elif processing > 0 or completed > 0:
         job.status = JobStatus.PROCESSING
 
-    job.updated_at = datetime.utcnow().isoformat()
+    return _job_summary(job) != before
+
+
+def _update_job_progress(job_id: str):
+    """
+    Update overall job progress based on clip statuses.
+
+    Args:
+        job_id: Job identifier
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        return
+
+    if _apply_job_progress(job, _tallies[job_id]):
+        job.updated_at = _now_iso()
+        _mark_dirty(job_id)
 
 
 async def _update_clip_progress(job_id: str, scene_number: int, status: str, video_url: str = None, error: str = None):
@@ -137,29 +373,41 @@ async def _update_clip_progress(job_id: str, scene_number: int, status: str, vid
         video_url: Video URL if completed
         error: Error message if failed
     """
-    if job_id not in _jobs:
+    job = _jobs.get(job_id)
+    if job is None:
         return
 
-    job = _jobs[job_id]
-
-    # Find the clip and update it
-    for clip in job.clips:
-        if clip.scene_number == scene_number:
-            if status == "processing":
-                clip.status = JobStatus.PROCESSING
-                clip.progress_percent = 50
-            elif status == "completed":
-                clip.status = JobStatus.COMPLETED
-                clip.video_url = video_url
-                clip.progress_percent = 100
-            elif status == "failed":
-                clip.status = JobStatus.FAILED
-                clip.error = error
-                clip.progress_percent = 0
-            break
-
-    # Update overall job progress
-    _update_job_progress(job_id)
+    tally = _tallies[job_id]
+
+    # Find the clip and update it, moving the tally by the delta
+    clip = tally.clips_by_scene.get(scene_number)
+    clip_changed = False
+    if clip is not None:
+        before = (clip.status, clip.progress_percent, clip.video_url, clip.error)
+        tally.status_counts[clip.status] -= 1
+        tally.progress_sum -= clip.progress_percent
+        if status == "processing":
+            clip.status = JobStatus.PROCESSING
+            clip.progress_percent = 50
+        elif status == "completed":
+            clip.status = JobStatus.COMPLETED
+            clip.video_url = video_url
+            clip.progress_percent = 100
+        elif status == "failed":
+            clip.status = JobStatus.FAILED
+            clip.error = error
+            clip.progress_percent = 0
+        tally.status_counts[clip.status] += 1
+        tally.progress_sum += clip.progress_percent
+        clip_changed = (clip.status, clip.progress_percent, clip.video_url, clip.error) != before
+
+    # Update overall job progress on the job already in hand, then queue a
+    # single write covering both the clip and the aggregates. Repeated
+    # callbacks that change nothing (e.g. a retried "processing") are dropped.
+    job_changed = _apply_job_progress(job, tally)
+    if clip_changed or job_changed:
+        job.updated_at = _now_iso()
+        _mark_dirty(job_id, scene_number if clip_changed else None)
 
 
 async def _process_video_generation(job_id: str, request: VideoGenerationRequest):
@@ -182,19 +430,8 @@ async def _process_video_generation(job_id: str, request: VideoGenerationRequest
         # Update job status to processing
         job = _jobs[job_id]
         job.status = JobStatus.PROCESSING
-        job.updated_at = datetime.utcnow().isoformat()
-
-        # Prepare scenes data for video generation
-        scenes_data = [
-            {
-                "scene_number": scene.scene_number,
-                "seed_image_url": scene.seed_image_url,
-                "duration": scene.duration,
-                "description": scene.description,
-                "style_prompt": scene.style_prompt
-            }
-            for scene in request.scenes
-        ]
+        job.updated_at = _now_iso()
+        _mark_dirty(job_id)
 
         # Create progress callback
         async def progress_callback(scene_number: int, status: str, video_url: str = None, error: str = None):
@@ -202,7 +439,7 @@ async def _process_video_generation(job_id: str, request: VideoGenerationRequest
 
         # Generate videos in parallel
         results = await video_svc.generate_videos_parallel(
-            scenes=scenes_data,
+            scenes=request.scenes,
             progress_callback=progress_callback
         )
 
@@ -215,7 +452,8 @@ async def _process_video_generation(job_id: str, request: VideoGenerationRequest
             job = _jobs[job_id]
             job.status = JobStatus.FAILED
             job.error = f"Video generation failed: {str(e)}"
-            job.updated_at = datetime.utcnow().isoformat()
+            job.updated_at = _now_iso()
+            _mark_dirty(job_id)
 
 
 @router.post("/generate", response_model=VideoGenerationResponse)
@@ -247,19 +485,40 @@ async def generate_videos(
                 detail="At least one scene is required"
             )
 
-        # Validate all scenes have seed images
-        scenes_without_images = [
-            s.scene_number for s in request.scenes
-            if not s.seed_image_url
-        ]
+        # Validate all scenes have seed images, building the pending clips
+        # in the same pass
+        scenes_without_images = []
+        clips = []
+        for scene in request.scenes:
+            if not scene.seed_image_url:
+                scenes_without_images.append(scene.scene_number)
+            else:
+                clips.append(VideoClip(
+                    scene_number=scene.scene_number,
+                    video_url=None,
+                    duration=scene.duration,
+                    status=JobStatus.PENDING,
+                    progress_percent=0
+                ))
         if scenes_without_images:
             raise HTTPException(
                 status_code=400,
                 detail=f"Scenes missing seed images: {scenes_without_images}"
             )
 
+        # Shed load once the local backlog exceeds what Replicate can drain
+        # (an idle process always admits, however large the job)
+        max_outstanding = settings.REPLICATE_VIDEO_MAX_INFLIGHT * VIDEO_ADMISSION_QUEUE_FACTOR
+        outstanding = _outstanding_scenes()
+        if outstanding and outstanding + len(clips) > max_outstanding:
+            raise HTTPException(
+                status_code=503,
+                detail="Video generation is at capacity, please retry shortly",
+                headers={"Retry-After": str(VIDEO_ADMISSION_RETRY_AFTER_SECONDS)}
+            )
+
         # Create job
-        job_id = _create_job(request)
+        job_id = await _create_job(request, clips)
 
         # Start background video generation
         # This will be implemented in subtask 5.2
@@ -268,8 +527,8 @@ async def generate_videos(
         return VideoGenerationResponse(
             success=True,
             job_id=job_id,
-            message=f"Video generation job created for {len(request.scenes)} scenes",
-            total_scenes=len(request.scenes)
+            message=f"Video generation job created for {len(clips)} scenes",
+            total_scenes=len(clips)
         )
 
     except HTTPException:
@@ -299,15 +558,14 @@ async def get_video_status(job_id: str) -> VideoJobStatusResponse:
         VideoJobStatusResponse with current job status
     """
     try:
-        # Check if job exists
-        if job_id not in _jobs:
+        # Live state if it is running here, otherwise the persisted snapshot
+        job_status = _jobs.get(job_id) or await db.get_video_job_async(job_id)
+        if job_status is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Job {job_id} not found"
             )
 
-        job_status = _jobs[job_id]
-
         return VideoJobStatusResponse(
             success=True,
             job_status=job_status,
@@ -323,21 +581,143 @@ async def get_video_status(job_id: str) -> VideoJobStatusResponse:
         )
 
 
+async def _job_status_events(job: VideoJobStatus) -> AsyncGenerator[bytes, None]:
+    """
+    Yield SSE frames for a job until it reaches a terminal status.
+
+    Jobs not running in this process only get their current snapshot; the
+    client's EventSource reconnects for the next one.
+
+    Args:
+        job: Current job snapshot
+
+    Yields:
+        ``data:`` frames carrying job snapshots, and keep-alive comments
+    """
+    job_id = job.job_id
+    queue: asyncio.Queue = asyncio.Queue(maxsize=JOB_STREAM_QUEUE_MAXSIZE)
+    _job_subscribers.setdefault(job_id, set()).add(queue)
+    try:
+        yield b"data: " + orjson.dumps(job.model_dump(mode="json")) + b"\n\n"
+        if job.status in _TERMINAL_STATUSES or job_id not in _jobs:
+            return
+
+        while True:
+            try:
+                snapshot, terminal = await asyncio.wait_for(
+                    queue.get(), timeout=JOB_STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+                continue
+
+            yield b"data: " + snapshot + b"\n\n"
+            if terminal:
+                return
+    finally:
+        subscribers = _job_subscribers.get(job_id)
+        if subscribers is not None:
+            subscribers.discard(queue)
+            if not subscribers:
+                del _job_subscribers[job_id]
+
+
+@router.get("/status/{job_id}/stream")
+async def stream_video_status(job_id: str) -> StreamingResponse:
+    """
+    Stream status updates for a video generation job via Server-Sent Events.
+
+    Pushes a ``VideoJobStatus`` snapshot whenever the job changes, replacing
+    repeated polling of ``/status/{job_id}``. The stream closes once the job
+    is completed or failed.
+
+    Args:
+        job_id: Unique job identifier from /generate endpoint
+
+    Returns:
+        StreamingResponse with ``text/event-stream`` content
+    """
+    job = _jobs.get(job_id) or await db.get_video_job_async(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Job {job_id} not found"
+        )
+
+    return StreamingResponse(
+        _job_status_events(job),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+# Fields /jobs reports per job, fetched as a Firestore projection
+_JOB_SUMMARY_FIELDS = (
+    "job_id", "status", "progress_percent", "total_scenes", "completed_scenes", "failed_scenes"
+)
+
+
+def _encode_job_cursor(created_at: str, job_id: str) -> str:
+    """Build an opaque, URL-safe page cursor from the last job on a page."""
+    raw = orjson.dumps([created_at, job_id])
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode_job_cursor(cursor: str) -> tuple:
+    """
+    Decode a cursor built by _encode_job_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, job_id = orjson.loads(raw)
+        if not isinstance(job_id, str) or not job_id:
+            raise ValueError("missing job_id")
+        datetime.fromisoformat(created_at)
+    except (ValueError, TypeError, orjson.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, job_id
+
+
 # Admin/debug endpoint to list all jobs (can be removed in production)
 @router.get("/jobs")
-async def list_jobs():
-    """List all video generation jobs (for debugging)."""
+async def list_jobs(
+    limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+    """
+    List video generation jobs, newest first, one page at a time (for debugging).
+
+    ``count`` is the number of jobs on this page, not the total number of
+    jobs. Pass ``next_cursor`` back as ``cursor`` to fetch the next page; it
+    is null on the last page.
+    """
+    start_after = _decode_job_cursor(cursor) if cursor else None
+
+    jobs = await db.list_video_job_summaries_async(
+        _JOB_SUMMARY_FIELDS, limit=limit, start_after=start_after
+    )
+    next_cursor = None
+    if len(jobs) == limit:
+        next_cursor = _encode_job_cursor(jobs[-1]["created_at"], jobs[-1]["job_id"])
     return {
-        "total_jobs": len(_jobs),
+        "count": len(jobs),
+        "next_cursor": next_cursor,
         "jobs": [
             {
-                "job_id": job.job_id,
-                "status": job.status.value,
-                "progress": job.progress_percent,
-                "total_scenes": job.total_scenes,
-                "completed": job.completed_scenes,
-                "failed": job.failed_scenes
+                "job_id": job["job_id"],
+                "status": job["status"],
+                "progress": job["progress_percent"],
+                "total_scenes": job["total_scenes"],
+                "completed": job["completed_scenes"],
+                "failed": job["failed_scenes"]
             }
-            for job in _jobs.values()
+            for job in jobs
         ]
     }
@@ -1,4 +1,5 @@
 """Webhook endpoints for receiving Replicate prediction callbacks."""
+import asyncio
 import logging
 import hmac
 import hashlib
@@ -93,12 +94,13 @@ async def replicate_webhook(request: Request):
             detail="Missing required fields (id, status)"
         )
     
-    # Try to find scene by prediction ID (try both image and video)
-    scene = db.get_scene_by_image_prediction_id(prediction_id)
+    # Try to find scene by prediction ID (try both image and video).
+    # The lookups may query Firestore synchronously, so keep them off the event loop.
+    scene = await asyncio.to_thread(db.get_scene_by_image_prediction_id, prediction_id)
     if scene:
         await _handle_image_webhook(scene, prediction_status, output, error)
     else:
-        scene = db.get_scene_by_video_prediction_id(prediction_id)
+        scene = await asyncio.to_thread(db.get_scene_by_video_prediction_id, prediction_id)
         if scene:
             await _handle_video_webhook(scene, prediction_status, output, error)
         else:
@@ -131,14 +133,14 @@ async def _handle_image_webhook(
             logger.error(f"Unexpected output format: {type(output)}")
             scene.generation_status.image = "error"
             scene.error_message = "Unexpected output format from Replicate"
-            db.update_scene(scene.id, scene)
+            await db.update_scene_async(scene.id, scene)
             return
         
         # Persist image to Firebase Storage
         try:
             from app.services.replicate_service import get_replicate_service
             replicate_service = get_replicate_service()
-            persisted_url = replicate_service.persist_replicate_image(image_url, folder="scenes")
+            persisted_url = await replicate_service.persist_replicate_image(image_url, folder="scenes")
             
             # Update scene with persisted URL
             scene.image_url = persisted_url
@@ -171,7 +173,7 @@ async def _handle_image_webhook(
         logger.warning(f"Unexpected prediction status: {prediction_status}")
     
     # Save updated scene
-    db.update_scene(scene.id, scene)
+    await db.update_scene_async(scene.id, scene)
 
 
 async def _handle_video_webhook(
@@ -195,7 +197,7 @@ async def _handle_video_webhook(
             logger.error(f"Unexpected output format: {type(output)}")
             scene.generation_status.video = "error"
             scene.error_message = "Unexpected output format from Replicate"
-            db.update_scene(scene.id, scene)
+            await db.update_scene_async(scene.id, scene)
             return
         
         # Update scene with video URL
@@ -221,7 +223,7 @@ async def _handle_video_webhook(
         logger.warning(f"Unexpected prediction status: {prediction_status}")
     
     # Save updated scene
-    db.update_scene(scene.id, scene)
+    await db.update_scene_async(scene.id, scene)
 
 
 
@@ -1,8 +1,8 @@
 """Audio generation service using Replicate API."""
 import asyncio
 from typing import Optional, Dict, Any, List
-import replicate
 from app.config import settings
+from app.http import create_replicate_client
 
 
 class AudioGenerationService:
@@ -22,7 +22,7 @@ class AudioGenerationService:
             raise ValueError("Replicate API token not configured. Set REPLICATE_API_TOKEN in environment.")
 
         # Set the token for replicate client
-        self.client = replicate.Client(api_token=token)
+        self.client = create_replicate_client(token)
 
         # Determine which model to use based on environment
         if settings.is_development():
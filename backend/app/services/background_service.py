@@ -10,8 +10,6 @@ import json
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from openai import OpenAI
-import requests
 from PIL import Image
 import io
 
@@ -20,6 +18,7 @@ from ..models.asset_models import ImageDimensions
 from .base_asset_service import BaseAssetService
 from .replicate_service import ReplicateImageService
 from ..config import settings
+from ..http import create_openai_client, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +37,7 @@ class BackgroundAssetService(BaseAssetService):
         # Initialize replicate service only if token is available
         # Don't initialize here - will be checked in generate_backgrounds_from_brief
         self.replicate_service = None
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+        self.openai_client = create_openai_client(settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
     
     async def generate_backgrounds_from_brief(
         self,
@@ -76,36 +75,13 @@ class BackgroundAssetService(BaseAssetService):
         logger.info("Generating 6 background images in parallel...")
         image_urls = await self._generate_images_parallel(prompts)
         
-        # Step 3: Save each image as a background asset
+        # Step 3: Save each image as a background asset (concurrently)
         logger.info("Saving generated images as background assets...")
-        background_assets = []
-        
-        for idx, (prompt, image_url) in enumerate(zip(prompts, image_urls)):
-            if not image_url:
-                logger.warning(f"Image {idx + 1} generation failed, skipping...")
-                continue
-            
-            try:
-                # Download the image
-                response = requests.get(image_url, timeout=30)
-                response.raise_for_status()
-                image_data = response.content
-                
-                # Save as asset with user_id if provided
-                filename = f"background-{idx + 1}.png"
-                asset_response = self.save_asset(image_data, filename, user_id=brief.user_id)
-                
-                # Convert to status
-                asset_status = self.get_asset(asset_response.asset_id)
-                if asset_status:
-                    background_assets.append(asset_status)
-                    logger.info(f"Saved background {idx + 1} as asset {asset_response.asset_id}")
-                else:
-                    logger.error(f"Failed to retrieve asset status for {asset_response.asset_id}")
-                    
-            except Exception as e:
-                logger.error(f"Failed to save background {idx + 1}: {str(e)}")
-                continue
+        saved = await asyncio.gather(*(
+            self._save_background_image(idx, image_url, brief.user_id)
+            for idx, image_url in enumerate(image_urls)
+        ))
+        background_assets = [asset for asset in saved if asset is not None]
         
         if len(background_assets) == 0:
             raise RuntimeError("Failed to generate any background images")
@@ -113,6 +89,42 @@ class BackgroundAssetService(BaseAssetService):
         logger.info(f"Successfully generated {len(background_assets)} background assets")
         return background_assets
     
+    async def _save_background_image(
+        self,
+        idx: int,
+        image_url: Optional[str],
+        user_id: Optional[str]
+    ) -> Optional[BackgroundAssetStatus]:
+        """Download one generated image and save it as a background asset."""
+        if not image_url:
+            logger.warning(f"Image {idx + 1} generation failed, skipping...")
+            return None
+        
+        try:
+            # Download the image
+            response = await get_http_client().get(image_url, timeout=30)
+            response.raise_for_status()
+            image_data = response.content
+            
+            # Save as asset with user_id if provided (thumbnailing and Firebase
+            # uploads are blocking, so run them in a worker thread)
+            filename = f"background-{idx + 1}.png"
+            asset_response = await asyncio.to_thread(
+                self.save_asset, image_data, filename, user_id=user_id
+            )
+            
+            # Convert to status
+            asset_status = self.get_asset(asset_response.asset_id)
+            if asset_status:
+                logger.info(f"Saved background {idx + 1} as asset {asset_response.asset_id}")
+            else:
+                logger.error(f"Failed to retrieve asset status for {asset_response.asset_id}")
+            return asset_status
+                
+        except Exception as e:
+            logger.error(f"Failed to save background {idx + 1}: {str(e)}")
+            return None
+    
     async def _generate_background_prompts(
         self,
         brief: BackgroundGenerationRequest
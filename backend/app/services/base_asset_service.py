@@ -5,6 +5,8 @@ Generic service for managing asset uploads, validation, storage, and thumbnail g
 Uses Firebase Storage for cloud storage.
 """
 
+import sys
+import types
 import uuid
 import logging
 import tempfile
@@ -16,6 +18,7 @@ import io
 
 from ..models.asset_models import AssetUploadResponse, AssetStatus, ImageDimensions
 from ..services.firebase_storage_service import get_firebase_storage_service
+from ..utils.image_utils import fit_within
 
 logger = logging.getLogger(__name__)
 
@@ -113,10 +116,8 @@ class BaseAssetService(Generic[T, S]):
         Returns:
             Thumbnail image (512x512)
         """
-        # Create thumbnail maintaining aspect ratio
-        # thumbnail() modifies in place but preserves aspect ratio
-        img = image.copy()
-        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        # Resize maintaining aspect ratio (no full-resolution copy needed)
+        img = fit_within(image, size)
         
         # Create square canvas with appropriate background
         if img.mode == 'RGBA':
@@ -182,7 +183,7 @@ class BaseAssetService(Generic[T, S]):
             img = img.convert('RGB')
 
         # Generate asset_id
-        asset_id = str(uuid.uuid4())
+        asset_id = uuid.uuid4().hex
 
         # Determine format and extension (use saved format)
         img_format = original_format.lower()
@@ -210,7 +211,6 @@ class BaseAssetService(Generic[T, S]):
                 img.save(original_temp_path, 'JPEG', quality=95, optimize=True)
 
             # Upload original to Firebase
-            print(f"[Asset Upload] Uploading {filename} to Firebase Storage...")
             logger.info(f"Uploading {filename} to Firebase Storage...")
             public_url = self.firebase_service.upload_image(
                 original_temp_path,
@@ -223,7 +223,6 @@ class BaseAssetService(Generic[T, S]):
             if not public_url:
                 raise ValueError("Failed to upload original image to Firebase")
 
-            print(f"[Asset Upload] ✓ Successfully uploaded to Firebase Storage: {public_url}")
             logger.info(f"Successfully uploaded to Firebase Storage: {public_url}")
 
         # Generate and save thumbnail
@@ -244,7 +243,6 @@ class BaseAssetService(Generic[T, S]):
                 thumb.save(thumb_temp_path, 'JPEG', quality=90, optimize=True)
 
             # Upload thumbnail to Firebase
-            print(f"[Asset Upload] Uploading thumbnail for {filename} to Firebase Storage...")
             logger.info(f"Uploading thumbnail for {filename} to Firebase Storage...")
             public_thumbnail_url = self.firebase_service.upload_image(
                 thumb_temp_path,
@@ -257,7 +255,6 @@ class BaseAssetService(Generic[T, S]):
             if not public_thumbnail_url:
                 raise ValueError("Failed to upload thumbnail to Firebase")
 
-            print(f"[Asset Upload] ✓ Successfully uploaded thumbnail to Firebase Storage: {public_thumbnail_url}")
             logger.info(f"Successfully uploaded thumbnail to Firebase Storage: {public_thumbnail_url}")
 
         # Extract metadata
@@ -388,7 +385,6 @@ class BaseAssetService(Generic[T, S]):
 
         if deleted:
             logger.info(f"Deleted asset from database: {asset_id}")
-            print(f"[Asset] ✓ Deleted asset: {asset_id}")
         else:
             logger.warning(f"Asset not found for deletion: {asset_id}")
 
@@ -403,3 +399,42 @@ class BaseAssetService(Generic[T, S]):
         return None
 
 
+def create_asset_service_class(
+    name: str,
+    response_class: type[T],
+    status_class: type[S],
+    default_upload_dir: Path,
+) -> type[BaseAssetService]:
+    """
+    Build a BaseAssetService subclass for an asset type with no custom behaviour.
+
+    Args:
+        name: Asset type name, used as the API prefix (e.g. "brand")
+        response_class: Upload response model for this asset type
+        status_class: Status model for this asset type
+        default_upload_dir: Default upload directory
+
+    Returns:
+        The generated ``{Name}AssetService`` class
+    """
+    def __init__(self, upload_dir: Path = default_upload_dir):
+        BaseAssetService.__init__(
+            self,
+            upload_dir=upload_dir,
+            api_prefix=name,
+            response_class=response_class,
+            status_class=status_class
+        )
+
+    namespace = {
+        "__init__": __init__,
+        "__doc__": f"Service for managing {name} assets.",
+        # Report the calling module, as namedtuple does, rather than "types"
+        "__module__": sys._getframe(1).f_globals.get("__name__", __name__),
+    }
+
+    return types.new_class(
+        f"{name.title()}AssetService",
+        (BaseAssetService[response_class, status_class],),
+        exec_body=lambda ns: ns.update(namespace)
+    )
@@ -5,10 +5,10 @@ import asyncio
 from typing import List, Dict, Any, Optional, Tuple
 import ffmpeg
 from pathlib import Path
-import httpx
 import hashlib
 from datetime import datetime
 from app.config import settings
+from app.http import get_http_client
 
 
 class FFmpegCompositionService:
@@ -48,15 +48,15 @@ class FFmpegCompositionService:
             # Convert relative URLs to full URLs
             full_url = settings.to_full_url(url)
             
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.get(full_url)
-                response.raise_for_status()
+            client = get_http_client()
+            response = await client.get(full_url, timeout=120.0)
+            response.raise_for_status()
 
-                with open(destination, "wb") as f:
-                    f.write(response.content)
+            with open(destination, "wb") as f:
+                f.write(response.content)
 
-                print(f"✓ Downloaded: {destination.name}")
-                return True
+            print(f"✓ Downloaded: {destination.name}")
+            return True
 
         except Exception as e:
             print(f"✗ Failed to download {url}: {str(e)}")
@@ -4,7 +4,8 @@ Firebase Storage Service
 Uploads images to Firebase Storage and returns public URLs.
 """
 import logging
-from typing import Optional
+import os
+from typing import BinaryIO, Optional
 from pathlib import Path
 import uuid
 
@@ -14,6 +15,29 @@ logger = logging.getLogger(__name__)
 _firebase_app = None
 _storage_bucket = None
 
+# Resumable upload chunk size: bounds upload memory to one chunk per blob
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Largest image upload_image will send (matches the asset upload validation limit)
+MAX_IMAGE_UPLOAD_SIZE = 50 * 1024 * 1024
+
+# Content types for the extensions we upload; avoids initializing mimetypes
+_EXT_TO_MIME = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.webp': 'image/webp',
+    '.gif': 'image/gif',
+    '.mp4': 'video/mp4',
+    '.mov': 'video/quicktime',
+    '.webm': 'video/webm',
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+}
+
+# Singleton service instance
+_storage_service: Optional["FirebaseStorageService"] = None
+
 
 def _initialize_firebase():
     """Initialize Firebase Admin SDK (only once)."""
@@ -39,11 +63,8 @@ def _initialize_firebase():
         # Get bucket name from settings or credentials
         bucket_name = settings.FIREBASE_STORAGE_BUCKET
         if not bucket_name:
-            # Try to get project_id from credentials and construct default bucket name
-            import json
-            with open(creds_path, 'r') as f:
-                creds_data = json.load(f)
-            project_id = creds_data.get('project_id', '')
+            # Construct default bucket name from the already-parsed credentials
+            project_id = cred.project_id
             if project_id:
                 # Try new format first (.firebasestorage.app), then fall back to old format (.appspot.com)
                 # Newer Firebase projects use .firebasestorage.app
@@ -67,16 +88,13 @@ def _initialize_firebase():
             _storage_bucket = storage.bucket()
         
         logger.info(f"Firebase Storage initialized with bucket: {bucket_name}")
-        print(f"[Firebase Storage] ✓ Initialized with bucket: {bucket_name}")
         return True
         
     except ImportError:
         logger.warning("firebase-admin package not installed. Run: pip install firebase-admin")
-        print("[Firebase Storage] ⚠️  firebase-admin not installed")
         return False
     except Exception as e:
         logger.error(f"Error initializing Firebase: {e}", exc_info=True)
-        print(f"[Firebase Storage] ❌ Initialization error: {e}")
         return False
 
 
@@ -87,6 +105,7 @@ class FirebaseStorageService:
         """Initialize Firebase Storage service."""
         if not _initialize_firebase():
             raise ValueError("Firebase Storage could not be initialized")
+        self._bucket = _storage_bucket
     
     def upload_image(self, image_path: Path, folder: str = "assets") -> Optional[str]:
         """
@@ -99,55 +118,91 @@ class FirebaseStorageService:
         Returns:
             Public URL to the uploaded image, or None if upload failed
         """
-        if not image_path.exists():
+        # One open + fstat checks existence and size without separate stat calls
+        try:
+            f = image_path.open('rb')
+        except FileNotFoundError:
             logger.error(f"Image file not found: {image_path}")
             return None
         
-        if _storage_bucket is None:
-            logger.error("Firebase Storage not initialized")
-            return None
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size > MAX_IMAGE_UPLOAD_SIZE:
+                # Refuse before opening a resumable upload session
+                logger.error(
+                    f"Image too large to upload: {image_path} ({size} bytes, max {MAX_IMAGE_UPLOAD_SIZE})"
+                )
+                return None
+            return self.upload_stream(
+                f,
+                folder=folder,
+                extension=image_path.suffix,
+                size=size,
+            )
+    
+    def upload_stream(
+        self,
+        stream: BinaryIO,
+        folder: str = "assets",
+        extension: str = "",
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        Upload a binary stream to Firebase Storage and return the public URL.
+        
+        The stream is sent in UPLOAD_CHUNK_SIZE pieces, so large files
+        (e.g. scene videos) are never held in memory as a whole.
         
+        Args:
+            stream: Readable binary file-like object, positioned at the start
+            folder: Folder path in Firebase Storage (default: "assets")
+            extension: File extension including the dot (e.g. ".png")
+            content_type: MIME type; looked up from the extension if omitted
+            size: Number of bytes to upload, if known
+            
+        Returns:
+            Public URL to the uploaded file, or None if upload failed
+        """
         try:
             # Generate unique filename to avoid conflicts
-            file_extension = image_path.suffix
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
+            unique_filename = f"{uuid.uuid4().hex}{extension}"
             blob_path = f"{folder}/{unique_filename}"
+            if content_type is None:
+                content_type = _EXT_TO_MIME.get(extension.lower(), 'application/octet-stream')
             
-            print(f"[Firebase Storage] Uploading image to Firebase Storage: {image_path.name}")
-            logger.info(f"Uploading image to Firebase Storage: {image_path.name} -> {blob_path}")
+            logger.info(f"Uploading to Firebase Storage: {blob_path}")
             
             # Upload file to Firebase Storage
-            blob = _storage_bucket.blob(blob_path)
-            blob.upload_from_filename(str(image_path))
-            
-            # Make the blob publicly accessible
-            blob.make_public()
+            blob = self._bucket.blob(blob_path, chunk_size=UPLOAD_CHUNK_SIZE)
+            blob.upload_from_file(stream, size=size, content_type=content_type)
             
-            # Get public URL
+            # Public read is granted bucket-wide (allUsers:objectViewer), so
+            # the URL is built locally instead of a make_public() ACL round trip
             public_url = blob.public_url
             
-            print(f"[Firebase Storage] ✓ Successfully uploaded! Public URL: {public_url}")
             logger.info(f"Successfully uploaded to Firebase Storage: {public_url}")
             
             return public_url
             
         except Exception as e:
             logger.error(f"Error uploading to Firebase Storage: {e}", exc_info=True)
-            print(f"[Firebase Storage] ❌ Upload error: {e}")
             return None
 
 
 def get_firebase_storage_service() -> Optional[FirebaseStorageService]:
     """Get Firebase Storage service instance. Returns None if not configured."""
+    global _storage_service
+    if _storage_service is not None:
+        return _storage_service
+
     try:
         if not _initialize_firebase():
-            print("[Firebase Storage] ⚠️  Firebase Storage not configured. Public URL uploads will be skipped.")
             logger.warning("Firebase Storage not configured. Public URL uploads will be skipped.")
             return None
         
-        return FirebaseStorageService()
+        _storage_service = FirebaseStorageService()
+        return _storage_service
     except Exception as e:
         logger.warning(f"Could not create Firebase Storage service: {e}")
-        print(f"[Firebase Storage] ⚠️  Service creation failed: {e}")
         return None
-
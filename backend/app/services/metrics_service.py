@@ -2,9 +2,10 @@
 from datetime import datetime, timedelta
 from typing import Dict, List
 from collections import defaultdict
-import json
 from pathlib import Path
 
+import orjson
+
 
 class CompositeMetrics:
     """
@@ -142,28 +143,24 @@ class CompositeMetrics:
         """Save metrics to disk."""
         self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert defaultdict to dict for JSON serialization
-        serializable = dict(self.metrics)
-        serializable["daily_generations"] = dict(serializable["daily_generations"])
-        
-        with open(self.metrics_file, 'w') as f:
-            json.dump(serializable, f, indent=2)
+        # Serialize in one orjson call and write once; json.dump streams
+        # many small writes and runs on every recorded call
+        self.metrics_file.write_bytes(orjson.dumps(self.metrics, option=orjson.OPT_INDENT_2))
     
     def load_metrics(self):
         """Load metrics from disk."""
         if self.metrics_file.exists():
             try:
-                with open(self.metrics_file, 'r') as f:
-                    loaded = json.load(f)
-                    
-                    # Merge loaded metrics
-                    self.metrics.update(loaded)
-                    
-                    # Convert daily_generations back to defaultdict
-                    self.metrics["daily_generations"] = defaultdict(
-                        int,
-                        loaded.get("daily_generations", {})
-                    )
+                loaded = orjson.loads(self.metrics_file.read_bytes())
+                
+                # Merge loaded metrics
+                self.metrics.update(loaded)
+                
+                # Convert daily_generations back to defaultdict
+                self.metrics["daily_generations"] = defaultdict(
+                    int,
+                    loaded.get("daily_generations", {})
+                )
             except Exception as e:
                 print(f"[Metrics] Failed to load metrics: {e}")
 
@@ -1,6 +1,6 @@
 """Mood generation service for extracting distinct visual style directions from creative briefs."""
 from typing import List, Dict, Any
-from openai import OpenAI
+from app.http import create_openai_client
 from app.config import settings
 
 
@@ -9,7 +9,7 @@ class MoodGenerationService:
     
     def __init__(self):
         """Initialize the mood generation service with OpenAI client."""
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+        self.openai_client = create_openai_client(settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
     
     async def generate_mood_directions(
         self, 
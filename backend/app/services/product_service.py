@@ -20,6 +20,7 @@ from ..models.product_models import (
     ImageDimensions
 )
 from .firebase_storage_service import get_firebase_storage_service
+from ..utils.image_utils import fit_within
 
 logger = logging.getLogger(__name__)
 
@@ -110,10 +111,8 @@ class ProductImageService:
         Returns:
             Thumbnail image (512x512)
         """
-        # Create thumbnail maintaining aspect ratio
-        # thumbnail() modifies in place but preserves aspect ratio
-        img = image.copy()
-        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        # Resize maintaining aspect ratio (no full-resolution copy needed)
+        img = fit_within(image, size)
         
         # Create square canvas with appropriate background
         if img.mode == 'RGBA':
@@ -178,7 +177,7 @@ class ProductImageService:
             img = img.convert('RGB')
 
         # Generate product_id
-        product_id = str(uuid.uuid4())
+        product_id = uuid.uuid4().hex
 
         # Determine format and extension (use saved format)
         img_format = original_format.lower()
@@ -91,3 +91,31 @@ def get_kontext_rate_limiter() -> KontextRateLimiter:
     
     return _kontext_limiter
 
+
+
+# Per-model-family caps on in-flight Replicate requests
+_replicate_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def get_replicate_semaphore(kind: str = "image") -> asyncio.Semaphore:
+    """
+    Get or create the semaphore bounding in-flight Replicate calls.
+
+    Image and video models have separate quotas on Replicate, so each model
+    family gets its own cap; a burst of video jobs can't starve images.
+
+    Args:
+        kind: Model family ("image" or "video")
+    """
+    semaphore = _replicate_semaphores.get(kind)
+
+    if semaphore is None:
+        from app.config import settings
+        limit = (
+            settings.REPLICATE_VIDEO_MAX_INFLIGHT if kind == "video"
+            else settings.REPLICATE_MAX_INFLIGHT
+        )
+        semaphore = asyncio.Semaphore(limit)
+        _replicate_semaphores[kind] = semaphore
+
+    return semaphore
@@ -1,10 +1,7 @@
 """Replicate API service for image and video generation."""
 import asyncio
 from typing import List, Dict, Any, Optional
-import replicate
-import requests
 import tempfile
-import uuid
 from pathlib import Path
 from PIL import Image
 import io
@@ -12,12 +9,41 @@ import base64
 import time
 import logging
 from app.config import settings
-from app.services.rate_limiter import get_kontext_rate_limiter
+from app.http import create_replicate_client, get_http_client
+from app.services.rate_limiter import get_kontext_rate_limiter, get_replicate_semaphore
 from app.services.metrics_service import get_composite_metrics
+from app.models.video_models import SceneVideoInput
 
 logger = logging.getLogger(__name__)
 
 
+async def _run_with_permit(semaphore: asyncio.Semaphore, timeout: float, func, *args, **kwargs):
+    """
+    Run a blocking Replicate call in a worker thread while holding a semaphore permit.
+
+    The permit is released when the thread finishes, not when the caller
+    stops waiting: on timeout (or cancellation) the Replicate run keeps going
+    in its thread, so it must keep counting against the in-flight cap.
+
+    Raises:
+        asyncio.TimeoutError: If the call does not finish within timeout seconds
+    """
+    await semaphore.acquire()
+    try:
+        future = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+    except BaseException:
+        semaphore.release()
+        raise
+
+    def _done(done: asyncio.Future) -> None:
+        semaphore.release()
+        if not done.cancelled():
+            done.exception()  # Mark retrieved; an abandoned run's error is not ours to raise
+
+    future.add_done_callback(_done)
+    return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+
+
 class ReplicateImageService:
     """Service for generating images using Replicate API."""
     
@@ -42,7 +68,7 @@ class ReplicateImageService:
             raise ValueError("Replicate API token not configured. Set REPLICATE_API_TOKEN in environment.")
         
         # Set the token for replicate client
-        self.client = replicate.Client(api_token=token)
+        self.client = create_replicate_client(token)
         
         # Determine which model to use based on environment
         if settings.REPLICATE_IMAGE_MODEL:
@@ -113,13 +139,13 @@ class ReplicateImageService:
         
         try:
             # Run the model asynchronously with timeout
-            output = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self.client.run,
-                    model_id,
-                    input=input_params
-                ),
-                timeout=timeout
+            # The permit is held until the run's thread finishes, even past the timeout
+            output = await _run_with_permit(
+                get_replicate_semaphore("image"),
+                timeout,
+                self.client.run,
+                model_id,
+                input=input_params
             )
             
             # Handle different output formats
@@ -285,10 +311,14 @@ class ReplicateImageService:
         prompt = ", ".join(components)
         return prompt
 
-    def persist_replicate_image(self, replicate_url: str, folder: str = "generated") -> str:
+    async def persist_replicate_image(self, replicate_url: str, folder: str = "generated") -> str:
         """
         Download a Replicate-generated image and upload to Firebase Storage for permanent URL.
         
+        The download goes through the shared async HTTP pool (no per-call TLS
+        handshake) into a spooled buffer that only spills to disk for large
+        files; the blocking upload runs in a worker thread.
+        
         Args:
             replicate_url: Temporary Replicate image URL (expires in 1 hour)
             folder: Folder path in Firebase Storage (e.g., "moods", "scenes")
@@ -301,7 +331,10 @@ class ReplicateImageService:
             return replicate_url
         
         try:
-            from app.services.firebase_storage_service import get_firebase_storage_service
+            from app.services.firebase_storage_service import (
+                UPLOAD_CHUNK_SIZE,
+                get_firebase_storage_service,
+            )
             
             # Get Firebase Storage service
             storage_service = get_firebase_storage_service()
@@ -309,43 +342,32 @@ class ReplicateImageService:
                 logger.info(f"Firebase Storage not configured, using temporary Replicate URL")
                 return replicate_url
             
-            # Download image from Replicate
-            print(f"[Image Persistence] Downloading image from Replicate...")
-            response = requests.get(replicate_url, timeout=30)
-            response.raise_for_status()
-            
-            # Save to temporary file
-            temp_dir = Path(tempfile.gettempdir()) / "replicate_persist"
-            temp_dir.mkdir(exist_ok=True)
-            
-            # Determine file extension from content-type or URL
-            content_type = response.headers.get('content-type', 'image/png')
-            if 'jpeg' in content_type or 'jpg' in content_type:
-                ext = '.jpg'
-            elif 'webp' in content_type:
-                ext = '.webp'
-            else:
-                ext = '.png'
-            
-            temp_filename = f"replicate_{uuid.uuid4()}{ext}"
-            temp_path = temp_dir / temp_filename
-            
-            with open(temp_path, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"[Image Persistence] Uploading to Firebase Storage in folder '{folder}'...")
-            
-            # Upload to Firebase Storage
-            firebase_url = storage_service.upload_image(temp_path, folder=folder)
-            
-            # Clean up temp file
-            try:
-                temp_path.unlink()
-            except Exception:
-                pass
+            logger.debug("Downloading image from Replicate for persistence")
+            with tempfile.SpooledTemporaryFile(max_size=UPLOAD_CHUNK_SIZE) as buffer:
+                async with get_http_client().stream("GET", replicate_url, timeout=30) as response:
+                    response.raise_for_status()
+                    
+                    # Determine file extension from content-type or URL
+                    content_type = response.headers.get('content-type', 'image/png')
+                    if 'jpeg' in content_type or 'jpg' in content_type:
+                        ext = '.jpg'
+                    elif 'webp' in content_type:
+                        ext = '.webp'
+                    else:
+                        ext = '.png'
+                    
+                    async for chunk in response.aiter_bytes():
+                        buffer.write(chunk)
+                
+                size = buffer.tell()
+                buffer.seek(0)
+                
+                logger.debug("Uploading persisted image to Firebase folder %s", folder)
+                firebase_url = await asyncio.to_thread(
+                    storage_service.upload_stream, buffer, folder=folder, extension=ext, size=size
+                )
             
             if firebase_url:
-                print(f"[Image Persistence] ✓ Successfully persisted image to Firebase Storage")
                 logger.info(f"Persisted Replicate image to Firebase: {firebase_url}")
                 return firebase_url
             else:
@@ -354,7 +376,6 @@ class ReplicateImageService:
                 
         except Exception as e:
             logger.warning(f"Failed to persist Replicate image: {e}. Using original URL.")
-            print(f"[Image Persistence] ⚠️  Persistence failed: {e}")
             return replicate_url
 
     def build_scene_seed_prompt(
@@ -542,11 +563,12 @@ class ReplicateImageService:
             "safety_filter_level": "block_only_high"
         }
         
-        output = await asyncio.to_thread(
-            self.client.run,
-            "google/nano-banana-pro",
-            input=input_params
-        )
+        async with get_replicate_semaphore("image"):
+            output = await asyncio.to_thread(
+                self.client.run,
+                "google/nano-banana-pro",
+                input=input_params
+            )
         
         # Extract image URL from nano-banana-pro output
         if not output:
@@ -567,7 +589,8 @@ class ReplicateImageService:
         print(f"[Product Composite] Compositing product onto scene...")
         
         # Download background image
-        bg_response = requests.get(bg_image_url)
+        bg_response = await get_http_client().get(bg_image_url)
+        bg_response.raise_for_status()
         bg_image = Image.open(io.BytesIO(bg_response.content))
         
         # Load product image
@@ -581,14 +604,11 @@ class ReplicateImageService:
             max_product_height_percent=60
         )
         
-        # Save composited image to temp file for Firebase upload
-        temp_dir = Path(tempfile.gettempdir()) / "product_composites"
-        temp_dir.mkdir(exist_ok=True)
-
-        composite_filename = f"composite_{uuid.uuid4()}.png"
-        composite_path = temp_dir / composite_filename
-
-        composited.save(composite_path, 'PNG')
+        # Encode in memory and stream straight to Firebase (no temp file)
+        composite_buffer = io.BytesIO()
+        composited.save(composite_buffer, 'PNG')
+        composite_size = composite_buffer.tell()
+        composite_buffer.seek(0)
 
         # Upload to Firebase Storage
         print(f"[Product Composite] Uploading composite to Firebase Storage...")
@@ -599,10 +619,9 @@ class ReplicateImageService:
             if not storage_service:
                 raise ValueError("Firebase Storage not configured")
 
-            firebase_url = storage_service.upload_image(composite_path, folder="composites")
-
-            # Clean up temp file
-            composite_path.unlink()
+            firebase_url = storage_service.upload_stream(
+                composite_buffer, folder="composites", extension=".png", size=composite_size
+            )
 
             if not firebase_url:
                 raise ValueError("Failed to upload to Firebase Storage")
@@ -612,9 +631,6 @@ class ReplicateImageService:
             return firebase_url
 
         except Exception as e:
-            # Clean up temp file
-            if composite_path.exists():
-                composite_path.unlink()
             logger.error(f"Failed to upload composite to Firebase Storage: {e}")
             print(f"[Product Composite] ❌ Firebase upload failed: {e}")
             raise
@@ -687,6 +703,12 @@ class ReplicateImageService:
         new_prod_width = int(prod_width * scale_factor)
         new_prod_height = int(prod_height * scale_factor)
         
+        # A not-yet-decoded JPEG product is decoded at the smallest DCT scale
+        # (1/2, 1/4, 1/8) that still covers the target size, so LANCZOS runs on
+        # a fraction of the pixels; draft() is a no-op for other formats
+        if scale_factor < 1.0 and new_prod_width > 0 and new_prod_height > 0:
+            product.draft(product.mode, (new_prod_width, new_prod_height))
+        
         # Resize product using LANCZOS (highest quality resampling)
         product_resized = product.resize(
             (new_prod_width, new_prod_height),
@@ -740,29 +762,32 @@ class ReplicateImageService:
         if file_size > max_size:
             raise Exception(f"Image too large: {file_size} bytes (max {max_size})")
         
+        # Encoding (and any recompression) is CPU/disk bound; keep it off the event loop
+        return await asyncio.to_thread(self._encode_image_file, path, file_size)
+    
+    @staticmethod
+    def _encode_image_file(path: Path, file_size: int) -> str:
+        """
+        Read (recompressing if large) and base64 encode an image file.
+        
+        Large images are recompressed into memory instead of a temp file that
+        is written and read back, and the bytes are encoded straight from the
+        buffer without another copy.
+        """
         # Check if compression needed (5-10MB)
         if file_size > 5 * 1024 * 1024:
-            print(f"[Image Encoding] Compressing large image: {file_size} bytes")
-            image = Image.open(image_path)
-            
-            # Compress to temporary file
-            temp_path = Path(tempfile.gettempdir()) / f"compressed_{uuid.uuid4()}.png"
-            image.save(temp_path, 'PNG', optimize=True, quality=85)
-            
-            # Read compressed file
-            with open(temp_path, 'rb') as f:
-                image_data = f.read()
-            
-            # Clean up temp file
-            temp_path.unlink()
+            logger.debug("Compressing large image: %s bytes", file_size)
+            buffer = io.BytesIO()
+            with Image.open(path) as image:
+                image.save(buffer, 'PNG', optimize=True)
+            image_data = buffer.getbuffer()
         else:
             # Read file directly
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
+            image_data = path.read_bytes()
         
         # Encode to base64
-        encoded = base64.b64encode(image_data).decode('utf-8')
-        print(f"[Image Encoding] Encoded {len(image_data)} bytes to {len(encoded)} base64 chars")
+        encoded = base64.b64encode(image_data).decode('ascii')
+        logger.debug("Encoded %s bytes to %s base64 chars", len(image_data), len(encoded))
         
         return encoded
     
@@ -778,7 +803,6 @@ class ReplicateImageService:
         Returns:
             Publicly accessible URL to image
         """
-        print(f"[Image Upload] Uploading to Firebase Storage...")
         try:
             from app.services.firebase_storage_service import get_firebase_storage_service
             storage_service = get_firebase_storage_service()
@@ -791,12 +815,11 @@ class ReplicateImageService:
             if not firebase_url:
                 raise ValueError("Failed to upload to Firebase Storage")
 
-            print(f"[Image Upload] ✓ Uploaded to Firebase Storage: {firebase_url}")
+            logger.debug("Uploaded temp image to Firebase Storage: %s", firebase_url)
             return firebase_url
 
         except Exception as e:
             logger.error(f"Failed to upload to Firebase Storage: {e}")
-            print(f"[Image Upload] ❌ Firebase upload failed: {e}")
             raise
     
     async def _cleanup_temp_file(self, file_path: Path, delay: int = 3600):
@@ -809,7 +832,8 @@ class ReplicateImageService:
         self,
         model: str,
         input_params: dict,
-        webhook_url: str
+        webhook_url: str,
+        kind: str = "image"
     ) -> str:
         """
         Create a Replicate prediction with webhook callback (non-blocking).
@@ -822,6 +846,7 @@ class ReplicateImageService:
             model: Model identifier (e.g., "google/nano-banana-pro")
             input_params: Model input parameters
             webhook_url: URL to receive callback when prediction completes
+            kind: Model family used for in-flight limiting ("image" or "video")
             
         Returns:
             Prediction ID
@@ -829,13 +854,14 @@ class ReplicateImageService:
         logger.info(f"Creating prediction with webhook: model={model}")
         
         # Create prediction with webhook
-        prediction = await asyncio.to_thread(
-            self.client.predictions.create,
-            model=model,
-            input=input_params,
-            webhook=webhook_url,
-            webhook_events_filter=["completed"]  # Only notify on completion (success, failure, or canceled)
-        )
+        async with get_replicate_semaphore(kind):
+            prediction = await asyncio.to_thread(
+                self.client.predictions.create,
+                model=model,
+                input=input_params,
+                webhook=webhook_url,
+                webhook_events_filter=["completed"]  # Only notify on completion (success, failure, or canceled)
+            )
         
         logger.info(f"Prediction created: id={prediction.id}, status={prediction.status}")
         return prediction.id
@@ -933,11 +959,12 @@ class ReplicateImageService:
                     "safety_filter_level": "block_only_high"
                 }
                 
-                output = await asyncio.to_thread(
-                    self.client.run,
-                    "google/nano-banana-pro",
-                    input=input_params
-                )
+                async with get_replicate_semaphore("image"):
+                    output = await asyncio.to_thread(
+                        self.client.run,
+                        "google/nano-banana-pro",
+                        input=input_params
+                    )
                 
                 # Extract image URL from nano-banana-pro output
                 if not output:
@@ -977,17 +1004,18 @@ Scene: {scene_text}
 Style: {style_prompt}
 Ensure the product appears as part of the original scene."""
                 
-                output = await asyncio.to_thread(
-                    self.client.run,
-                    settings.KONTEXT_MODEL_ID,
-                    input={
-                        "image_1": base_scene_url,
-                        "image_2": product_input,
-                        "prompt": composite_prompt,
-                        "output_format": "png",
-                        "output_quality": 90,
-                    }
-                )
+                async with get_replicate_semaphore("image"):
+                    output = await asyncio.to_thread(
+                        self.client.run,
+                        settings.KONTEXT_MODEL_ID,
+                        input={
+                            "image_1": base_scene_url,
+                            "image_2": product_input,
+                            "prompt": composite_prompt,
+                            "output_format": "png",
+                            "output_quality": 90,
+                        }
+                    )
                 
                 if not output or len(output) == 0:
                     raise Exception("No output from FLUX Kontext")
@@ -998,33 +1026,28 @@ Ensure the product appears as part of the original scene."""
             # Stage 4: Download and save composite
             print(f"[Kontext Composite] Saving composite image...")
             
-            response = requests.get(composite_url)
+            response = await get_http_client().get(composite_url)
             if response.status_code != 200:
                 raise Exception(f"Failed to download composite: {response.status_code}")
             
             composite_image = Image.open(io.BytesIO(response.content))
 
-            # Save to temp file for Firebase upload
-            temp_dir = Path(tempfile.gettempdir()) / "kontext_composites"
-            temp_dir.mkdir(exist_ok=True)
-
-            composite_filename = f"kontext_{uuid.uuid4()}.png"
-            temp_path = temp_dir / composite_filename
-
-            composite_image.save(temp_path, 'PNG')
+            # Encode in memory and stream straight to Firebase (no temp file)
+            composite_buffer = io.BytesIO()
+            composite_image.save(composite_buffer, 'PNG')
+            composite_size = composite_buffer.tell()
+            composite_buffer.seek(0)
 
             # Upload to Firebase Storage
             from app.services.firebase_storage_service import get_firebase_storage_service
             storage_service = get_firebase_storage_service()
 
             if not storage_service:
-                temp_path.unlink()
                 raise ValueError("Firebase Storage not configured")
 
-            firebase_url = storage_service.upload_image(temp_path, folder="composites")
-
-            # Clean up temp file
-            temp_path.unlink()
+            firebase_url = storage_service.upload_stream(
+                composite_buffer, folder="composites", extension=".png", size=composite_size
+            )
 
             if not firebase_url:
                 raise ValueError("Failed to upload to Firebase Storage")
@@ -1140,7 +1163,7 @@ Ensure the product appears as part of the original scene."""
                 logger.info(f"🔄 Converting {asset_type} localhost URL to base64 for Replicate compatibility")
                 try:
                     # Fetch the image from localhost
-                    response = requests.get(image_url, timeout=10)
+                    response = await get_http_client().get(image_url, timeout=10)
                     if response.status_code == 200:
                         # Determine content type from response headers
                         content_type = response.headers.get('content-type', 'image/png')
@@ -1165,26 +1188,21 @@ Ensure the product appears as part of the original scene."""
         
         # Convert all control image URLs to public URLs or base64
         # nano-banana-pro supports up to 14 images according to documentation
-        if brand_asset_image_url:
-            converted_brand_url = await ensure_public_url(brand_asset_image_url, "brand asset")
-            if converted_brand_url:
-                control_images.append(converted_brand_url)
-            else:
-                logger.warning("⚠️  Brand asset URL could not be converted, skipping")
-        
-        if character_asset_image_url:
-            converted_character_url = await ensure_public_url(character_asset_image_url, "character asset")
-            if converted_character_url:
-                control_images.append(converted_character_url)
-            else:
-                logger.warning("⚠️  Character asset URL could not be converted, skipping")
-        
-        if background_asset_image_url:
-            converted_background_url = await ensure_public_url(background_asset_image_url, "background asset")
-            if converted_background_url:
-                control_images.append(converted_background_url)
+        # The conversions are independent, so fetch them concurrently
+        assets = [
+            (brand_asset_image_url, "brand asset", "Brand"),
+            (character_asset_image_url, "character asset", "Character"),
+            (background_asset_image_url, "background asset", "Background"),
+        ]
+        assets = [asset for asset in assets if asset[0]]
+        converted_urls = await asyncio.gather(
+            *(ensure_public_url(image_url, asset_type) for image_url, asset_type, _ in assets)
+        )
+        for (_, _, label), converted_url in zip(assets, converted_urls):
+            if converted_url:
+                control_images.append(converted_url)
             else:
-                logger.warning("⚠️  Background asset URL could not be converted, skipping")
+                logger.warning(f"⚠️  {label} asset URL could not be converted, skipping")
         
         # Log control image URLs
         logger.info("🖼️  CONTROL IMAGE URLS BEING SENT:")
@@ -1252,11 +1270,12 @@ Ensure the product appears as part of the original scene."""
         for attempt in range(max_retries):
             try:
                 # Call nano-banana-pro
-                output = await asyncio.to_thread(
-                    self.client.run,
-                    "google/nano-banana-pro",
-                    input=input_params
-                )
+                async with get_replicate_semaphore("image"):
+                    output = await asyncio.to_thread(
+                        self.client.run,
+                        "google/nano-banana-pro",
+                        input=input_params
+                    )
                 
                 elapsed_time = asyncio.get_event_loop().time() - start_time
                 logger.info(f"⏱️  API call completed in {elapsed_time:.2f}s")
@@ -1351,7 +1370,7 @@ class ReplicateVideoService:
             raise ValueError("Replicate API token not configured. Set REPLICATE_API_TOKEN in environment.")
 
         # Set the token for replicate client
-        self.client = replicate.Client(api_token=token)
+        self.client = create_replicate_client(token)
 
         # Determine which model to use based on environment
         # Using Seedance in both dev and prod because it supports prompts
@@ -1473,13 +1492,13 @@ class ReplicateVideoService:
 
         try:
             # Run the model asynchronously with timeout
-            output = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self.client.run,
-                    model_id,
-                    input=input_params
-                ),
-                timeout=timeout
+            # The permit is held until the run's thread finishes, even past the timeout
+            output = await _run_with_permit(
+                get_replicate_semaphore("video"),
+                timeout,
+                self.client.run,
+                model_id,
+                input=input_params
             )
 
             # Handle output format (typically returns a video URL)
@@ -1499,14 +1518,14 @@ class ReplicateVideoService:
 
     async def generate_videos_parallel(
         self,
-        scenes: List[Dict[str, Any]],
+        scenes: List[SceneVideoInput],
         progress_callback: Optional[callable] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate videos for multiple scenes in parallel.
 
         Args:
-            scenes: List of scene dictionaries with seed_image_url and other data
+            scenes: Scenes with seed_image_url and other data (read, not copied)
             progress_callback: Optional callback function(scene_number, status, video_url, error)
 
         Returns:
@@ -1568,7 +1587,7 @@ class ReplicateVideoService:
 
     async def _generate_scene_video_with_retry(
         self,
-        scene: Dict[str, Any],
+        scene: SceneVideoInput,
         max_retries: int = 3,
         base_delay: float = 2.0
     ) -> Optional[str]:
@@ -1576,17 +1595,16 @@ class ReplicateVideoService:
         Generate video with exponential backoff retry logic.
 
         Args:
-            scene: Scene dictionary with seed_image_url, duration, description, etc.
+            scene: Scene with seed_image_url, duration, description, etc.
             max_retries: Maximum number of retry attempts
             base_delay: Base delay in seconds for exponential backoff
 
         Returns:
             Video URL or None if all attempts failed
         """
-        scene_number = scene.get("scene_number", 0)
-        seed_image_url = scene.get("seed_image_url")
-        duration = scene.get("duration", 4.0)
-        scene_description = scene.get("description", "")  # Get scene description for prompt
+        seed_image_url = scene.seed_image_url
+        duration = scene.duration
+        scene_description = scene.description  # Get scene description for prompt
 
         last_error = None
 
@@ -1621,21 +1639,21 @@ class ReplicateVideoService:
 
     async def _generate_scene_video_safe(
         self,
-        scene: Dict[str, Any],
+        scene: SceneVideoInput,
         progress_callback: Optional[callable] = None
     ) -> Dict[str, Any]:
         """
         Safely generate a video for a single scene with comprehensive error handling.
 
         Args:
-            scene: Scene dictionary with seed_image_url, duration, scene_number, etc.
+            scene: Scene with seed_image_url, duration, scene_number, etc.
             progress_callback: Optional callback for progress updates
 
         Returns:
             Dictionary with generation results
         """
-        scene_number = scene.get("scene_number", 0)
-        duration = scene.get("duration", 4.0)
+        scene_number = scene.scene_number
+        duration = scene.duration
 
         try:
             # Notify processing started
@@ -1,6 +1,6 @@
 """Scene generation service for creating scene breakdowns from creative briefs and moods."""
 from typing import Dict, Any
-from openai import OpenAI
+from app.http import create_openai_client
 from app.config import settings
 
 
@@ -9,7 +9,7 @@ class SceneGenerationService:
 
     def __init__(self):
         """Initialize the scene generation service with OpenAI client."""
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+        self.openai_client = create_openai_client(settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
 
     async def generate_scene_breakdown(
         self,
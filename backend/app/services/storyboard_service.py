@@ -8,7 +8,8 @@ from app.models.storyboard_models import (
 )
 from app.database import db
 from app.config import settings
-from openai import OpenAI
+from app.http import create_openai_client
+import asyncio
 import json
 import uuid
 
@@ -18,7 +19,7 @@ class StoryboardService:
 
     def __init__(self):
         """Initialize the service."""
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+        self.client = create_openai_client(settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
 
     def _format_creative_brief(self, creative_brief: Dict[str, Any]) -> str:
         """Convert creative brief object to formatted string for prompts."""
@@ -183,7 +184,7 @@ Example format:
         creative_brief_str = self._format_creative_brief(creative_brief_dict)
 
         # Generate storyboard ID first (needed for scenes)
-        storyboard_id = str(uuid.uuid4())
+        storyboard_id = uuid.uuid4().hex
 
         # Don't set assets by default - let users toggle them per scene
         # Assets are available from project but not automatically assigned
@@ -218,10 +219,12 @@ Example format:
             total_duration=sum(s["duration"] for s in scene_texts)
         )
 
-        # Save to database
-        db.create_storyboard(storyboard)
-        for scene in scenes:
-            db.create_scene(scene)
+        # Save to database: storyboard write and scenes batch run concurrently
+        # off the event loop (one round-trip of wall time instead of N+1)
+        await asyncio.gather(
+            asyncio.to_thread(db.create_storyboard, storyboard),
+            asyncio.to_thread(db.create_scenes_bulk, scenes),
+        )
 
         return storyboard, scenes
 
@@ -230,18 +233,24 @@ Example format:
         storyboard_id: str
     ) -> tuple[Storyboard, List[StoryboardScene]]:
         """Get storyboard with all its scenes in order."""
-        storyboard = db.get_storyboard(storyboard_id)
+        # Storyboard and scenes are independent reads; fetch them concurrently
+        storyboard, all_scenes = await asyncio.gather(
+            db.get_storyboard_async(storyboard_id),
+            asyncio.to_thread(db.get_scenes_by_storyboard, storyboard_id),
+        )
         if not storyboard:
             raise ValueError(f"Storyboard {storyboard_id} not found")
 
-        # Get all scenes
-        all_scenes = db.get_scenes_by_storyboard(storyboard_id)
+        return storyboard, self._order_scenes(storyboard, all_scenes)
 
-        # Order scenes according to scene_order
-        scenes_by_id = {scene.id: scene for scene in all_scenes}
-        scenes = [scenes_by_id[scene_id] for scene_id in storyboard.scene_order if scene_id in scenes_by_id]
-
-        return storyboard, scenes
+    @staticmethod
+    def _order_scenes(
+        storyboard: Storyboard,
+        scenes: List[StoryboardScene]
+    ) -> List[StoryboardScene]:
+        """Order scenes according to the storyboard's scene_order."""
+        scenes_by_id = {scene.id: scene for scene in scenes}
+        return [scenes_by_id[scene_id] for scene_id in storyboard.scene_order if scene_id in scenes_by_id]
 
     async def update_scene_text(
         self,
@@ -249,7 +258,7 @@ Example format:
         new_text: str
     ) -> StoryboardScene:
         """Update scene text manually."""
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene:
             raise ValueError(f"Scene {scene_id} not found")
 
@@ -263,7 +272,7 @@ Example format:
         scene.error_message = None
 
         # Save
-        updated_scene = db.update_scene(scene_id, scene)
+        updated_scene = await db.update_scene_async(scene_id, scene)
         return updated_scene
 
     async def regenerate_scene_text(
@@ -272,12 +281,12 @@ Example format:
         creative_brief: Dict[str, Any]
     ) -> StoryboardScene:
         """Regenerate scene text using AI."""
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene:
             raise ValueError(f"Scene {scene_id} not found")
 
         # Get storyboard for context
-        storyboard = db.get_storyboard(scene.storyboard_id)
+        storyboard = await db.get_storyboard_async(scene.storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {scene.storyboard_id} not found")
 
@@ -306,7 +315,7 @@ Example format:
             scene.error_message = None
 
         # Save
-        updated_scene = db.update_scene(scene_id, scene)
+        updated_scene = await db.update_scene_async(scene_id, scene)
         return updated_scene
 
     async def update_scene_duration(
@@ -315,7 +324,7 @@ Example format:
         new_duration: float
     ) -> StoryboardScene:
         """Update scene video duration."""
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene:
             raise ValueError(f"Scene {scene_id} not found")
 
@@ -329,14 +338,9 @@ Example format:
             scene.generation_status.video = "pending"
 
         # Save
-        updated_scene = db.update_scene(scene_id, scene)
+        updated_scene = await db.update_scene_async(scene_id, scene)
         return updated_scene
 
-    def _recalculate_total_duration(self, storyboard_id: str) -> float:
-        """Recalculate total_duration as sum of all scene durations."""
-        scenes = db.get_scenes_by_storyboard(storyboard_id)
-        return sum(scene.video_duration for scene in scenes)
-
     async def add_scene(
         self,
         storyboard_id: str,
@@ -352,7 +356,7 @@ Example format:
         Returns:
             (storyboard, scenes) tuple
         """
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = await db.get_storyboard_async(storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {storyboard_id} not found")
         
@@ -360,6 +364,9 @@ Example format:
         if len(storyboard.scene_order) >= 20:
             raise ValueError("Maximum 20 scenes allowed")
         
+        # Query the storyboard's scenes once; reused for the duration and response
+        all_scenes = await asyncio.to_thread(db.get_scenes_by_storyboard, storyboard_id)
+        
         # Use storyboard's creative_brief (stored as string) and selected_mood for generation
         # The creative_brief is stored as a formatted string, so we'll use it directly
         # Generate new scene text using AI (similar to regenerate_scene_text)
@@ -394,14 +401,16 @@ Example format:
             storyboard.scene_order.insert(position, new_scene.id)
         
         # Recalculate total_duration
-        storyboard.total_duration = self._recalculate_total_duration(storyboard_id)
+        storyboard.total_duration = sum(scene.video_duration for scene in all_scenes)
         
         # Save scene and update storyboard
-        db.create_scene(new_scene)
-        db.update_storyboard(storyboard_id, storyboard)
+        # (one batch, so the scene and scene_order change atomically)
+        await asyncio.to_thread(
+            db.create_scenes_bulk, [new_scene], storyboard, ('scene_order', 'total_duration')
+        )
         
         # Get all scenes in order
-        _, scenes = await self.get_storyboard_with_scenes(storyboard_id)
+        scenes = self._order_scenes(storyboard, all_scenes + [new_scene])
         
         return storyboard, scenes
 
@@ -420,7 +429,7 @@ Example format:
         Returns:
             (storyboard, scenes) tuple
         """
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = await db.get_storyboard_async(storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {storyboard_id} not found")
         
@@ -432,22 +441,27 @@ Example format:
         if scene_id not in storyboard.scene_order:
             raise ValueError(f"Scene {scene_id} not found in storyboard")
         
-        scene = db.get_scene(scene_id)
+        scene = await db.get_scene_async(scene_id)
         if not scene or scene.storyboard_id != storyboard_id:
             raise ValueError(f"Scene {scene_id} does not belong to storyboard")
         
+        # Query the storyboard's scenes once; reused for the duration and response
+        all_scenes = await asyncio.to_thread(db.get_scenes_by_storyboard, storyboard_id)
+        
         # Remove from scene_order
         storyboard.scene_order.remove(scene_id)
         
         # Recalculate total_duration
-        storyboard.total_duration = self._recalculate_total_duration(storyboard_id)
+        storyboard.total_duration = sum(scene.video_duration for scene in all_scenes)
         
         # Delete scene and update storyboard
-        db.delete_scene(scene_id)
-        db.update_storyboard(storyboard_id, storyboard)
+        # (one batch, so the scene and scene_order change atomically)
+        await asyncio.to_thread(
+            db.delete_scenes_bulk, [scene_id], storyboard, ('scene_order', 'total_duration')
+        )
         
-        # Get all scenes in order
-        _, scenes = await self.get_storyboard_with_scenes(storyboard_id)
+        # Get all scenes in order (the removed scene is no longer in scene_order)
+        scenes = self._order_scenes(storyboard, all_scenes)
         
         return storyboard, scenes
 
@@ -466,12 +480,12 @@ Example format:
         Returns:
             (storyboard, scenes) tuple
         """
-        storyboard = db.get_storyboard(storyboard_id)
+        storyboard = await db.get_storyboard_async(storyboard_id)
         if not storyboard:
             raise ValueError(f"Storyboard {storyboard_id} not found")
         
         # Validate all scene IDs exist and belong to storyboard
-        all_scenes = db.get_scenes_by_storyboard(storyboard_id)
+        all_scenes = await asyncio.to_thread(db.get_scenes_by_storyboard, storyboard_id)
         scene_ids = {scene.id for scene in all_scenes}
         
         if set(new_scene_order) != scene_ids:
@@ -484,10 +498,10 @@ Example format:
         storyboard.scene_order = new_scene_order
         
         # Update storyboard
-        db.update_storyboard(storyboard_id, storyboard)
+        await asyncio.to_thread(db.update_storyboard, storyboard_id, storyboard, ('scene_order',))
         
         # Get all scenes in order
-        _, scenes = await self.get_storyboard_with_scenes(storyboard_id)
+        scenes = self._order_scenes(storyboard, all_scenes)
         
         return storyboard, scenes
 
@@ -1,7 +1,7 @@
 """Speech-to-text service using OpenAI Whisper API."""
 import asyncio
 from typing import Optional
-from openai import OpenAI
+from app.http import create_openai_client
 from app.config import settings
 
 
@@ -14,7 +14,7 @@ class WhisperService:
         if not api_key:
             raise ValueError("OpenAI API key not configured. Set OPENAI_API_KEY in environment.")
         
-        self.client = OpenAI(api_key=api_key)
+        self.client = create_openai_client(api_key)
     
     async def transcribe_audio(
         self,
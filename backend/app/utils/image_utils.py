@@ -0,0 +1,31 @@
+"""
+Image Utilities
+
+This module provides PIL helpers shared by the asset and product image services.
+"""
+
+from PIL import Image
+
+
+def fit_within(image: Image.Image, size: int) -> Image.Image:
+    """
+    Downscale an image to fit within a size×size box, preserving aspect ratio.
+
+    Like ``Image.thumbnail()`` it never upscales, but it returns a new image
+    instead of resizing in place, so callers don't need a full-resolution
+    copy first. ``reducing_gap`` lets PIL box-reduce by an integer factor
+    before the LANCZOS pass, so LANCZOS only runs on a small buffer.
+
+    Args:
+        image: Source image (left unmodified)
+        size: Maximum width and height in pixels
+
+    Returns:
+        The resized image, or the source image itself if it already fits
+    """
+    width, height = image.size
+    scale = min(size / width, size / height, 1.0)
+    target = (max(1, round(width * scale)), max(1, round(height * scale)))
+    if target == image.size:
+        return image
+    return image.resize(target, Image.Resampling.LANCZOS, reducing_gap=2.0)
@@ -78,7 +78,7 @@ def test_jobs_list_endpoint():
 
     assert response.status_code == 200
     data = response.json()
-    assert "total_jobs" in data
+    assert "count" in data
     assert "jobs" in data
 
 
@@ -50,7 +50,7 @@ def test_video_generation_flow_with_mock():
             results = []
 
             for scene in scenes:
-                scene_num = scene["scene_number"]
+                scene_num = scene.scene_number
 
                 # Simulate progress callback
                 if progress_callback:
@@ -66,7 +66,7 @@ def test_video_generation_flow_with_mock():
                     "success": True,
                     "scene_number": scene_num,
                     "video_url": video_url,
-                    "duration": scene["duration"],
+                    "duration": scene.duration,
                     "error": None
                 })
 
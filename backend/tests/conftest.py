@@ -0,0 +1,20 @@
+"""Shared test setup.
+
+app.firestore_database builds its global ``db`` at import time, which needs
+serviceAccountKey.json and live Firestore clients. Import it once here with
+Firebase initialization mocked out, so routers and services that import
+``app.database`` can be loaded in unit tests. Tests stub the ``db`` methods
+they exercise.
+"""
+from unittest.mock import MagicMock, patch
+
+# Runs against the full app and writes the real logs/composite_metrics.json,
+# which later metrics tests would load; it stays out of the unit suite
+collect_ignore = ["test_integration_composite.py"]
+
+with patch('pathlib.Path.exists', return_value=True), \
+        patch('firebase_admin.credentials.Certificate'), \
+        patch('firebase_admin.initialize_app'), \
+        patch('firebase_admin.firestore.client', return_value=MagicMock()), \
+        patch('firebase_admin.firestore_async.client', return_value=MagicMock()):
+    import app.firestore_database  # noqa: F401
@@ -0,0 +1,279 @@
+"""Unit tests for the Firestore database layer."""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from app import firestore_database
+from app.firestore_database import FirestoreDatabase
+from app.models.storyboard_models import StoryboardScene
+from app.models.video_models import JobStatus, VideoClip, VideoJobStatus
+
+
+@pytest.fixture
+def database():
+    """Create a FirestoreDatabase with mocked async Firestore clients."""
+    with patch.object(FirestoreDatabase, '_init_firestore'):
+        database = FirestoreDatabase()
+    database._async_db = MagicMock()
+    database._async_scenes = MagicMock()
+    return database
+
+
+@pytest.fixture
+def transaction(database):
+    """Run transactional functions directly against a mock transaction."""
+    transaction = MagicMock()
+    database._async_db.transaction.return_value = transaction
+    with patch.object(firestore_database.firestore, 'async_transactional', lambda fn: fn):
+        yield transaction
+
+
+def make_job(**overrides) -> VideoJobStatus:
+    """Build a two-clip video job."""
+    data = dict(
+        job_id="job-1",
+        status=JobStatus.PROCESSING,
+        total_scenes=2,
+        completed_scenes=1,
+        progress_percent=50,
+        clips=[
+            VideoClip(scene_number=2, duration=5.0, status=JobStatus.PENDING),
+            VideoClip(scene_number=1, video_url="https://example.com/1.mp4", duration=4.0,
+                      status=JobStatus.COMPLETED, progress_percent=100),
+        ],
+        created_at="2026-01-01T00:00:00",
+        updated_at="2026-01-01T00:01:00",
+    )
+    data.update(overrides)
+    return VideoJobStatus(**data)
+
+
+def stored_scene(database, data) -> MagicMock:
+    """Point the scenes collection at a document holding ``data`` (None if missing)."""
+    snapshot = MagicMock()
+    snapshot.exists = data is not None
+    snapshot.to_dict.return_value = data
+    doc_ref = MagicMock()
+    doc_ref.get = AsyncMock(return_value=snapshot)
+    database._async_scenes.document.return_value = doc_ref
+    return doc_ref
+
+
+def scene_data(database, **overrides) -> dict:
+    """Stored scene document."""
+    return database._scene_to_dict(StoryboardScene(
+        id="scene-1", storyboard_id="sb-1", text="A beach", style_prompt="warm", **overrides
+    ))
+
+
+def stale_time() -> datetime:
+    """A last write old enough for a generating claim to be abandoned."""
+    return datetime.utcnow() - timedelta(seconds=FirestoreDatabase.GENERATION_CLAIM_STALE_SECONDS + 60)
+
+
+# ============================================================================
+# Video job mapping
+# ============================================================================
+
+def test_video_job_to_dict_keys_clips_by_scene_number(database):
+    """Test that clips are stored as a map keyed by scene number."""
+    data = database._video_job_to_dict(make_job())
+
+    assert 'clips' not in data
+    assert set(data['clips_map']) == {"1", "2"}
+    assert data['clips_map']["1"]['video_url'] == "https://example.com/1.mp4"
+    assert data['clips_map']["2"]['status'] == "pending"
+    assert data['status'] == "processing"
+
+
+def test_video_job_round_trip(database):
+    """Test that a stored job reads back with clips in scene order."""
+    job = make_job()
+
+    restored = database._video_job_from_dict(database._video_job_to_dict(job))
+
+    assert [clip.scene_number for clip in restored.clips] == [1, 2]
+    assert restored.status is JobStatus.PROCESSING
+    assert restored.clips[0].status is JobStatus.COMPLETED
+    assert restored.model_dump() == job.model_copy(
+        update={'clips': sorted(job.clips, key=lambda clip: clip.scene_number)}
+    ).model_dump()
+
+
+def test_video_job_from_dict_sorts_scene_numbers_numerically(database):
+    """Test that scene 10 sorts after scene 9, not after scene 1."""
+    clips = [VideoClip(scene_number=n, duration=5.0, status=JobStatus.PENDING) for n in (10, 9, 1)]
+    data = database._video_job_to_dict(make_job(total_scenes=3, clips=clips))
+
+    restored = database._video_job_from_dict(data)
+
+    assert [clip.scene_number for clip in restored.clips] == [1, 9, 10]
+
+
+def test_video_job_update_dict_uses_clip_field_paths(database):
+    """Test that partial updates write summary fields plus only the given clips."""
+    job = make_job()
+
+    data = database._video_job_update_dict(job, [job.clips[0]])
+
+    assert set(data) == {*FirestoreDatabase.VIDEO_JOB_SUMMARY_FIELDS, 'clips_map.`2`'}
+    assert data['status'] == "processing"
+    assert data['clips_map.`2`'] == job.clips[0].model_dump(mode='json')
+
+
+# ============================================================================
+# Scene generation claims
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_try_start_generation_claims_idle_scene(database, transaction):
+    """Test that a pending scene is moved to generating."""
+    doc_ref = stored_scene(database, scene_data(database))
+
+    assert await database.try_start_generation_async("scene-1", "image") is True
+
+    (ref, update), _ = transaction.update.call_args
+    assert ref is doc_ref
+    assert update['generation_status.image'] == "generating"
+    assert 'updated_at' in update
+
+
+@pytest.mark.asyncio
+async def test_try_start_generation_rejects_generating_scene(database, transaction):
+    """Test that a second claim on a generating scene is rejected."""
+    stored_scene(database, scene_data(database, generation_status={'image': "generating"}))
+
+    assert await database.try_start_generation_async("scene-1", "image") is False
+    transaction.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_try_start_generation_takes_over_stale_claim(database, transaction):
+    """Test that a generating claim abandoned long ago can be claimed again."""
+    stored_scene(database, scene_data(
+        database, generation_status={'image': "generating"}, updated_at=stale_time()
+    ))
+
+    assert await database.try_start_generation_async("scene-1", "image") is True
+    transaction.update.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_try_start_generation_compares_firestore_timestamps(database, transaction):
+    """Test that a fresh claim read back as an aware Timestamp is not taken over."""
+    data = scene_data(database, generation_status={'image': "generating"})
+    data['updated_at'] = datetime.now(timezone.utc)
+    stored_scene(database, data)
+
+    assert await database.try_start_generation_async("scene-1", "image") is False
+    transaction.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_try_start_generation_missing_scene(database, transaction):
+    """Test that a missing scene cannot be claimed."""
+    stored_scene(database, None)
+
+    assert await database.try_start_generation_async("scene-1", "video") is False
+    transaction.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_try_start_generation_updates_cached_scene(database, transaction):
+    """Test that the cached scene reflects a successful claim."""
+    stored_scene(database, scene_data(database))
+    database._cache_scenes["scene-1"] = StoryboardScene(
+        id="scene-1", storyboard_id="sb-1", text="A beach", style_prompt="warm"
+    )
+
+    await database.try_start_generation_async("scene-1", "video")
+
+    assert database._cache_scenes["scene-1"].generation_status.video == "generating"
+
+
+@pytest.mark.asyncio
+async def test_reset_and_claim_returns_previous_scene(database, transaction):
+    """Test that the reset and the claim are written in one update."""
+    stored_scene(database, scene_data(
+        database,
+        state="video",
+        image_url="https://example.com/old.png",
+        replicate_image_prediction_id="pred-old",
+        generation_status={'image': "complete", 'video': "complete"},
+    ))
+    database._missing_scenes["scene-1"] = True
+
+    previous = await database.reset_and_claim_generation_async(
+        "scene-1", "image",
+        {'image_url': None, 'generation_status.video': "pending", 'state': "image"},
+    )
+
+    assert previous.replicate_image_prediction_id == "pred-old"
+    assert previous.image_url == "https://example.com/old.png"
+
+    (_, update), _ = transaction.update.call_args
+    assert update['image_url'] is None
+    assert update['state'] == "image"
+    assert update['generation_status.image'] == "generating"
+    assert update['generation_status.video'] == "pending"
+
+    cached = database._cache_scenes["scene-1"]
+    assert cached.image_url is None
+    assert cached.state == "image"
+    assert cached.generation_status.image == "generating"
+    assert cached.generation_status.video == "pending"
+    assert "scene-1" not in database._missing_scenes
+
+
+@pytest.mark.asyncio
+async def test_reset_and_claim_supersedes_running_prediction(database, transaction):
+    """Test that a generating scene with a stored prediction can be regenerated."""
+    stored_scene(database, scene_data(
+        database,
+        generation_status={'video': "generating"},
+        replicate_video_prediction_id="pred-running",
+    ))
+
+    previous = await database.reset_and_claim_generation_async(
+        "scene-1", "video", {'replicate_video_prediction_id': None}
+    )
+
+    assert previous.replicate_video_prediction_id == "pred-running"
+    transaction.update.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reset_and_claim_rejects_claim_in_progress(database, transaction):
+    """Test that a generating scene without a prediction ID is not reset."""
+    stored_scene(database, scene_data(database, generation_status={'image': "generating"}))
+
+    previous = await database.reset_and_claim_generation_async(
+        "scene-1", "image", {'image_url': None}
+    )
+
+    assert previous is None
+    transaction.update.assert_not_called()
+    assert "scene-1" not in database._cache_scenes
+
+
+@pytest.mark.asyncio
+async def test_reset_and_claim_takes_over_stale_claim(database, transaction):
+    """Test that an abandoned claim without a prediction ID can be reset."""
+    stored_scene(database, scene_data(
+        database, generation_status={'image': "generating"}, updated_at=stale_time()
+    ))
+
+    previous = await database.reset_and_claim_generation_async(
+        "scene-1", "image", {'image_url': None}
+    )
+
+    assert previous is not None
+    transaction.update.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reset_and_claim_missing_scene(database, transaction):
+    """Test that a missing scene is not reset."""
+    stored_scene(database, None)
+
+    assert await database.reset_and_claim_generation_async("scene-1", "image", {}) is None
+    transaction.update.assert_not_called()
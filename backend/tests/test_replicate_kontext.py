@@ -3,6 +3,9 @@ import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from pathlib import Path
 import tempfile
+import base64
+import io
+from PIL import Image
 from app.services.replicate_service import ReplicateImageService
 
 
@@ -59,30 +62,28 @@ async def test_image_to_base64_too_large(replicate_service):
 
 @pytest.mark.asyncio
 async def test_image_to_base64_compression(replicate_service):
-    """Test that large images (5-10MB) are compressed."""
+    """Test that large images (5-10MB) are recompressed in memory."""
     with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
         temp_path = temp_file.name
-        temp_file.write(b"fake_image_data" * 1000)
+    
+    original = Image.new('RGB', (64, 48), (200, 30, 90))
+    original.save(temp_path, 'PNG')
     
     try:
         with patch('pathlib.Path.stat') as mock_stat:
             mock_stat.return_value = Mock(st_size=7 * 1024 * 1024)  # 7MB
             
-            with patch('PIL.Image.open') as mock_open:
-                mock_image = Mock()
-                mock_open.return_value = mock_image
+            with patch('app.services.replicate_service.Image.open', wraps=Image.open) as mock_open:
+                result = await replicate_service._image_to_base64(temp_path)
                 
-                with patch('builtins.open', create=True) as mock_file_open:
-                    mock_file_open.return_value.__enter__.return_value.read.return_value = b"compressed_data"
-                    
-                    with patch('base64.b64encode') as mock_encode:
-                        mock_encode.return_value = b"encoded_compressed"
-                        
-                        result = await replicate_service._image_to_base64(temp_path)
-                        
-                        # Verify compression was attempted
-                        mock_image.save.assert_called_once()
-                        assert result == "encoded_compressed"
+                # Verify compression was attempted
+                mock_open.assert_called_once()
+        
+        # Result is a re-encoded PNG with the same pixels
+        with Image.open(io.BytesIO(base64.b64decode(result))) as decoded:
+            assert decoded.format == 'PNG'
+            assert decoded.size == original.size
+            assert decoded.convert('RGB').tobytes() == original.tobytes()
     finally:
         Path(temp_path).unlink(missing_ok=True)
 
@@ -160,11 +161,11 @@ async def test_generate_scene_with_kontext_composite_success(replicate_service):
                     mock_encode.return_value = "base64encodeddata"
                     
                     # Mock image download
-                    with patch('requests.get') as mock_get:
+                    with patch('app.services.replicate_service.get_http_client') as mock_client:
                         mock_response = Mock()
                         mock_response.status_code = 200
                         mock_response.content = b"fake_image_data"
-                        mock_get.return_value = mock_response
+                        mock_client.return_value.get = AsyncMock(return_value=mock_response)
                         
                         # Mock PIL Image
                         with patch('PIL.Image.open') as mock_image_open:
@@ -215,11 +216,11 @@ async def test_generate_scene_with_kontext_composite_base64_fallback(replicate_s
                     with patch.object(replicate_service, '_upload_temp_image', new_callable=AsyncMock) as mock_upload:
                         mock_upload.return_value = "/uploads/temp/temp_product.png"
                         
-                        with patch('requests.get') as mock_get:
+                        with patch('app.services.replicate_service.get_http_client') as mock_client:
                             mock_response = Mock()
                             mock_response.status_code = 200
                             mock_response.content = b"fake_image_data"
-                            mock_get.return_value = mock_response
+                            mock_client.return_value.get = AsyncMock(return_value=mock_response)
                             
                             with patch('PIL.Image.open') as mock_image_open:
                                 mock_image = Mock()
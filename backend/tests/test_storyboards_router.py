@@ -0,0 +1,280 @@
+"""Unit tests for the storyboards router."""
+import pytest
+import pytest_asyncio
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from app.models.storyboard_models import StoryboardScene
+from app.routers import storyboards
+from app.routers.storyboards import _SceneUpdateBroker, get_scene_dep
+
+DEBOUNCE = 0.01
+
+
+@pytest.fixture
+def mock_db(monkeypatch):
+    """Replace the router's database."""
+    mock_db = MagicMock()
+    mock_db.get_scene_async = AsyncMock()
+    monkeypatch.setattr(storyboards, 'db', mock_db)
+    monkeypatch.setattr(storyboards, 'SSE_DEBOUNCE_SECONDS', DEBOUNCE)
+    return mock_db
+
+
+@pytest_asyncio.fixture
+async def broker(mock_db):
+    """Create an SSE broker on the running event loop."""
+    return _SceneUpdateBroker("sb-1", asyncio.get_running_loop())
+
+
+def make_scene(**overrides) -> StoryboardScene:
+    """Build a scene in storyboard sb-1."""
+    data = dict(id="scene-1", storyboard_id="sb-1", text="A beach", style_prompt="warm")
+    data.update(overrides)
+    return StoryboardScene(**data)
+
+
+async def settle():
+    """Wait for pending debounce windows to flush."""
+    await asyncio.sleep(DEBOUNCE * 5)
+
+
+def drain(queue: asyncio.Queue) -> list:
+    """Take every queued frame."""
+    frames = []
+    while not queue.empty():
+        frames.append(queue.get_nowait())
+    return frames
+
+
+# ============================================================================
+# get_scene_dep
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_get_scene_dep_returns_scene(mock_db):
+    """Test that the path's scene is resolved."""
+    scene = make_scene()
+    mock_db.get_scene_async.return_value = scene
+
+    assert await get_scene_dep("sb-1", "scene-1") is scene
+    mock_db.get_scene_async.assert_called_once_with("scene-1")
+
+
+@pytest.mark.asyncio
+async def test_get_scene_dep_missing_scene(mock_db):
+    """Test that a missing scene is a 404."""
+    mock_db.get_scene_async.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_scene_dep("sb-1", "scene-1")
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_scene_dep_rejects_other_storyboard(mock_db):
+    """Test that a scene from another storyboard is a 404."""
+    mock_db.get_scene_async.return_value = make_scene(storyboard_id="sb-2")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_scene_dep("sb-1", "scene-1")
+
+    assert exc_info.value.status_code == 404
+
+
+def test_get_scene_dep_reads_once_per_request(mock_db):
+    """Test that every use of the dependency in a request shares one read."""
+    mock_db.get_scene_async.return_value = make_scene()
+    app = FastAPI()
+
+    async def scene_text(scene: StoryboardScene = Depends(get_scene_dep)) -> str:
+        return scene.text
+
+    @app.get("/{storyboard_id}/scenes/{scene_id}")
+    async def read_scene(
+        text: str = Depends(scene_text),
+        scene: StoryboardScene = Depends(get_scene_dep)
+    ):
+        return {"id": scene.id, "text": text}
+
+    client = TestClient(app)
+
+    assert client.get("/sb-1/scenes/scene-1").json() == {"id": "scene-1", "text": "A beach"}
+    assert client.get("/sb-2/scenes/scene-1").status_code == 404
+    assert mock_db.get_scene_async.call_count == 2
+
+
+# ============================================================================
+# SSE broker
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_broker_fans_out_one_frame(broker):
+    """Test that every subscriber receives the same serialized frame."""
+    first, second = broker.subscribe(), broker.subscribe()
+
+    broker.publish([make_scene(image_url="https://example.com/1.png")])
+    await settle()
+
+    [frame] = drain(first)
+    assert drain(second) == [frame]
+    assert b"https://example.com/1.png" in frame
+
+
+@pytest.mark.asyncio
+async def test_broker_debounces_rapid_changes(broker):
+    """Test that changes within one window produce one frame with the latest state."""
+    queue = broker.subscribe()
+
+    broker.publish([make_scene(image_url="https://example.com/1.png")])
+    broker.publish([make_scene(image_url="https://example.com/2.png")])
+    broker.publish([make_scene(image_url="https://example.com/3.png")])
+    await settle()
+
+    frames = drain(queue)
+    assert len(frames) == 1
+    assert b"https://example.com/3.png" in frames[0]
+
+
+@pytest.mark.asyncio
+async def test_broker_skips_unchanged_client_state(broker):
+    """Test that snapshots differing only in hidden fields are not re-sent."""
+    queue = broker.subscribe()
+    scene = make_scene(image_url="https://example.com/1.png")
+
+    broker.publish([scene])
+    await settle()
+    broker.publish([scene.model_copy(update={'updated_at': scene.updated_at + timedelta(seconds=1)})])
+    await settle()
+
+    assert len(drain(queue)) == 1
+
+
+@pytest.mark.asyncio
+async def test_broker_primes_new_subscribers(broker):
+    """Test that late subscribers start from each scene's latest frame."""
+    broker.publish([make_scene(), make_scene(id="scene-2")])
+    await settle()
+
+    assert len(drain(broker.subscribe())) == 2
+
+
+@pytest.mark.asyncio
+async def test_broker_forgets_removed_scenes(broker):
+    """Test that deleted scenes are not primed, even with a change still pending."""
+    broker.publish([make_scene(), make_scene(id="scene-2")])
+    await settle()
+
+    broker.publish([make_scene(id="scene-3")])
+    broker.publish([], removed_ids=["scene-1", "scene-3"])
+    await settle()
+
+    [frame] = drain(broker.subscribe())
+    assert b"scene-2" in frame
+    assert broker._timers == {}
+
+
+@pytest.mark.asyncio
+async def test_broker_evicts_slow_subscriber(broker, monkeypatch):
+    """Test that a subscriber dropping too many frames in a row is disconnected."""
+    monkeypatch.setattr(storyboards, 'SSE_QUEUE_MAXSIZE', 1)
+    monkeypatch.setattr(storyboards, 'SSE_MAX_DROPPED_FRAMES', 1)
+    queue = broker.subscribe()
+
+    for n in range(3):
+        broker.publish([make_scene(image_url=f"https://example.com/{n}.png")])
+        await settle()
+
+    assert queue not in broker.subscribers
+    assert drain(queue) == [None]
+
+
+@pytest.mark.asyncio
+async def test_broker_resets_drop_count_when_subscriber_catches_up(broker, monkeypatch):
+    """Test that only consecutive drops count towards eviction."""
+    monkeypatch.setattr(storyboards, 'SSE_QUEUE_MAXSIZE', 2)
+    monkeypatch.setattr(storyboards, 'SSE_MAX_DROPPED_FRAMES', 1)
+    queue = broker.subscribe()
+
+    async def send(n: int):
+        broker.publish([make_scene(image_url=f"https://example.com/{n}.png")])
+        await settle()
+
+    await send(1)
+    await send(2)
+    await send(3)  # Queue full: first drop
+    queue.get_nowait()
+    await send(4)  # Enqueued without a drop
+    await send(5)  # Queue full again: a first drop, not a second
+
+    assert queue in broker.subscribers
+    assert None not in drain(queue)
+
+
+@pytest.mark.asyncio
+async def test_broker_last_unsubscribe_stops_listener(mock_db, monkeypatch):
+    """Test that the last subscriber out stops the Firestore listener."""
+    monkeypatch.setattr(storyboards, '_brokers', {})
+    broker = storyboards._get_or_create_broker("sb-1")
+    first, second = broker.subscribe(), broker.subscribe()
+
+    broker.unsubscribe(first)
+    assert storyboards._brokers["sb-1"] is broker
+
+    broker.unsubscribe(second)
+    await asyncio.gather(*storyboards._watch_stop_tasks)
+
+    mock_db.watch_scenes_by_storyboard.return_value.unsubscribe.assert_called_once()
+    assert "sb-1" not in storyboards._brokers
+
+
+# ============================================================================
+# Scene status ETag
+# ============================================================================
+
+@pytest.fixture
+def status_client():
+    """Serve the storyboard router with a fixed scene behind get_scene_dep."""
+    app = FastAPI()
+    app.include_router(storyboards.router)
+    scene = make_scene(created_at=datetime(2026, 1, 1))
+    app.dependency_overrides[get_scene_dep] = lambda: scene
+    client = TestClient(app)
+    client.scene = scene
+    return client
+
+
+def test_scene_status_returns_etag(status_client):
+    """Test that a status poll carries an ETag."""
+    response = status_client.get("/api/storyboards/sb-1/scenes/scene-1/status")
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    assert response.json()["scene"]["id"] == "scene-1"
+
+
+def test_scene_status_not_modified(status_client):
+    """Test that an unchanged scene answers If-None-Match with an empty 304."""
+    url = "/api/storyboards/sb-1/scenes/scene-1/status"
+    etag = status_client.get(url).headers["etag"]
+
+    response = status_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_scene_status_etag_changes_with_scene(status_client):
+    """Test that a scene write invalidates the ETag."""
+    url = "/api/storyboards/sb-1/scenes/scene-1/status"
+    etag = status_client.get(url).headers["etag"]
+
+    status_client.scene.updated_at += timedelta(seconds=1)
+    response = status_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
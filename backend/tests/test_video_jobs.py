@@ -0,0 +1,92 @@
+"""Unit tests for the video job listing endpoint."""
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.routers import video
+from app.routers.video import _decode_job_cursor, _encode_job_cursor
+
+
+def make_summaries(count: int) -> list:
+    """Build job summaries as returned by list_video_job_summaries_async."""
+    return [
+        {
+            "job_id": f"job-{n}",
+            "status": "completed",
+            "progress_percent": 100,
+            "total_scenes": 3,
+            "completed_scenes": 3,
+            "failed_scenes": 0,
+            "created_at": f"2026-01-{28 - n:02d}T12:00:00+00:00",
+        }
+        for n in range(count)
+    ]
+
+
+@pytest.fixture
+def list_jobs(monkeypatch):
+    """Stub the job summary query."""
+    list_jobs = AsyncMock()
+    monkeypatch.setattr(video.db, 'list_video_job_summaries_async', list_jobs)
+    return list_jobs
+
+
+@pytest.fixture
+def client():
+    """Serve the video router."""
+    app = FastAPI()
+    app.include_router(video.router)
+    return TestClient(app)
+
+
+def test_job_cursor_round_trip():
+    """Test that a cursor decodes to the job it was built from."""
+    cursor = _encode_job_cursor("2026-01-01T12:00:00+00:00", "job-1")
+
+    assert "=" not in cursor
+    assert _decode_job_cursor(cursor) == ("2026-01-01T12:00:00+00:00", "job-1")
+
+
+def test_list_jobs_full_page_returns_next_cursor(client, list_jobs):
+    """Test that a full page links to the next one."""
+    list_jobs.return_value = make_summaries(2)
+
+    data = client.get("/api/video/jobs", params={"limit": 2}).json()
+
+    assert data["count"] == 2
+    assert [job["job_id"] for job in data["jobs"]] == ["job-0", "job-1"]
+    assert _decode_job_cursor(data["next_cursor"]) == ("2026-01-27T12:00:00+00:00", "job-1")
+    assert list_jobs.call_args.kwargs == {"limit": 2, "start_after": None}
+
+
+def test_list_jobs_passes_cursor_to_query(client, list_jobs):
+    """Test that the next page starts after the cursor's job."""
+    list_jobs.return_value = make_summaries(2)
+    cursor = client.get("/api/video/jobs", params={"limit": 2}).json()["next_cursor"]
+
+    client.get("/api/video/jobs", params={"limit": 2, "cursor": cursor})
+
+    assert list_jobs.call_args.kwargs["start_after"] == ("2026-01-27T12:00:00+00:00", "job-1")
+
+
+def test_list_jobs_short_page_is_last(client, list_jobs):
+    """Test that a page shorter than the limit has no next cursor."""
+    list_jobs.return_value = make_summaries(1)
+
+    data = client.get("/api/video/jobs", params={"limit": 2}).json()
+
+    assert data["count"] == 1
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    _encode_job_cursor("yesterday", "job-1"),
+    _encode_job_cursor("2026-01-01T12:00:00+00:00", ""),
+])
+def test_list_jobs_rejects_invalid_cursor(client, list_jobs, cursor):
+    """Test that malformed cursors are a 400, not a query."""
+    response = client.get("/api/video/jobs", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    list_jobs.assert_not_called()
@@ -1,5 +1,6 @@
 /**
- * Hook for managing video generation with polling and progress tracking.
+ * Hook for managing video generation with live (SSE) progress tracking.
+ * Falls back to polling when the status stream is unavailable.
  */
 import { useState, useEffect, useRef, useCallback } from 'react';
 import { pipelineLogger } from '@/lib/logger';
@@ -34,12 +35,17 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
 
   // Refs for cleanup and polling control
   const pollingIntervalRef = useRef<NodeJS.Timeout | null>(null);
+  const eventSourceRef = useRef<EventSource | null>(null);
   const pollRetryCountRef = useRef(0);
   const isUnmountedRef = useRef(false);
 
   const clearError = useCallback(() => setError(null), []);
 
   const stopPolling = useCallback(() => {
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close();
+      eventSourceRef.current = null;
+    }
     if (pollingIntervalRef.current) {
       console.log('🛑 stopPolling called - clearing interval:', pollingIntervalRef.current);
       clearInterval(pollingIntervalRef.current);
@@ -50,6 +56,76 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
     pollRetryCountRef.current = 0;
   }, []);
 
+  /**
+   * Apply a job status snapshot to state. Returns true once the job is finished.
+   */
+  const applyJobStatus = useCallback((job: VideoJobStatus): boolean => {
+    // Update job status - CRITICAL: Always update regardless of mount status
+    console.log('📥 Received job status:', job.status, 'Progress:', job.progress_percent);
+    console.log('📥 Clip progress details:', job.clips.map(c => `Scene ${c.scene_number}: ${c.progress_percent}%`).join(', '));
+    
+    // FORCE a completely new object reference to trigger React re-render
+    setJobStatus({
+      job_id: job.job_id,
+      status: job.status,
+      total_scenes: job.total_scenes,
+      completed_scenes: job.completed_scenes,
+      failed_scenes: job.failed_scenes,
+      progress_percent: job.progress_percent,
+      clips: job.clips.map(clip => ({
+        scene_number: clip.scene_number,
+        video_url: clip.video_url,
+        duration: clip.duration,
+        status: clip.status,
+        error: clip.error,
+        progress_percent: clip.progress_percent,
+      })),
+      error: job.error,
+      created_at: job.created_at,
+      updated_at: job.updated_at,
+    });
+    
+    // Track failed clips for partial retry
+    const failed = job.clips
+      .filter(clip => clip.status === 'failed')
+      .map(clip => clip.scene_number);
+    setFailedClips(failed);
+    
+    // Log progress
+    pipelineLogger.video.progress(
+      job.progress_percent,
+      job.completed_scenes,
+      job.total_scenes
+    );
+    
+    // Log individual clip progress/status
+    job.clips.forEach(clip => {
+      if (clip.status === 'completed') {
+        pipelineLogger.video.clipSuccess(clip.scene_number);
+      } else if (clip.status === 'failed') {
+        pipelineLogger.video.clipError(clip.scene_number, clip.error || 'Unknown error');
+      } else {
+        pipelineLogger.video.clipProgress(clip.scene_number, clip.progress_percent);
+      }
+    });
+    
+    console.log('✅ State updated - React should re-render now');
+    
+    // Check if job is complete, failed, or all clips are generated (progress = 100%)
+    const isFinished =
+      job.status === 'completed' || 
+      job.status === 'failed' ||
+      job.progress_percent === 100;
+
+    if (isFinished) {
+      console.log('🛑 Job finished. Status:', job.status, 'Progress:', job.progress_percent);
+      setIsGenerating(false);
+      return true;
+    }
+
+    return false;
+  }, []);
+
   const pollJobStatus = useCallback(async (jobId: string): Promise<boolean> => {
     console.log('🔍 pollJobStatus called for job:', jobId);
     try {
@@ -74,67 +150,8 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
         throw new Error(data.message || 'Failed to get job status');
       }
 
-      // Update job status - CRITICAL: Always update regardless of mount status
-      console.log('📥 Received job status:', data.job_status.status, 'Progress:', data.job_status.progress_percent);
-      console.log('📥 Clip progress details:', data.job_status.clips.map(c => `Scene ${c.scene_number}: ${c.progress_percent}%`).join(', '));
-      
-      // FORCE a completely new object reference to trigger React re-render
-      setJobStatus({
-        job_id: data.job_status.job_id,
-        status: data.job_status.status,
-        total_scenes: data.job_status.total_scenes,
-        completed_scenes: data.job_status.completed_scenes,
-        failed_scenes: data.job_status.failed_scenes,
-        progress_percent: data.job_status.progress_percent,
-        clips: data.job_status.clips.map(clip => ({
-          scene_number: clip.scene_number,
-          video_url: clip.video_url,
-          duration: clip.duration,
-          status: clip.status,
-          error: clip.error,
-          progress_percent: clip.progress_percent,
-        })),
-        error: data.job_status.error,
-        created_at: data.job_status.created_at,
-        updated_at: data.job_status.updated_at,
-      });
-      
-      // Track failed clips for partial retry
-      const failed = data.job_status.clips
-        .filter(clip => clip.status === 'failed')
-        .map(clip => clip.scene_number);
-      setFailedClips(failed);
-      
-      // Log progress
-      pipelineLogger.video.progress(
-        data.job_status.progress_percent,
-        data.job_status.completed_scenes,
-        data.job_status.total_scenes
-      );
-      
-      // Log individual clip progress/status
-      data.job_status.clips.forEach(clip => {
-        if (clip.status === 'completed') {
-          pipelineLogger.video.clipSuccess(clip.scene_number);
-        } else if (clip.status === 'failed') {
-          pipelineLogger.video.clipError(clip.scene_number, clip.error || 'Unknown error');
-        } else {
-          pipelineLogger.video.clipProgress(clip.scene_number, clip.progress_percent);
-        }
-      });
-      
-      console.log('✅ State updated - React should re-render now');
       pollRetryCountRef.current = 0; // Reset retry count on success
-      
-      // Check if job is complete, failed, or all clips are generated (progress = 100%)
-      const isFinished =
-        data.job_status.status === 'completed' || 
-        data.job_status.status === 'failed' ||
-        data.job_status.progress_percent === 100;
-
-      if (isFinished) {
-        console.log('🛑 Job finished, stopping polling. Status:', data.job_status.status, 'Progress:', data.job_status.progress_percent);
-        setIsGenerating(false);
+      if (applyJobStatus(data.job_status)) {
         return true; // Stop polling
       }
 
@@ -157,7 +174,7 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
 
       return false; // Continue polling (retry)
     }
-  }, []);
+  }, [applyJobStatus]);
 
   const startPolling = useCallback(
     (jobId: string) => {
@@ -190,6 +207,40 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
     [pollJobStatus, stopPolling]
   );
 
+  const startStreaming = useCallback(
+    (jobId: string) => {
+      stopPolling();
+
+      const url = `${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000'}/api/video/status/${jobId}/stream`;
+      console.log('📡 Opening status stream for job:', jobId);
+      const eventSource = new EventSource(url);
+      eventSourceRef.current = eventSource;
+
+      eventSource.onmessage = (event) => {
+        try {
+          const job: VideoJobStatus = JSON.parse(event.data);
+          if (applyJobStatus(job)) {
+            // Close before the server ends the stream so EventSource doesn't reconnect
+            stopPolling();
+          }
+        } catch (err) {
+          console.error('Failed to parse status stream event:', err);
+        }
+      };
+
+      eventSource.onerror = () => {
+        if (eventSourceRef.current !== eventSource) {
+          return;
+        }
+        console.warn('⚠️ Status stream failed, falling back to polling');
+        eventSource.close();
+        eventSourceRef.current = null;
+        startPolling(jobId);
+      };
+    },
+    [applyJobStatus, startPolling, stopPolling]
+  );
+
   const startGeneration = useCallback(
     async (request: VideoGenerationRequest): Promise<string | null> => {
       setIsGenerating(true);
@@ -220,10 +271,8 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
           throw new Error(data.message || 'Failed to start video generation');
         }
 
-        // Start polling for job status
-        console.log('🎯 About to call startPolling with job_id:', data.job_id);
-        startPolling(data.job_id);
-        console.log('✅ startPolling has been called');
+        // Stream job status updates
+        startStreaming(data.job_id);
 
         return data.job_id;
       } catch (err) {
@@ -235,7 +284,7 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
         return null;
       }
     },
-    [startPolling]
+    [startStreaming]
   );
 
   const retryGeneration = useCallback(async (): Promise<void> => {
@@ -278,8 +327,8 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
         
         if (data.success) {
           console.log('✅ Retry initiated successfully');
-          // Continue polling with existing job
-          startPolling(jobId);
+          // Continue tracking the existing job
+          startStreaming(jobId);
           return true;
         }
 
@@ -293,7 +342,7 @@ export function useVideoGeneration(): UseVideoGenerationReturn {
         return false;
       }
     },
-    [failedClips, startPolling]
+    [failedClips, startStreaming]
   );
 
   // Cleanup on unmount
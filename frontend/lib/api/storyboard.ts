@@ -14,7 +14,7 @@ import type {
   SceneImageGenerateRequest,
   SceneDurationUpdateRequest,
   SceneVideoGenerateRequest,
-  SceneVideoGenerateResponse,
+  SceneGenerationAcceptedResponse,
   SceneStatusResponse,
   StoryboardPreviewResponse,
   Storyboard,
@@ -152,19 +152,16 @@ export async function generateSceneText(
 export async function generateSceneImage(
   storyboardId: string,
   sceneId: string
-): Promise<StoryboardScene> {
+): Promise<SceneGenerationAcceptedResponse> {
   console.log('[API] generateSceneImage called with storyboardId:', storyboardId, 'sceneId:', sceneId);
-  const result = await apiRequest<{ success: boolean; scene: StoryboardScene; message?: string }>(
+  const result = await apiRequest<SceneGenerationAcceptedResponse>(
     `/api/storyboards/${storyboardId}/scenes/${sceneId}/image/generate`,
     {
       method: 'POST',
     }
   );
   console.log('[API] generateSceneImage response:', result);
-  if (!result.scene) {
-    throw new Error('Invalid response: scene not found');
-  }
-  return result.scene;
+  return result;
 }
 
 /**
@@ -174,17 +171,13 @@ export async function generateSceneImage(
 export async function regenerateSceneImage(
   storyboardId: string,
   sceneId: string
-): Promise<StoryboardScene> {
-  const result = await apiRequest<{ success: boolean; scene: StoryboardScene; message?: string }>(
+): Promise<SceneGenerationAcceptedResponse> {
+  return apiRequest<SceneGenerationAcceptedResponse>(
     `/api/storyboards/${storyboardId}/scenes/${sceneId}/image/regenerate`,
     {
       method: 'POST',
     }
   );
-  if (!result.scene) {
-    throw new Error('Invalid response: scene not found');
-  }
-  return result.scene;
 }
 
 /**
@@ -216,8 +209,8 @@ export async function updateSceneDuration(
 export async function generateSceneVideo(
   storyboardId: string,
   sceneId: string
-): Promise<SceneVideoGenerateResponse> {
-  return apiRequest<SceneVideoGenerateResponse>(
+): Promise<SceneGenerationAcceptedResponse> {
+  return apiRequest<SceneGenerationAcceptedResponse>(
     `/api/storyboards/${storyboardId}/scenes/${sceneId}/video/generate`,
     {
       method: 'POST',
@@ -232,8 +225,8 @@ export async function generateSceneVideo(
 export async function regenerateSceneVideo(
   storyboardId: string,
   sceneId: string
-): Promise<SceneVideoGenerateResponse> {
-  return apiRequest<SceneVideoGenerateResponse>(
+): Promise<SceneGenerationAcceptedResponse> {
+  return apiRequest<SceneGenerationAcceptedResponse>(
     `/api/storyboards/${storyboardId}/scenes/${sceneId}/video/regenerate`,
     {
       method: 'POST',
@@ -269,15 +269,23 @@ export const useSceneStore = create<SceneState>((set, get) => ({
             throw new Error('No storyboard loaded');
           }
           console.log('[Store] Calling generateSceneImage API with storyboardId:', storyboard.storyboard_id, 'sceneId:', sceneId);
-          const updatedScene = await retryOperation(
+          const result = await retryOperation(
             () => storyboardAPI.generateSceneImage(storyboard.storyboard_id, sceneId),
             {
               maxRetries: 2,
               operationName: 'Generate Scene Image',
             }
           );
-          console.log('[Store] generateSceneImage returned:', updatedScene);
-          get().updateScene(sceneId, updatedScene);
+          // Placeholder applied synchronously; otherwise the request is accepted (202),
+          // so show generating optimistically and let SSE deliver the real state
+          const scene = get().scenes.find((s) => s.id === sceneId);
+          if (result.scene) {
+            get().updateScene(sceneId, result.scene);
+          } else if (scene) {
+            get().updateScene(sceneId, {
+              generation_status: { ...scene.generation_status, image: 'generating' },
+            });
+          }
         } catch (error) {
           const errorMessage = error instanceof Error ? error.message : 'Failed to generate image';
           set({
@@ -402,14 +410,21 @@ export const useSceneStore = create<SceneState>((set, get) => ({
           if (!storyboard) {
             throw new Error('No storyboard loaded');
           }
-          const updatedScene = await retryOperation(
+          const result = await retryOperation(
             () => storyboardAPI.regenerateSceneImage(storyboard.storyboard_id, sceneId),
             {
               maxRetries: 2,
               operationName: 'Regenerate Scene Image',
             }
           );
-          get().updateScene(sceneId, updatedScene);
+          // Placeholder applied synchronously; otherwise the request is accepted (202),
+          // so show generating optimistically and let SSE deliver the real state
+          get().updateScene(sceneId, result.scene ?? {
+            image_url: null,
+            video_url: null,
+            state: 'image',
+            generation_status: { image: 'generating', video: 'pending' },
+          });
         } catch (error) {
           const errorMessage = error instanceof Error ? error.message : 'Failed to regenerate image';
           set({
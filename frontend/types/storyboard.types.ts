@@ -135,6 +135,17 @@ export interface SceneVideoGenerateResponse {
   message?: string | null;
 }
 
+/**
+ * Response from an accepted (queued) image/video generation request.
+ * Scene state changes are delivered via SSE.
+ */
+export interface SceneGenerationAcceptedResponse {
+  success: boolean;
+  scene_id?: string;
+  scene?: StoryboardScene | null; // Set when a placeholder was applied synchronously (Replicate not configured)
+  message?: string | null;
+}
+
 /**
  * Scene status response
  */